@@ -0,0 +1,64 @@
+"""
+Benchmark: cold import time of the package's entry points, against a budget.
+
+Runs ``python -X importtime -c "import <module>"`` in fresh interpreters and
+reports the best cumulative import time of each module.  Exits with status 1
+if a module with a budget goes over it, so it can guard cold start in CI.
+
+    uv run python benchmarks/bench_import_time.py [--runs N] [--scale X]
+"""
+
+import argparse
+import subprocess
+import sys
+
+# (module, budget in ms or None to only report)
+_TARGETS = (
+    ("smalltalk_validator_mcp_server", 25),
+    ("smalltalk_validator_mcp_server.core", 150),
+    ("smalltalk_validator_mcp_server.linter", 100),
+    ("smalltalk_validator_mcp_server.server", None),
+)
+
+
+def import_time_us(module: str) -> int:
+    """Return the cumulative import time of *module* in a fresh interpreter."""
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    for line in completed.stderr.splitlines():
+        # "import time: self [us] | cumulative | imported package"
+        parts = line.split("|")
+        if len(parts) == 3 and parts[2].strip() == module:
+            return int(parts[1])
+    raise RuntimeError(f"{module} not found in -X importtime output")
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description=__doc__)
+    arg_parser.add_argument("--runs", type=int, default=5)
+    arg_parser.add_argument(
+        "--scale", type=float, default=1.0, help="multiply budgets (slow machines)"
+    )
+    args = arg_parser.parse_args()
+
+    over_budget = False
+    for module, budget in _TARGETS:
+        best_ms = min(import_time_us(module) for _ in range(args.runs)) / 1000
+        if budget is None:
+            verdict = ""
+        else:
+            limit = budget * args.scale
+            ok = best_ms <= limit
+            over_budget = over_budget or not ok
+            verdict = f"(budget {limit:.0f} ms) {'ok' if ok else 'OVER'}"
+        print(f"  {module:<42}{best_ms:9.1f} ms  {verdict}")
+
+    sys.exit(1 if over_budget else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+"""
+Benchmark: lint time per KiB on adversarial method bodies.
+
+Feeds generated bodies meant to trip up text-based checks (deeply nested or
+unbalanced brackets, brackets inside literals, long cascades, random token
+soup) through the linter and reports parsing and the lint checks
+separately.  For reference it also times the regex that the nil-safe
+branching check used before it moved to the CST, on the same text.
+
+    uv run python benchmarks/bench_lint_adversarial.py [--sizes N,N,...] [--seed N]
+"""
+
+import argparse
+import random
+import re
+import time
+
+from smalltalk_validator_mcp_server.linter import MethodIssueCache, TonelCSTLinter
+from smalltalk_validator_mcp_server.parser import _PARSER_POOL
+
+_HEADER = (
+    "Class {\n"
+    "\t#name : #BenchClass,\n"
+    "\t#superclass : #Object,\n"
+    "\t#instVars : [ 'items' ],\n"
+    "\t#category : #'Bench-Corpus'\n"
+    "}\n\n"
+    "{ #category : #private }\n"
+    "BenchClass >> adversarial [\n"
+)
+
+_BLOCK_PAT = r"\[[^\[\]]*(?:\[[^\[\]]*\][^\[\]]*)*\]"
+_OLD_NIL_COMBINED_RE = re.compile(
+    rf"(?:\bisNil|\bnotNil)\s+ifTrue:\s*{_BLOCK_PAT}\s*ifFalse:"
+    rf"|(?:\bisNil|\bnotNil)\s+ifFalse:\s*{_BLOCK_PAT}\s*ifTrue:",
+    re.DOTALL,
+)
+
+_SOUP_TOKENS = (
+    "[", "]", "(", ")", "x", "items", "isNil", "notNil", "isEmpty", "ifTrue:",
+    "ifFalse:", "at:", "1", "size", ";", ".", "^", ":=", "|", ":each", "#sym",
+    "'str'", '"note"', "BenchClass", "isKindOf:",
+)  # fmt: skip
+
+
+def _nested_blocks(n: int, rng: random.Random) -> str:
+    return "\titems isNil ifTrue: " + "[ " * n + "items" + " ]" * n + " ifFalse: [ 1 ]"
+
+
+def _brackets_in_literals(n: int, rng: random.Random) -> str:
+    return f"\t^ items isNil ifTrue: [ '{'[' * n}' ] ifFalse: [ \"{']' * n}\" items ]"
+
+
+def _many_branches(n: int, rng: random.Random) -> str:
+    return "".join(
+        f"\titems isNil ifTrue: [ {i} ] ifFalse: [ items at: 1 ].\n" for i in range(n)
+    )
+
+
+def _long_cascade(n: int, rng: random.Random) -> str:
+    return "\titems " + "; ".join(f"at: {i % 7} put: {i}" for i in range(n))
+
+
+def _unbalanced_brackets(n: int, rng: random.Random) -> str:
+    return "\titems isNil ifTrue: [ items " + "[ 1 ] " * n
+
+
+def _token_soup(n: int, rng: random.Random) -> str:
+    return "\t" + " ".join(rng.choice(_SOUP_TOKENS) for _ in range(n))
+
+
+GENERATORS = {
+    "nested blocks": _nested_blocks,
+    "brackets in literals": _brackets_in_literals,
+    "many branches": _many_branches,
+    "long cascade": _long_cascade,
+    "unbalanced brackets": _unbalanced_brackets,
+    "token soup": _token_soup,
+}
+
+
+def adversarial_source(body: str) -> str:
+    return f"{_HEADER}{body}\n]\n"
+
+
+def time_lint(source: str) -> tuple[float, float]:
+    """Return (parse seconds, lint check seconds) for *source*."""
+    start = time.perf_counter()
+    tree = _PARSER_POOL.parse(source.encode("utf-8"))
+    parse_s = time.perf_counter() - start
+    linter = TonelCSTLinter()
+    # Measure the checks, not method-cache hits on repeated bodies.
+    linter.method_cache = MethodIssueCache(max_entries=0)
+    start = time.perf_counter()
+    linter.lint_tree(tree)
+    return parse_s, time.perf_counter() - start
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description=__doc__)
+    arg_parser.add_argument("--sizes", default="250,1000,4000")
+    arg_parser.add_argument("--seed", type=int, default=0)
+    args = arg_parser.parse_args()
+    sizes = [int(size) for size in args.sizes.split(",")]
+
+    print(
+        f"{'generator':<22}{'n':>6}{'KiB':>8}{'parse ms':>11}"
+        f"{'checks ms':>11}{'us/KiB':>9}{'old re ms':>11}"
+    )
+    for name, generate in GENERATORS.items():
+        for n in sizes:
+            body = generate(n, random.Random(args.seed))
+            source = adversarial_source(body)
+            kib = len(source.encode("utf-8")) / 1024
+            parse_s, checks_s = time_lint(source)
+            start = time.perf_counter()
+            _OLD_NIL_COMBINED_RE.search(body)
+            old_s = time.perf_counter() - start
+            print(
+                f"{name:<22}{n:>6}{kib:>8.1f}{parse_s * 1000:>11.2f}"
+                f"{checks_s * 1000:>11.2f}{checks_s / kib * 1e6:>9.1f}"
+                f"{old_s * 1000:>11.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
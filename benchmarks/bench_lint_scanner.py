@@ -0,0 +1,112 @@
+"""
+Benchmark: per-method text scanning done by the linter over a large method corpus.
+
+Compares the previous path (four ``re.sub`` passes to sanitize the body, a
+regex compiled per method for the own-class reference check, and a separate
+search for capitalized identifiers) against the single-pass body scanner.
+
+    uv run python benchmarks/bench_lint_scanner.py [--methods N] [--repeat N]
+"""
+
+import argparse
+import re
+import time
+
+from smalltalk_validator_mcp_server.linter import (
+    _CAPITALIZED_NAME_RE,
+    TonelCSTLinter,
+    _scan_body,
+)
+
+_CLASS_NAME = "BenchClass"
+
+_BODIES = (
+    '\t"Answer the {m}th item, or a default"\n'
+    "\t| result |\n"
+    "\tresult := items detect: [ :each | each key = #item{m} ] ifNone: [ nil ].\n"
+    "\tresult isNil ifTrue: [ ^ Dictionary new at: 'missing {m}' put: 0; yourself ].\n"
+    "\t^ result value",
+    "\t^ BenchClass new\n"
+    "\t\tname: 'bench {m}';\n"
+    "\t\titems: (OrderedCollection with: {m} with: #'sym {m}');\n"
+    "\t\tyourself",
+    "\t| sum |\n"
+    "\tsum := 0.\n"
+    "\titems do: [ :each | sum := sum + (each * {m}) ].\n"
+    "\t^ sum",
+)
+
+
+def _legacy_scan(body: str, class_name: str) -> tuple[bool, set[str]]:
+    """The previous per-method path, kept here for comparison."""
+    sanitized = re.sub(r'"[^"\n]*"', "", body)
+    sanitized = re.sub(r"'(?:''|[^'])*'", "''", sanitized)
+    sanitized = re.sub(r"#'(?:''|[^'])*'", "#''", sanitized)
+    sanitized = re.sub(r"#[A-Za-z_][A-Za-z0-9_]*", "#", sanitized)
+    self_reference = re.search(rf"\b{re.escape(class_name)}\b", sanitized) is not None
+    names = {
+        match.group(0) for match in re.finditer(r"\b[A-Z][A-Za-z0-9_]*\b", sanitized)
+    }
+    return self_reference, names
+
+
+def _scan(body: str, class_name: str) -> tuple[bool, set[str]]:
+    assert _CAPITALIZED_NAME_RE.fullmatch(class_name)
+    names = _scan_body(body)
+    return class_name in names, set(names)
+
+
+def _make_class(methods: int) -> str:
+    parts = [
+        "Class {\n"
+        f"\t#name : #{_CLASS_NAME},\n"
+        "\t#superclass : #Object,\n"
+        "\t#instVars : [ 'items', 'name' ],\n"
+        "\t#category : #'Bench-Corpus'\n"
+        "}\n"
+    ]
+    for m in range(methods):
+        body = _BODIES[m % len(_BODIES)].format(m=m)
+        parts.append(
+            f"\n{{ #category : #private }}\n{_CLASS_NAME} >> method{m} [\n{body}\n]\n"
+        )
+    return "".join(parts)
+
+
+def _time(scan, bodies: list[str], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for body in bodies:
+            scan(body, _CLASS_NAME)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description=__doc__)
+    arg_parser.add_argument("--methods", type=int, default=20000)
+    arg_parser.add_argument("--repeat", type=int, default=3)
+    args = arg_parser.parse_args()
+
+    bodies = [_BODIES[m % len(_BODIES)].format(m=m) for m in range(args.methods)]
+    for body in bodies:
+        assert _legacy_scan(body, _CLASS_NAME) == _scan(body, _CLASS_NAME)
+
+    legacy_s = _time(_legacy_scan, bodies, args.repeat)
+    scan_s = _time(_scan, bodies, args.repeat)
+
+    source = _make_class(args.methods)
+    start = time.perf_counter()
+    TonelCSTLinter().lint(source)
+    lint_s = time.perf_counter() - start
+
+    total_kb = sum(len(body) for body in bodies) / 1024
+    print(f"Corpus: {args.methods} method bodies, {total_kb:.0f} KiB")
+    print(f"  previous regex passes       {legacy_s * 1000:9.2f} ms")
+    print(f"  single-pass scanner         {scan_s * 1000:9.2f} ms")
+    print(f"  end-to-end lint (new)       {lint_s * 1000:9.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+"""
+Micro-benchmark: per-call parser overhead with and without the parser pool.
+
+Compares constructing a fresh tree-sitter Parser for every call (the old
+behaviour of the tool paths) against parsing through the shared pool.
+
+    uv run python benchmarks/bench_parser_pool.py [--iterations N]
+"""
+
+import argparse
+import timeit
+from pathlib import Path
+
+from smalltalk_validator_mcp_server.parser import _make_parser, parser_pool
+
+_SMALL_SOURCE = b"Class { #name : #BenchClass }\n\nBenchClass >> foo [\n  ^ 42\n]\n"
+_FIXTURE = Path(__file__).parent.parent / "tests" / "fixtures" / "valid_class.st"
+
+
+def _bench(label: str, source: bytes, iterations: int) -> None:
+    pool = parser_pool()
+    pool.parse(source)  # lease this thread's parser up front
+
+    fresh = timeit.timeit(lambda: _make_parser().parse(source), number=iterations)
+    pooled = timeit.timeit(lambda: pool.parse(source), number=iterations)
+
+    fresh_us = fresh / iterations * 1e6
+    pooled_us = pooled / iterations * 1e6
+    print(label)
+    print(f"  new Parser per call   {fresh_us:9.2f} us/call")
+    print(f"  pooled parser         {pooled_us:9.2f} us/call")
+    print(f"  saved per call        {fresh_us - pooled_us:9.2f} us")
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description=__doc__)
+    arg_parser.add_argument("--iterations", type=int, default=20000)
+    args = arg_parser.parse_args()
+
+    _bench("Small method (method-body tool path)", _SMALL_SOURCE, args.iterations)
+    _bench("Fixture class file", _FIXTURE.read_bytes(), args.iterations)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""
+Benchmark: error collection over a corpus of large, syntactically valid Tonel files.
+
+Compares visiting every CST node looking for ERROR/MISSING (the previous
+behaviour) against the has_error fast path used by TonelTreeSitterParser.
+
+    uv run python benchmarks/bench_validate_clean.py [--files N] [--methods N]
+"""
+
+import argparse
+import time
+
+from smalltalk_validator_mcp_server.parser import (
+    _PARSER_POOL,
+    TonelTreeSitterParser,
+    _collect_errors,
+    _walk,
+)
+
+
+def _make_class(index: int, methods: int) -> str:
+    parts = [
+        "Class {\n"
+        f"\t#name : #BenchClass{index},\n"
+        "\t#superclass : #Object,\n"
+        "\t#instVars : [ 'items', 'count' ],\n"
+        "\t#category : #'Bench-Corpus'\n"
+        "}\n"
+    ]
+    for m in range(methods):
+        parts.append(
+            "\n{ #category : #accessing }\n"
+            f"BenchClass{index} >> method{m}: anObject [\n"
+            '\t"Generated method body"\n'
+            "\t| result |\n"
+            f"\tresult := items collect: [ :each | each + {m} ].\n"
+            "\tresult isEmpty ifTrue: [ ^ nil ].\n"
+            "\tcount := count + 1.\n"
+            "\t^ result inject: 0 into: [ :a :b | a + (b * anObject) ]\n"
+            "]\n"
+        )
+    return "".join(parts)
+
+
+def _full_walk_errors(root) -> list:
+    return [node for node, _ in _walk(root) if node.type in ("ERROR", "MISSING")]
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description=__doc__)
+    arg_parser.add_argument("--files", type=int, default=20)
+    arg_parser.add_argument("--methods", type=int, default=400)
+    args = arg_parser.parse_args()
+
+    corpus = [_make_class(i, args.methods).encode("utf-8") for i in range(args.files)]
+    total_kb = sum(len(source) for source in corpus) / 1024
+    trees = [_PARSER_POOL.parse(source) for source in corpus]
+    assert not any(tree.root_node.has_error for tree in trees)
+
+    start = time.perf_counter()
+    for source in corpus:
+        _PARSER_POOL.parse(source)
+    parse_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for tree in trees:
+        _full_walk_errors(tree.root_node)
+    walk_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for tree in trees:
+        _collect_errors(tree.root_node)
+    fast_s = time.perf_counter() - start
+
+    validator = TonelTreeSitterParser()
+    texts = [source.decode("utf-8") for source in corpus]
+    start = time.perf_counter()
+    for text in texts:
+        validator.parse(text)
+    validate_s = time.perf_counter() - start
+
+    print(f"Corpus: {args.files} files, {total_kb:.0f} KiB")
+    print(f"  parse only                  {parse_s * 1000:9.2f} ms")
+    print(f"  full CST walk for errors    {walk_s * 1000:9.2f} ms")
+    print(f"  has_error fast path         {fast_s * 1000:9.2f} ms")
+    print(f"  end-to-end validate (new)   {validate_s * 1000:9.2f} ms")
+    print(f"  end-to-end estimate (old)   {(parse_s + walk_s) * 1000:9.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -7,6 +7,14 @@ A Model Context Protocol (MCP) server for validating Tonel formatted Smalltalk s
 __version__ = "0.1.0"
 __author__ = "Smalltalk Validator MCP Server"
 
-from .server import app
-
 __all__ = ["app"]
+
+
+def __getattr__(name: str):
+    # The MCP app (and fastmcp with it) is only imported when asked for, so
+    # library users of the core, parser and linter modules do not pay for it.
+    if name == "app":
+        from .server import app
+
+        return app
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -2,7 +2,7 @@
 Entry point for running the Smalltalk Validator MCP Server.
 """
 
-from .server import app
+from .server import main
 
 if __name__ == "__main__":
-    app.run()
+    main()
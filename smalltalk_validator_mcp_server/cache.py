@@ -0,0 +1,127 @@
+"""
+In-process result cache for the content-based validation and lint tools.
+"""
+
+import copy
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from typing import Any
+
+# Default byte budget for cached result dicts; 0 disables the cache.
+_DEFAULT_MAX_BYTES = 16 * 1024 * 1024
+_MAX_BYTES_ENV = "SMALLTALK_VALIDATOR_CACHE_MAX_BYTES"
+
+
+def _default_max_bytes() -> int:
+    value = os.environ.get(_MAX_BYTES_ENV)
+    if value is None:
+        return _DEFAULT_MAX_BYTES
+    try:
+        return max(int(value), 0)
+    except ValueError:
+        return _DEFAULT_MAX_BYTES
+
+
+class ResultCache:
+    """LRU cache of tool result dicts keyed by a hash of content, mode and options.
+
+    Entries are evicted least-recently-used first once the estimated size of
+    the stored results exceeds ``max_bytes``.  A budget of 0 disables the
+    cache: lookups always miss and nothing is stored.
+
+    Args:
+        max_bytes: Byte budget for stored results. Defaults to the
+            SMALLTALK_VALIDATOR_CACHE_MAX_BYTES environment variable, or 16 MiB.
+    """
+
+    def __init__(self, max_bytes: int | None = None) -> None:
+        self._max_bytes = _default_max_bytes() if max_bytes is None else max_bytes
+        self._entries: OrderedDict[str, tuple[dict[str, Any], int]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._size = 0
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self._max_bytes > 0
+
+    def configure(self, max_bytes: int) -> None:
+        """Change the byte budget, evicting entries as needed (0 disables)."""
+        with self._lock:
+            self._max_bytes = max(max_bytes, 0)
+            self._evict()
+
+    @staticmethod
+    def make_key(mode: str, content: str, options: dict[str, Any] | None = None) -> str:
+        """Return a cache key for *content* validated or linted in *mode*."""
+        digest = hashlib.blake2b(
+            content.encode("utf-8", "surrogatepass"), digest_size=16
+        ).hexdigest()
+        options_part = json.dumps(options or {}, sort_keys=True, default=str)
+        return f"{mode}:{digest}:{options_part}"
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        """Return a copy of the cached result for *key*, or None on a miss."""
+        if not self.enabled:
+            return None
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            result = entry[0]
+        return copy.deepcopy(result)
+
+    def put(self, key: str, result: dict[str, Any]) -> None:
+        """Store a copy of *result* under *key*."""
+        if not self.enabled:
+            return
+        size = len(key) + len(json.dumps(result, default=str))
+        if size > self._max_bytes:
+            return
+        stored = copy.deepcopy(result)
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._size -= previous[1]
+            self._entries[key] = (stored, size)
+            self._size += size
+            self._evict()
+
+    def clear(self) -> None:
+        """Drop all entries and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "enabled": self.enabled,
+                "entries": len(self._entries),
+                "size_bytes": self._size,
+                "max_bytes": self._max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+    def _evict(self) -> None:
+        while self._entries and self._size > self._max_bytes:
+            _, (_, size) = self._entries.popitem(last=False)
+            self._size -= size
+
+
+_RESULT_CACHE = ResultCache()
+
+
+def result_cache() -> ResultCache:
+    """Return the process-wide result cache."""
+    return _RESULT_CACHE
@@ -0,0 +1,349 @@
+"""
+Command-line validator and linter for CI, without an MCP client.
+
+Results are written as NDJSON, one line per file as soon as it finishes,
+followed by a summary line, or as a SARIF log streamed the same way.  Only
+counters are kept between files, so memory stays bounded however many files
+are checked.  With ``--cache``, results for unchanged files are reused from
+the disk cache, which the ``cache`` subcommand inspects, prunes or clears.
+With ``--watch``, a directory is polled and changed files are re-checked and
+written until interrupted.
+"""
+
+import argparse
+import functools
+import json
+import os
+import sys
+import time
+from collections.abc import Callable
+from typing import Any, TextIO
+
+from smalltalk_validator_mcp_server.core import (
+    lint_tonel_smalltalk_from_file_impl,
+    validate_tonel_smalltalk_from_file_impl,
+)
+from smalltalk_validator_mcp_server.disk_cache import (
+    DiskCache,
+    configured_cache_path,
+    default_cache_path,
+    use_disk_cache,
+)
+from smalltalk_validator_mcp_server.index import (
+    update_project_index,
+)
+from smalltalk_validator_mcp_server.sarif import SarifWriter
+from smalltalk_validator_mcp_server.watch import (
+    DEFAULT_DEBOUNCE,
+    DEFAULT_INTERVAL,
+    DirectoryWatcher,
+)
+from smalltalk_validator_mcp_server.workers import (
+    default_workers,
+    iter_file_results,
+    iter_tonel_files,
+    shutdown_process_pool,
+)
+
+EXIT_OK = 0
+EXIT_FAILED = 1
+EXIT_INTERRUPTED = 130
+
+
+def _validate_options(args: argparse.Namespace) -> dict[str, Any]:
+    options: dict[str, Any] = {"without-method-body": args.without_method_body}
+    if args.max_errors is not None:
+        options["max-errors"] = args.max_errors
+    if args.max_snippet_bytes is not None:
+        options["max-snippet-bytes"] = args.max_snippet_bytes
+    return options
+
+
+def _validate_failed(result: dict[str, Any], args: argparse.Namespace) -> bool:
+    return not result["valid"]
+
+
+def _lint_failed(result: dict[str, Any], args: argparse.Namespace) -> bool:
+    if not result["success"]:
+        return True
+    if args.fail_on == "warning":
+        return result["issues_count"] > 0
+    return result["errors_count"] > 0
+
+
+def _parse_args(argv: list[str] | None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="smalltalk-validator",
+        description="Validate or lint Tonel Smalltalk files, writing NDJSON results.",
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    cache_option = argparse.ArgumentParser(add_help=False)
+    cache_option.add_argument(
+        "--cache",
+        nargs="?",
+        const=default_cache_path(),
+        default=configured_cache_path(),
+        metavar="FILE",
+        help="SQLite result cache to use (default file: %(const)s)",
+    )
+
+    common = argparse.ArgumentParser(add_help=False, parents=[cache_option])
+    common.add_argument(
+        "targets",
+        nargs="+",
+        metavar="PATH",
+        help="Tonel file, directory (searched recursively for *.st) or glob",
+    )
+    common.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=None,
+        help="worker processes (default: CPU count; 1 runs in this process)",
+    )
+    common.add_argument(
+        "--format",
+        choices=("ndjson", "sarif"),
+        default="ndjson",
+        help="NDJSON lines (default) or a SARIF 2.1.0 log",
+    )
+    common.add_argument(
+        "-o",
+        "--output",
+        default="-",
+        help="file to write results to (default: stdout)",
+    )
+    common.add_argument(
+        "--watch",
+        action="store_true",
+        help="keep polling the directory and re-check files as they change",
+    )
+    common.add_argument(
+        "--interval",
+        type=float,
+        default=DEFAULT_INTERVAL,
+        help="seconds between polls with --watch (default: %(default)s)",
+    )
+    common.add_argument(
+        "--debounce",
+        type=float,
+        default=DEFAULT_DEBOUNCE,
+        help="seconds a file must stay unchanged before it is re-checked "
+        "(default: %(default)s)",
+    )
+
+    validate = subparsers.add_parser(
+        "validate", parents=[common], help="check Tonel and method body syntax"
+    )
+    validate.add_argument(
+        "--without-method-body",
+        action="store_true",
+        help="only validate the Tonel structure",
+    )
+    validate.add_argument(
+        "--max-errors", type=int, default=None, help="errors reported per file"
+    )
+    validate.add_argument(
+        "--max-snippet-bytes",
+        type=int,
+        default=None,
+        help="bytes of source text per error",
+    )
+
+    lint = subparsers.add_parser(
+        "lint", parents=[common], help="check best practices and style"
+    )
+    lint.add_argument(
+        "--index",
+        metavar="DIR",
+        default=None,
+        help="index the classes of this project directory first and lint with "
+        "their hierarchy (the index is saved and updated incrementally)",
+    )
+    lint.add_argument(
+        "--fail-on",
+        choices=("error", "warning"),
+        default="error",
+        help="lowest issue severity that fails the run (default: error)",
+    )
+
+    cache = subparsers.add_parser(
+        "cache", parents=[cache_option], help="inspect or maintain the result cache"
+    )
+    cache.add_argument(
+        "action",
+        choices=("stats", "prune", "clear"),
+        help="show its size, drop entries of deleted files and trim it, or empty it",
+    )
+
+    args = parser.parse_args(argv)
+    if args.command == "cache":
+        args.cache = args.cache or default_cache_path()
+        return args
+    if args.jobs is not None and args.jobs < 1:
+        parser.error("--jobs must be at least 1")
+    if getattr(args, "max_errors", None) is not None and args.max_errors < 1:
+        parser.error("--max-errors must be at least 1")
+    if (
+        getattr(args, "max_snippet_bytes", None) is not None
+        and args.max_snippet_bytes < 0
+    ):
+        parser.error("--max-snippet-bytes must not be negative")
+    if getattr(args, "index", None) and not os.path.isdir(args.index):
+        parser.error("--index takes a directory")
+    if args.watch:
+        if len(args.targets) != 1 or not os.path.isdir(args.targets[0]):
+            parser.error("--watch takes a single directory")
+        if args.format != "ndjson":
+            parser.error("--watch only writes NDJSON")
+        if args.interval <= 0 or args.debounce < 0:
+            parser.error("--interval must be positive and --debounce not negative")
+    return args
+
+
+def _run_cache(args: argparse.Namespace, out: TextIO) -> int:
+    cache = DiskCache(args.cache)
+    try:
+        if args.action == "prune":
+            out.write(json.dumps(cache.prune()) + "\n")
+        elif args.action == "clear":
+            cache.clear()
+        out.write(json.dumps(cache.stats()) + "\n")
+    finally:
+        cache.close()
+    return EXIT_OK
+
+
+def _write_line(out: TextIO, record: dict[str, Any]) -> None:
+    out.write(json.dumps(record, separators=(",", ":")) + "\n")
+    out.flush()
+
+
+def _run_watch(
+    args: argparse.Namespace,
+    check: Callable[[str], dict[str, Any]],
+    failed: Callable[[dict[str, Any], argparse.Namespace], bool],
+    out: TextIO,
+) -> int:
+    """Poll the target directory until interrupted, writing every re-check.
+
+    Each poll that changed anything writes the new results, a
+    ``{"removed": path}`` line per deleted file, and a summary line with the
+    current totals of the whole directory.  A poll that fails writes an
+    ``{"error": ...}`` line and the watch goes on; files whose check failed
+    are checked again on the next poll.
+    """
+    failed_paths: set[str] = set()
+    watcher = DirectoryWatcher(
+        args.targets[0], check, interval=args.interval, debounce=args.debounce
+    )
+
+    def write(checked: list[dict[str, Any]], removed: list[str]) -> None:
+        for path in removed:
+            failed_paths.discard(path)
+            _write_line(out, {"removed": path})
+        for result in checked:
+            if failed(result, args):
+                failed_paths.add(result["file_path"])
+            else:
+                failed_paths.discard(result["file_path"])
+            _write_line(out, result)
+        summary = {
+            "command": args.command,
+            "generation": watcher.generation,
+            "files_count": len(watcher.results()),
+            "failed_files_count": len(failed_paths),
+        }
+        _write_line(out, {"summary": summary})
+
+    watcher.on_update = write
+    while True:
+        try:
+            watcher.poll()
+        except Exception as e:
+            _write_line(
+                out, {"error": f"Watch poll failed: {e}", "exception": type(e).__name__}
+            )
+        time.sleep(args.interval)
+
+
+def run(args: argparse.Namespace, out: TextIO) -> int:
+    """Run the command in *args*, writing its output to *out*; return the exit code.
+
+    ``validate`` and ``lint`` check every target file and stream the results;
+    with ``--watch`` they keep running until interrupted.
+    """
+    if args.command == "cache":
+        return _run_cache(args, out)
+    use_disk_cache(args.cache)
+
+    func: Callable[..., dict[str, Any]]
+    if args.command == "validate":
+        func, extra, failed = (
+            validate_tonel_smalltalk_from_file_impl,
+            (_validate_options(args),),
+            _validate_failed,
+        )
+    else:
+        func, extra, failed = lint_tonel_smalltalk_from_file_impl, (), _lint_failed
+        if args.index:
+            _, _, index_path = update_project_index(args.index, max_workers=args.jobs)
+            # Bound into the function so worker processes see it too.
+            func = functools.partial(func, index_path=index_path)
+
+    if args.watch:
+        return _run_watch(args, lambda path: func(path, *extra), failed, out)
+
+    start = time.perf_counter()
+    summary: dict[str, Any] = {
+        "command": args.command,
+        "files_count": 0,
+        "failed_files_count": 0,
+    }
+    if args.command == "lint":
+        summary.update(warnings_count=0, errors_count=0)
+
+    sarif = SarifWriter(out) if args.format == "sarif" else None
+    for _path, result in iter_file_results(
+        func, iter_tonel_files(args.targets), args.jobs or default_workers(), *extra
+    ):
+        summary["files_count"] += 1
+        if failed(result, args):
+            summary["failed_files_count"] += 1
+        if args.command == "lint" and result["success"]:
+            summary["warnings_count"] += result["warnings_count"]
+            summary["errors_count"] += result["errors_count"]
+        if sarif is None:
+            _write_line(out, result)
+        elif args.command == "lint":
+            sarif.add_lint_result(result)
+        else:
+            sarif.add_validation_result(result)
+
+    summary["elapsed_ms"] = round((time.perf_counter() - start) * 1000, 3)
+    if sarif is None:
+        _write_line(out, {"summary": summary})
+    else:
+        sarif.close(properties={"summary": summary})
+    return EXIT_FAILED if summary["failed_files_count"] else EXIT_OK
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Entry point for the smalltalk-validator command."""
+    args = _parse_args(argv)
+    output = getattr(args, "output", "-")
+    out = sys.stdout if output == "-" else open(output, "w", encoding="utf-8")
+    try:
+        code = run(args, out)
+    except KeyboardInterrupt:
+        code = EXIT_INTERRUPTED
+    finally:
+        shutdown_process_pool()
+        if out is not sys.stdout:
+            out.close()
+    sys.exit(code)
+
+
+if __name__ == "__main__":
+    main()
@@ -3,15 +3,112 @@ Core validation functions for Smalltalk and Tonel code.
 """
 
 import os
+import time
+from collections.abc import Callable
 from pathlib import Path
-from typing import Any
-
-from smalltalk_validator_mcp_server.linter import TonelCSTLinter
+from typing import TYPE_CHECKING, Any
+
+from smalltalk_validator_mcp_server.cache import _RESULT_CACHE
+from smalltalk_validator_mcp_server.linter import (
+    LintProgress,
+    TonelCSTLinter,
+    content_line_ranges,
+    diff_line_ranges,
+)
 from smalltalk_validator_mcp_server.parser import (
+    DEFAULT_MAX_ERRORS,
+    DEFAULT_MAX_SNIPPET_BYTES,
     SmalltalkMethodParser,
     TonelTreeSitterParser,
 )
 
+if TYPE_CHECKING:
+    from smalltalk_validator_mcp_server.session import DocumentSessionStore
+
+# The disk cache, project index, sessions, watches and worker pool are
+# imported by the functions that use them, so importing this module stays
+# cheap for callers that only validate content.
+
+# Called as progress(done, total, partial_results) by long-running operations;
+# partial_results holds the issue dicts or file results completed since the
+# previous call.
+ProgressCallback = Callable[[int, int, list[dict[str, Any]]], None]
+
+
+def _lint_progress(progress: ProgressCallback | None) -> LintProgress | None:
+    """Adapt a ProgressCallback to the linter's per-method progress hook."""
+    if progress is None:
+        return None
+
+    def forward(done: int, total: int, issues: list) -> None:
+        progress(done, total, _convert_lint_issues_to_dicts(issues))
+
+    return forward
+
+
+def _limit_option(
+    options: dict[str, Any], key: str, default: int, minimum: int
+) -> int | None:
+    """Return an integer limit option (None for no limit); raise ValueError if invalid."""
+    value = options.get(key, default)
+    if value is None:
+        return None
+    if isinstance(value, bool) or not isinstance(value, int) or value < minimum:
+        raise ValueError(f"{key} must be an integer of at least {minimum} or null")
+    return value
+
+
+def _tonel_parser(options: dict[str, Any]) -> TonelTreeSitterParser:
+    """Create a parser configured from the validation tool options."""
+    return TonelTreeSitterParser(
+        ignore_method_body_errors=options.get("without-method-body", False),
+        max_errors=_limit_option(options, "max-errors", DEFAULT_MAX_ERRORS, 1),
+        max_snippet_bytes=_limit_option(
+            options, "max-snippet-bytes", DEFAULT_MAX_SNIPPET_BYTES, 0
+        ),
+    )
+
+
+def _add_parse_errors(result: dict[str, Any], parse_result: dict[str, Any]) -> None:
+    """Copy the errors and truncated flag of a parse result into a tool result."""
+    if parse_result["errors"]:
+        result["errors"] = parse_result["errors"]
+    if parse_result.get("truncated"):
+        result["truncated"] = True
+
+
+def _point_list(point: tuple[int, int] | None) -> list[int] | None:
+    return list(point) if point is not None else None
+
+
+def _cached_file_result(
+    mode: str,
+    file_path: str,
+    options: dict[str, Any] | None,
+    check: Callable[[], dict[str, Any]],
+    succeeded: Callable[[dict[str, Any]], bool],
+) -> dict[str, Any]:
+    """Return ``check()`` for a file, through the disk cache if one is configured."""
+    from smalltalk_validator_mcp_server.disk_cache import disk_cache
+
+    cache = disk_cache()
+    if cache is None:
+        return check()
+    stat = os.stat(file_path)
+    cached = cache.get(mode, file_path, options, stat)
+    if cached is not None:
+        return cached
+    result = check()
+    if succeeded(result):
+        cache.put(mode, file_path, options, stat, result)
+    return result
+
+
+def _session_store() -> "DocumentSessionStore":
+    from smalltalk_validator_mcp_server.session import session_store
+
+    return session_store()
+
 
 def _convert_lint_issues_to_dicts(issues: list) -> list[dict[str, Any]]:
     return [
@@ -21,6 +118,9 @@ def _convert_lint_issues_to_dicts(issues: list) -> list[dict[str, Any]]:
             "class_name": issue.class_name,
             "selector": issue.selector,
             "is_class_method": issue.is_class_method,
+            "rule_id": issue.rule_id,
+            "start_point": _point_list(issue.start_point),
+            "end_point": _point_list(issue.end_point),
         }
         for issue in issues
     ]
@@ -32,10 +132,17 @@ def validate_tonel_smalltalk_from_file_impl(
     """
     Validate Tonel formatted Smalltalk source code from a file.
 
+    With a disk cache configured (SMALLTALK_VALIDATOR_DISK_CACHE), results
+    for unchanged files are reused across runs.
+
     Args:
         file_path: Path to the Tonel file to validate
         options: Optional validation options
             - without-method-body: If true, only validates tonel structure
+            - max-errors: Maximum number of errors reported (default 100,
+              null for no limit)
+            - max-snippet-bytes: Maximum bytes of source text per error
+              (default 512, null for no limit)
 
     Returns:
         Dictionary with validation results including success status and error details
@@ -49,27 +156,104 @@ def validate_tonel_smalltalk_from_file_impl(
             }
 
         options = options or {}
-        without_method_body = options.get("without-method-body", False)
+        parser_type = (
+            "tonel_only" if options.get("without-method-body", False) else "full"
+        )
+
+        def check() -> dict[str, Any]:
+            parse_result = _tonel_parser(options).parse_from_file(file_path)
+            result: dict[str, Any] = {
+                "valid": parse_result["valid"],
+                "file_path": file_path,
+                "parser_type": parser_type,
+            }
+            _add_parse_errors(result, parse_result)
+            return result
 
-        parser = TonelTreeSitterParser(ignore_method_body_errors=without_method_body)
-        parse_result = parser.parse_from_file(file_path)
+        return _cached_file_result(
+            parser_type, file_path, options, check, lambda result: True
+        )
 
-        result: dict[str, Any] = {
-            "valid": parse_result["valid"],
+    except Exception as e:
+        return {
+            "valid": False,
+            "error": f"Validation failed: {str(e)}",
             "file_path": file_path,
-            "parser_type": "tonel_only" if without_method_body else "full",
+            "exception": type(e).__name__,
         }
 
-        if parse_result["errors"]:
-            result["errors"] = parse_result["errors"]
 
-        return result
+def _validate_file_timed(
+    file_path: str, options: dict[str, Any] | None
+) -> dict[str, Any]:
+    """Validate one file and record how long it took (runs in worker processes)."""
+    start = time.perf_counter()
+    result = validate_tonel_smalltalk_from_file_impl(file_path, options)
+    result["elapsed_ms"] = round((time.perf_counter() - start) * 1000, 3)
+    return result
+
+
+def validate_tonel_directory_impl(
+    target: str,
+    options: dict[str, Any] | None = None,
+    max_workers: int | None = None,
+    progress: ProgressCallback | None = None,
+) -> dict[str, Any]:
+    """
+    Validate every Tonel file in a directory or matching a glob pattern.
+
+    Files are validated in parallel by a pool of worker processes that keep
+    their parsers warm between calls.
+
+    Args:
+        target: Directory (searched recursively for *.st files) or glob pattern
+        options: Optional validation options applied to every file
+            - without-method-body: If true, only validates tonel structure
+            - max-errors: Maximum number of errors reported (default 100,
+              null for no limit)
+            - max-snippet-bytes: Maximum bytes of source text per error
+              (default 512, null for no limit)
+        max_workers: Number of worker processes (defaults to and is capped at
+            the CPU count; 1 validates in the calling process)
+        progress: Optional callback receiving each file result as it completes
+
+    Returns:
+        Dictionary with aggregated results and per-file results with timings
+    """
+    from smalltalk_validator_mcp_server.workers import (
+        collect_tonel_files,
+        iter_file_results,
+    )
+
+    start = time.perf_counter()
+    try:
+        # Reject bad options once rather than in every file result.
+        _tonel_parser(options or {})
+        file_paths = collect_tonel_files(target)
+        results: dict[str, dict[str, Any]] = {}
+        for path, file_result in iter_file_results(
+            _validate_file_timed, file_paths, max_workers, options
+        ):
+            results[path] = file_result
+            if progress is not None:
+                progress(len(results), len(file_paths), [file_result])
+        file_results = [results[path] for path in file_paths]
+        invalid_count = sum(1 for r in file_results if not r["valid"])
+
+        return {
+            "valid": invalid_count == 0,
+            "target": target,
+            "files_count": len(file_results),
+            "invalid_files_count": invalid_count,
+            "elapsed_ms": round((time.perf_counter() - start) * 1000, 3),
+            "results": file_results,
+        }
 
     except Exception as e:
         return {
             "valid": False,
-            "error": f"Validation failed: {str(e)}",
-            "file_path": file_path,
+            "error": f"Directory validation failed: {str(e)}",
+            "target": target,
             "exception": type(e).__name__,
         }
 
@@ -80,10 +264,17 @@ def validate_tonel_smalltalk_impl(
     """
     Validate Tonel formatted Smalltalk source code from content string.
 
+    Results are cached by content hash, so resubmitting identical content
+    with the same options skips parsing.
+
     Args:
         file_content: The Tonel file content as a string
         options: Optional validation options
             - without-method-body: If true, only validates tonel structure
+            - max-errors: Maximum number of errors reported (default 100,
+              null for no limit)
+            - max-snippet-bytes: Maximum bytes of source text per error
+              (default 512, null for no limit)
 
     Returns:
         Dictionary with validation results including success status and error details
@@ -91,19 +282,25 @@ def validate_tonel_smalltalk_impl(
     try:
         options = options or {}
         without_method_body = options.get("without-method-body", False)
+        parser_type = "tonel_only" if without_method_body else "full"
 
-        parser = TonelTreeSitterParser(ignore_method_body_errors=without_method_body)
+        cache_key = _RESULT_CACHE.make_key(parser_type, file_content, options)
+        cached = _RESULT_CACHE.get(cache_key)
+        if cached is not None:
+            return cached
+
+        parser = _tonel_parser(options)
         parse_result = parser.parse(file_content)
 
         result: dict[str, Any] = {
             "valid": parse_result["valid"],
             "content_length": len(file_content),
-            "parser_type": "tonel_only" if without_method_body else "full",
+            "parser_type": parser_type,
         }
 
-        if parse_result["errors"]:
-            result["errors"] = parse_result["errors"]
+        _add_parse_errors(result, parse_result)
 
+        _RESULT_CACHE.put(cache_key, result)
         return result
 
     except Exception as e:
@@ -126,6 +323,11 @@ def validate_smalltalk_method_body_impl(method_body_content: str) -> dict[str, A
         Dictionary with validation results including success status and error details
     """
     try:
+        cache_key = _RESULT_CACHE.make_key("smalltalk_method", method_body_content)
+        cached = _RESULT_CACHE.get(cache_key)
+        if cached is not None:
+            return cached
+
         parser = SmalltalkMethodParser()
         parse_result = parser.parse(method_body_content)
 
@@ -135,9 +337,9 @@ def validate_smalltalk_method_body_impl(method_body_content: str) -> dict[str, A
             "parser_type": "smalltalk_method",
         }
 
-        if parse_result["errors"]:
-            result["errors"] = parse_result["errors"]
+        _add_parse_errors(result, parse_result)
 
+        _RESULT_CACHE.put(cache_key, result)
         return result
 
     except Exception as e:
@@ -149,12 +351,80 @@ def validate_smalltalk_method_body_impl(method_body_content: str) -> dict[str, A
         }
 
 
-def lint_tonel_smalltalk_from_file_impl(file_path: str) -> dict[str, Any]:
+def validate_smalltalk_method_bodies_impl(method_bodies: list[str]) -> dict[str, Any]:
+    """
+    Validate several Smalltalk method bodies with a single parse.
+
+    Each body gets the same result as validate_smalltalk_method_body, with
+    error positions relative to that body, plus its index in the input.
+    Bodies already in the result cache are not parsed again.
+
+    Args:
+        method_bodies: The Smalltalk method bodies to validate
+
+    Returns:
+        Dictionary with overall validity, counts and the per-body results in
+        input order
+    """
+    try:
+        results: list[dict[str, Any] | None] = []
+        misses: list[int] = []
+        for index, body in enumerate(method_bodies):
+            cached = _RESULT_CACHE.get(_RESULT_CACHE.make_key("smalltalk_method", body))
+            if cached is None:
+                misses.append(index)
+            results.append(cached)
+
+        parse_results = SmalltalkMethodParser().parse_many(
+            [method_bodies[index] for index in misses]
+        )
+        for index, parse_result in zip(misses, parse_results, strict=True):
+            body = method_bodies[index]
+            result: dict[str, Any] = {
+                "valid": parse_result["valid"],
+                "content_length": len(body),
+                "parser_type": "smalltalk_method",
+            }
+            _add_parse_errors(result, parse_result)
+            _RESULT_CACHE.put(_RESULT_CACHE.make_key("smalltalk_method", body), result)
+            results[index] = result
+
+        invalid_count = sum(1 for result in results if not result["valid"])
+        return {
+            "valid": invalid_count == 0,
+            "count": len(method_bodies),
+            "invalid_count": invalid_count,
+            "results": [
+                {"index": index, **result} for index, result in enumerate(results)
+            ],
+        }
+
+    except Exception as e:
+        return {
+            "valid": False,
+            "error": f"Method validation failed: {str(e)}",
+            "count": len(method_bodies),
+            "exception": type(e).__name__,
+        }
+
+
+def lint_tonel_smalltalk_from_file_impl(
+    file_path: str,
+    progress: ProgressCallback | None = None,
+    index_path: str | None = None,
+) -> dict[str, Any]:
     """
     Lint Tonel formatted Smalltalk source code from a file.
 
+    With a disk cache configured (SMALLTALK_VALIDATOR_DISK_CACHE), results
+    for unchanged files are reused across runs.  With a project index
+    (SMALLTALK_VALIDATOR_PROJECT_INDEX) covering the file, the checks use
+    its class hierarchy.
+
     Args:
         file_path: Path to the Tonel file to lint
+        progress: Optional callback receiving per-method progress and issues
+        index_path: Project index file to use instead of the configured one
 
     Returns:
         Dictionary with lint results including issues found
@@ -167,51 +437,172 @@ def lint_tonel_smalltalk_from_file_impl(file_path: str) -> dict[str, Any]:
                 "file_path": file_path,
             }
 
-        linter = TonelCSTLinter()
-        issues = linter.lint_from_file(Path(file_path))
+        from smalltalk_validator_mcp_server.index import project_index_for
+
+        index = project_index_for(file_path, index_path)
+
+        def check() -> dict[str, Any]:
+            lint_result = TonelCSTLinter(index=index).lint_from_file(
+                Path(file_path), progress=_lint_progress(progress)
+            )
+            issue_list = _convert_lint_issues_to_dicts(lint_result.issues)
+            return {
+                "success": True,
+                "file_path": file_path,
+                "issue_list": issue_list,
+                "warnings_count": lint_result.warnings,
+                "errors_count": lint_result.errors,
+                "issues_count": len(issue_list),
+            }
 
-        issue_list = _convert_lint_issues_to_dicts(issues)
+        return _cached_file_result(
+            "lint",
+            file_path,
+            {"index": index.fingerprint} if index is not None else None,
+            check,
+            # Read failures are reported as issues; retry those next time.
+            lambda result: (
+                not any(
+                    issue["rule_id"] == "read-error" for issue in result["issue_list"]
+                )
+            ),
+        )
 
+    except Exception as e:
         return {
-            "success": True,
+            "success": False,
+            "error": f"Linting failed: {str(e)}",
             "file_path": file_path,
-            "issue_list": issue_list,
-            "warnings_count": linter.warnings,
-            "errors_count": linter.errors,
-            "issues_count": len(issue_list),
+            "exception": type(e).__name__,
         }
 
+
+def index_tonel_project_impl(
+    directory: str, max_workers: int | None = None
+) -> dict[str, Any]:
+    """
+    Build or update the project index of a directory.
+
+    The index (classes, superclasses, variables and selectors of every
+    Tonel file) is saved under the user cache directory and updated
+    incrementally on later calls: only new and changed files are parsed,
+    in parallel worker processes.  File lints given the returned
+    ``index_path`` see inherited instance variables and project classes.
+
+    Args:
+        directory: Directory searched recursively for *.st files
+        max_workers: Number of worker processes (defaults to and is capped at
+            the CPU count; 1 indexes in the calling process)
+
+    Returns:
+        Dictionary with file and class counts and the index file path
+    """
+    try:
+        from smalltalk_validator_mcp_server.index import update_project_index
+
+        if not os.path.isdir(directory):
+            raise ValueError(f"Not a directory: {directory}")
+        index, counts, path = update_project_index(directory, max_workers=max_workers)
+        return {"success": True, **index.stats(), **counts, "index_path": path}
+
     except Exception as e:
         return {
             "success": False,
-            "error": f"Linting failed: {str(e)}",
-            "file_path": file_path,
+            "error": f"Indexing failed: {str(e)}",
+            "directory": directory,
             "exception": type(e).__name__,
         }
 
 
-def lint_tonel_smalltalk_impl(file_content: str) -> dict[str, Any]:
+def lint_tonel_smalltalk_impl(
+    file_content: str, progress: ProgressCallback | None = None
+) -> dict[str, Any]:
     """
     Lint Tonel formatted Smalltalk source code from content string.
 
     Args:
         file_content: The Tonel file content as a string
+        progress: Optional callback receiving per-method progress and issues
 
     Returns:
         Dictionary with lint results including issues found
     """
     try:
-        linter = TonelCSTLinter()
-        issues = linter.lint(file_content)
+        cache_key = _RESULT_CACHE.make_key("lint", file_content)
+        cached = _RESULT_CACHE.get(cache_key)
+        if cached is not None:
+            return cached
+
+        lint_result = TonelCSTLinter().lint(
+            file_content, progress=_lint_progress(progress)
+        )
+
+        issue_list = _convert_lint_issues_to_dicts(lint_result.issues)
+
+        result = {
+            "success": True,
+            "content_length": len(file_content),
+            "issue_list": issue_list,
+            "warnings_count": lint_result.warnings,
+            "errors_count": lint_result.errors,
+            "issues_count": len(issue_list),
+        }
+        _RESULT_CACHE.put(cache_key, result)
+        return result
+
+    except Exception as e:
+        return {
+            "success": False,
+            "error": f"Linting failed: {str(e)}",
+            "content_length": len(file_content),
+            "exception": type(e).__name__,
+        }
+
+
+def lint_tonel_smalltalk_changes_impl(
+    file_content: str,
+    diff: str | None = None,
+    old_content: str | None = None,
+    progress: ProgressCallback | None = None,
+) -> dict[str, Any]:
+    """
+    Lint only the methods of Tonel content touched by a change.
+
+    The change is given as a unified diff producing *file_content*, or as
+    the previous content.  Methods overlapping a changed line are linted;
+    a change to the class definition or comment lints the whole file.
+
+    Args:
+        file_content: The new Tonel file content as a string
+        diff: Unified diff of this file whose result is file_content
+        old_content: The previous content, used when no diff is given
+        progress: Optional callback receiving per-method progress and issues
+
+    Returns:
+        Dictionary with lint results for the changed methods and the changed
+        line ranges (0-based, end exclusive)
+    """
+    try:
+        if diff is not None:
+            changed = diff_line_ranges(diff)
+        elif old_content is not None:
+            changed = content_line_ranges(old_content, file_content)
+        else:
+            raise ValueError("Either diff or old_content is required")
 
-        issue_list = _convert_lint_issues_to_dicts(issues)
+        lint_result = TonelCSTLinter().lint(
+            file_content, progress=_lint_progress(progress), changed=changed
+        )
+
+        issue_list = _convert_lint_issues_to_dicts(lint_result.issues)
 
         return {
             "success": True,
             "content_length": len(file_content),
+            "changed_ranges": [list(line_range) for line_range in changed],
             "issue_list": issue_list,
-            "warnings_count": linter.warnings,
-            "errors_count": linter.errors,
+            "warnings_count": lint_result.warnings,
+            "errors_count": lint_result.errors,
             "issues_count": len(issue_list),
         }
 
@@ -222,3 +613,332 @@ def lint_tonel_smalltalk_impl(file_content: str) -> dict[str, Any]:
             "content_length": len(file_content),
             "exception": type(e).__name__,
         }
+
+
+def open_tonel_session_impl(file_content: str) -> dict[str, Any]:
+    """
+    Open a document session holding parsed Tonel content for incremental edits.
+
+    Args:
+        file_content: The initial Tonel file content as a string
+
+    Returns:
+        Dictionary with the new session id
+    """
+    try:
+        session = _session_store().open(file_content)
+        return {
+            "success": True,
+            "session_id": session.session_id,
+            "content_length": len(file_content),
+        }
+
+    except Exception as e:
+        return {
+            "success": False,
+            "error": f"Opening session failed: {str(e)}",
+            "content_length": len(file_content),
+            "exception": type(e).__name__,
+        }
+
+
+def edit_tonel_session_impl(
+    session_id: str, edits: list[dict[str, Any]]
+) -> dict[str, Any]:
+    """
+    Apply range edits to a document session and incrementally re-parse it.
+
+    Args:
+        session_id: Id returned by open_tonel_session_impl
+        edits: Edits applied in order, each relative to the previous result
+            - start: [line, character] (0-based) where the replaced range starts
+            - end: [line, character] (0-based) where the replaced range ends
+            - text: Replacement text
+
+    Returns:
+        Dictionary with the new content length and the changed ranges
+    """
+    try:
+        session = _session_store().get(session_id)
+    except KeyError:
+        return {
+            "success": False,
+            "error": f"Unknown or expired session: {session_id}",
+            "session_id": session_id,
+        }
+
+    try:
+        with session.lock:
+            changed_ranges = session.apply_edits(edits)
+            content_length = session.content_length
+        _session_store().enforce_limits(keep=session_id)
+
+        return {
+            "success": True,
+            "session_id": session_id,
+            "content_length": content_length,
+            "changed_ranges": changed_ranges,
+        }
+
+    except Exception as e:
+        return {
+            "success": False,
+            "error": f"Editing session failed: {str(e)}",
+            "session_id": session_id,
+            "exception": type(e).__name__,
+        }
+
+
+def validate_tonel_session_impl(
+    session_id: str, options: dict[str, Any] | None = None
+) -> dict[str, Any]:
+    """
+    Validate the current content of a document session.
+
+    Args:
+        session_id: Id returned by open_tonel_session_impl
+        options: Optional validation options
+            - without-method-body: If true, only validates tonel structure
+            - max-errors: Maximum number of errors reported (default 100,
+              null for no limit)
+            - max-snippet-bytes: Maximum bytes of source text per error
+              (default 512, null for no limit)
+
+    Returns:
+        Dictionary with validation results including success status and error details
+    """
+    try:
+        session = _session_store().get(session_id)
+    except KeyError:
+        return {
+            "valid": False,
+            "error": f"Unknown or expired session: {session_id}",
+            "session_id": session_id,
+        }
+
+    try:
+        options = options or {}
+        without_method_body = options.get("without-method-body", False)
+
+        parser = _tonel_parser(options)
+        with session.lock:
+            parse_result = parser.validate_tree(session.tree)
+
+        result: dict[str, Any] = {
+            "valid": parse_result["valid"],
+            "session_id": session_id,
+            "parser_type": "tonel_only" if without_method_body else "full",
+        }
+
+        _add_parse_errors(result, parse_result)
+
+        return result
+
+    except Exception as e:
+        return {
+            "valid": False,
+            "error": f"Validation failed: {str(e)}",
+            "session_id": session_id,
+            "exception": type(e).__name__,
+        }
+
+
+def lint_tonel_session_impl(session_id: str) -> dict[str, Any]:
+    """
+    Lint the current content of a document session.
+
+    Args:
+        session_id: Id returned by open_tonel_session_impl
+
+    Returns:
+        Dictionary with lint results including issues found
+    """
+    try:
+        session = _session_store().get(session_id)
+    except KeyError:
+        return {
+            "success": False,
+            "error": f"Unknown or expired session: {session_id}",
+            "session_id": session_id,
+        }
+
+    try:
+        with session.lock:
+            lint_result = TonelCSTLinter().lint_tree(session.tree)
+
+        issue_list = _convert_lint_issues_to_dicts(lint_result.issues)
+
+        return {
+            "success": True,
+            "session_id": session_id,
+            "issue_list": issue_list,
+            "warnings_count": lint_result.warnings,
+            "errors_count": lint_result.errors,
+            "issues_count": len(issue_list),
+        }
+
+    except Exception as e:
+        return {
+            "success": False,
+            "error": f"Linting failed: {str(e)}",
+            "session_id": session_id,
+            "exception": type(e).__name__,
+        }
+
+
+def close_tonel_session_impl(session_id: str) -> dict[str, Any]:
+    """
+    Close a document session and release its parsed tree.
+
+    Args:
+        session_id: Id returned by open_tonel_session_impl
+
+    Returns:
+        Dictionary with success status (false if the session was unknown)
+    """
+    closed = _session_store().close(session_id)
+    result: dict[str, Any] = {"success": closed, "session_id": session_id}
+    if not closed:
+        result["error"] = f"Unknown or expired session: {session_id}"
+    return result
+
+
+def check_tonel_file(
+    file_path: str, options: dict[str, Any] | None = None
+) -> dict[str, Any]:
+    """
+    Validate and lint one Tonel file; used by directory watches.
+
+    Returns:
+        Dictionary with the file path, its validity, and the validation and
+        lint results
+    """
+    validation = validate_tonel_smalltalk_from_file_impl(file_path, options)
+    lint = lint_tonel_smalltalk_from_file_impl(file_path)
+    return {
+        "file_path": file_path,
+        "valid": validation["valid"],
+        "issues_count": lint.get("issues_count", 0),
+        "validation": validation,
+        "lint": lint,
+    }
+
+
+def start_tonel_watch_impl(
+    directory: str,
+    options: dict[str, Any] | None = None,
+    interval: float | None = None,
+    debounce: float | None = None,
+    on_update: Callable[[str], None] | None = None,
+) -> dict[str, Any]:
+    """
+    Start watching a directory, re-checking *.st files as they change.
+
+    Files are found by polling their stats every *interval* seconds; a
+    changed file is validated and linted again once it has not changed for
+    *debounce* seconds.  Every file is checked when the watch starts.
+
+    Args:
+        directory: Directory searched recursively for *.st files
+        options: Optional validation options applied to every file
+        interval: Seconds between polls (default 1)
+        debounce: Seconds a file must stay unchanged before it is re-checked
+            (default 0.5)
+        on_update: Optional callback receiving the watch id after each poll
+            that changed the diagnostics
+
+    Returns:
+        Dictionary with the new watch id
+    """
+    from smalltalk_validator_mcp_server.watch import (
+        DEFAULT_DEBOUNCE,
+        DEFAULT_INTERVAL,
+        DirectoryWatcher,
+        watch_store,
+    )
+
+    interval = DEFAULT_INTERVAL if interval is None else interval
+    debounce = DEFAULT_DEBOUNCE if debounce is None else debounce
+    try:
+        if interval <= 0 or debounce < 0:
+            raise ValueError("interval must be positive and debounce not negative")
+        watcher = DirectoryWatcher(
+            directory,
+            lambda path: check_tonel_file(path, options),
+            interval=interval,
+            debounce=debounce,
+        )
+        if on_update is not None:
+            watch_id = watcher.watch_id
+
+            def notify(checked: list, removed: list) -> None:
+                on_update(watch_id)
+
+            watcher.on_update = notify
+        watch_store().start(watcher)
+        return {
+            "success": True,
+            "watch_id": watcher.watch_id,
+            "directory": directory,
+            "interval": interval,
+            "debounce": debounce,
+        }
+
+    except Exception as e:
+        return {
+            "success": False,
+            "error": f"Starting watch failed: {str(e)}",
+            "directory": directory,
+            "exception": type(e).__name__,
+        }
+
+
+def tonel_watch_diagnostics_impl(watch_id: str) -> dict[str, Any]:
+    """
+    Return the current diagnostics of a directory watch.
+
+    Args:
+        watch_id: Id returned by start_tonel_watch_impl
+
+    Returns:
+        Dictionary with aggregated counts and the latest result of every file
+    """
+    from smalltalk_validator_mcp_server.watch import watch_store
+
+    try:
+        watcher = watch_store().get(watch_id)
+    except KeyError:
+        return {
+            "success": False,
+            "error": f"Unknown or stopped watch: {watch_id}",
+            "watch_id": watch_id,
+        }
+
+    snapshot = watcher.snapshot()
+    results = snapshot["results"]
+    return {
+        "success": True,
+        **snapshot,
+        "files_count": len(results),
+        "invalid_files_count": sum(1 for r in results if not r["valid"]),
+        "issues_count": sum(r["issues_count"] for r in results),
+    }
+
+
+def stop_tonel_watch_impl(watch_id: str) -> dict[str, Any]:
+    """
+    Stop a directory watch and drop its diagnostics.
+
+    Args:
+        watch_id: Id returned by start_tonel_watch_impl
+
+    Returns:
+        Dictionary with success status (false if the watch was unknown)
+    """
+    from smalltalk_validator_mcp_server.watch import watch_store
+
+    stopped = watch_store().stop(watch_id)
+    result: dict[str, Any] = {"success": stopped, "watch_id": watch_id}
+    if not stopped:
+        result["error"] = f"Unknown or stopped watch: {watch_id}"
+    return result
@@ -0,0 +1,350 @@
+"""
+Persistent SQLite cache of file validation and lint results.
+
+Opt-in: set SMALLTALK_VALIDATOR_DISK_CACHE to the path of the cache file (the
+CLI's ``--cache`` option does this).  Entries are keyed by file path, mode and
+options, and hold the file's mtime, size and content hash along with the
+result, so an unchanged file costs a ``stat`` and one lookup.  A file whose
+mtime changed but whose content did not is hashed once and its entry kept.
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from smalltalk_validator_mcp_server.linter import TonelCSTLinter
+
+if TYPE_CHECKING:
+    import sqlite3
+
+_PATH_ENV = "SMALLTALK_VALIDATOR_DISK_CACHE"
+_MAX_BYTES_ENV = "SMALLTALK_VALIDATOR_DISK_CACHE_MAX_BYTES"
+_DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+# Pruning keeps this fraction of the budget, so it does not run on every put.
+_PRUNE_TARGET = 0.9
+# Puts between size checks, per process.
+_PRUNE_EVERY = 64
+# Access times are only refreshed when older than this, so hits stay reads.
+_ACCESS_RESOLUTION_SECONDS = 3600.0
+_BUSY_TIMEOUT_MS = 10_000
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS results (
+    mode TEXT NOT NULL,
+    path TEXT NOT NULL,
+    options TEXT NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    digest TEXT NOT NULL,
+    result TEXT NOT NULL,
+    bytes INTEGER NOT NULL,
+    accessed REAL NOT NULL,
+    PRIMARY KEY (mode, path, options)
+);
+CREATE INDEX IF NOT EXISTS results_accessed ON results (accessed);
+"""
+
+
+def default_cache_path() -> str:
+    """Return the per-user cache file used when no path is given."""
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+        os.path.expanduser("~"), ".cache"
+    )
+    return os.path.join(base, "smalltalk-validator", "results.sqlite3")
+
+
+def _default_max_bytes() -> int:
+    try:
+        return max(int(os.environ[_MAX_BYTES_ENV]), 0)
+    except (KeyError, ValueError):
+        return _DEFAULT_MAX_BYTES
+
+
+def _package_version(name: str) -> str:
+    from importlib.metadata import PackageNotFoundError, version
+
+    try:
+        return version(name)
+    except PackageNotFoundError:
+        return "unknown"
+
+
+def cache_fingerprint() -> str:
+    """Identify the tool version and checks whose results the cache holds.
+
+    Entries written under another fingerprint are dropped when the cache is
+    opened.
+    """
+    rules = ",".join(rule.rule_id for rule in TonelCSTLinter.method_rules)
+    return "|".join(
+        (
+            _package_version("smalltalk-validator-mcp-server"),
+            _package_version("tree-sitter-tonel-smalltalk"),
+            rules,
+        )
+    )
+
+
+def _file_digest(path: str) -> str:
+    digest = hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _options_key(options: dict[str, Any] | None) -> str:
+    return json.dumps(options or {}, sort_keys=True, default=str)
+
+
+class DiskCache:
+    """Result cache stored in one SQLite file, shared by processes.
+
+    The database is opened on first use in WAL mode, so worker processes can
+    read and write it concurrently.  Once the stored results exceed
+    ``max_bytes``, the least recently used entries are dropped.  Any SQLite
+    error makes a lookup miss and a store do nothing, so a broken cache only
+    costs speed.
+
+    Args:
+        path: The SQLite file; its directory is created if needed.
+        max_bytes: Byte budget of stored results. Defaults to the
+            SMALLTALK_VALIDATOR_DISK_CACHE_MAX_BYTES environment variable,
+            or 256 MiB.
+    """
+
+    def __init__(self, path: str, max_bytes: int | None = None) -> None:
+        # Imported here so that importing the module stays cheap.
+        import sqlite3
+
+        self.path = path
+        self.max_bytes = _default_max_bytes() if max_bytes is None else max_bytes
+        self._lock = threading.Lock()
+        self._conn: sqlite3.Connection | None = None
+        # Errors that make a lookup miss and a store do nothing.
+        self._errors = (sqlite3.Error, OSError)
+        self._puts = 0
+        self.hits = 0
+        self.misses = 0
+
+    def get(
+        self,
+        mode: str,
+        file_path: str,
+        options: dict[str, Any] | None,
+        stat: os.stat_result,
+    ) -> dict[str, Any] | None:
+        """Return the cached result for the file with *stat*, or None on a miss."""
+        key = (mode, os.path.abspath(file_path), _options_key(options))
+        try:
+            with self._lock:
+                row = (
+                    self._connect()
+                    .execute(
+                        "SELECT mtime_ns, size, digest, result, accessed FROM results"
+                        " WHERE mode = ? AND path = ? AND options = ?",
+                        key,
+                    )
+                    .fetchone()
+                )
+            if row is None or row[1] != stat.st_size:
+                self.misses += 1
+                return None
+            mtime_ns, _, digest, result, accessed = row
+            now = time.time()
+            updates: dict[str, Any] = {}
+            if mtime_ns != stat.st_mtime_ns:
+                # Touched (e.g. by a checkout) but possibly unchanged.
+                if _file_digest(file_path) != digest:
+                    self.misses += 1
+                    return None
+                updates["mtime_ns"] = stat.st_mtime_ns
+            if now - accessed > _ACCESS_RESOLUTION_SECONDS:
+                updates["accessed"] = now
+            if updates:
+                self._update(key, updates)
+        except self._errors:
+            self.misses += 1
+            return None
+        self.hits += 1
+        cached = json.loads(result)
+        cached["file_path"] = file_path
+        return cached
+
+    def put(
+        self,
+        mode: str,
+        file_path: str,
+        options: dict[str, Any] | None,
+        stat: os.stat_result,
+        result: dict[str, Any],
+    ) -> None:
+        """Store *result* for the file as it was at *stat*.
+
+        Nothing is stored if the file changed while it was being checked.
+        """
+        try:
+            digest = _file_digest(file_path)
+            after = os.stat(file_path)
+            if (after.st_mtime_ns, after.st_size) != (stat.st_mtime_ns, stat.st_size):
+                return
+            payload = json.dumps(result, default=str)
+            with self._lock:
+                conn = self._connect()
+                with conn:
+                    conn.execute(
+                        "INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                        (
+                            mode,
+                            os.path.abspath(file_path),
+                            _options_key(options),
+                            stat.st_mtime_ns,
+                            stat.st_size,
+                            digest,
+                            payload,
+                            len(payload),
+                            time.time(),
+                        ),
+                    )
+                self._puts += 1
+                if self._puts % _PRUNE_EVERY == 0:
+                    self._prune_to_budget(conn)
+        except self._errors:
+            return
+
+    def prune(self) -> dict[str, int]:
+        """Drop entries for files that no longer exist, then trim to the budget."""
+        with self._lock:
+            conn = self._connect()
+            paths = [
+                row[0] for row in conn.execute("SELECT DISTINCT path FROM results")
+            ]
+            missing = [(path,) for path in paths if not os.path.exists(path)]
+            with conn:
+                conn.executemany("DELETE FROM results WHERE path = ?", missing)
+            trimmed = self._prune_to_budget(conn)
+        return {"missing_files": len(missing), "trimmed_entries": trimmed}
+
+    def clear(self) -> None:
+        """Drop every entry and shrink the file."""
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                conn.execute("DELETE FROM results")
+            conn.execute("VACUUM")
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            entries, size = (
+                self._connect()
+                .execute("SELECT COUNT(*), COALESCE(SUM(bytes), 0) FROM results")
+                .fetchone()
+            )
+        return {
+            "path": self.path,
+            "entries": entries,
+            "size_bytes": size,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def _connect(self) -> "sqlite3.Connection":
+        import sqlite3
+
+        if self._conn is not None:
+            return self._conn
+        Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(
+            self.path, timeout=_BUSY_TIMEOUT_MS / 1000, check_same_thread=False
+        )
+        try:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(_SCHEMA)
+            fingerprint = cache_fingerprint()
+            with conn:
+                conn.execute("BEGIN IMMEDIATE")
+                row = conn.execute(
+                    "SELECT value FROM meta WHERE key = 'fingerprint'"
+                ).fetchone()
+                if row is None or row[0] != fingerprint:
+                    conn.execute("DELETE FROM results")
+                    conn.execute(
+                        "INSERT OR REPLACE INTO meta VALUES ('fingerprint', ?)",
+                        (fingerprint,),
+                    )
+        except BaseException:
+            conn.close()
+            raise
+        self._conn = conn
+        return conn
+
+    def _update(self, key: tuple[str, str, str], updates: dict[str, Any]) -> None:
+        assignments = ", ".join(f"{column} = ?" for column in updates)
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                conn.execute(
+                    f"UPDATE results SET {assignments}"
+                    " WHERE mode = ? AND path = ? AND options = ?",
+                    (*updates.values(), *key),
+                )
+
+    def _prune_to_budget(self, conn: "sqlite3.Connection") -> int:
+        """Drop least recently used entries once over budget; return how many."""
+        (size,) = conn.execute("SELECT COALESCE(SUM(bytes), 0) FROM results").fetchone()
+        if size <= self.max_bytes:
+            return 0
+        with conn:
+            cursor = conn.execute(
+                "DELETE FROM results WHERE rowid IN ("
+                " SELECT rowid FROM (SELECT rowid, SUM(bytes) OVER"
+                " (ORDER BY accessed DESC, rowid DESC) AS kept FROM results)"
+                " WHERE kept > ?)",
+                (int(self.max_bytes * _PRUNE_TARGET),),
+            )
+        return cursor.rowcount
+
+
+def use_disk_cache(path: str | None) -> None:
+    """Enable the disk cache at *path* for this process and workers it starts."""
+    if path:
+        os.environ[_PATH_ENV] = path
+    else:
+        os.environ.pop(_PATH_ENV, None)
+
+
+def configured_cache_path() -> str | None:
+    return os.environ.get(_PATH_ENV) or None
+
+
+_disk_cache: DiskCache | None = None
+_disk_cache_lock = threading.Lock()
+
+
+def disk_cache() -> DiskCache | None:
+    """Return the process-wide disk cache, or None unless one is configured."""
+    global _disk_cache
+    path = configured_cache_path()
+    if path is None:
+        return None
+    with _disk_cache_lock:
+        if _disk_cache is None or _disk_cache.path != path:
+            if _disk_cache is not None:
+                _disk_cache.close()
+            _disk_cache = DiskCache(path)
+        return _disk_cache
@@ -0,0 +1,165 @@
+"""
+Bounded executors that the async MCP tools offload blocking work to.
+"""
+
+import asyncio
+import contextvars
+import multiprocessing
+import os
+import threading
+from collections.abc import Callable
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any
+
+from smalltalk_validator_mcp_server.workers import _warm_up
+
+EXECUTOR_KINDS = ("thread", "process")
+
+_KIND_ENV = "SMALLTALK_VALIDATOR_EXECUTOR"
+_WORKERS_ENV = "SMALLTALK_VALIDATOR_WORKERS"
+_MAX_QUEUE_ENV = "SMALLTALK_VALIDATOR_MAX_QUEUE"
+_TIMEOUT_ENV = "SMALLTALK_VALIDATOR_TIMEOUT_SECONDS"
+_DEFAULT_MAX_QUEUE = 32
+_DEFAULT_TIMEOUT = 300.0
+
+
+def _env_number(name: str, default: float) -> float:
+    try:
+        return float(os.environ[name])
+    except (KeyError, ValueError):
+        return default
+
+
+def default_kind() -> str:
+    kind = os.environ.get(_KIND_ENV, "thread")
+    return kind if kind in EXECUTOR_KINDS else "thread"
+
+
+def default_workers() -> int:
+    return max(int(_env_number(_WORKERS_ENV, min(os.cpu_count() or 1, 4))), 1)
+
+
+def default_max_queue() -> int:
+    return max(int(_env_number(_MAX_QUEUE_ENV, _DEFAULT_MAX_QUEUE)), 0)
+
+
+def default_timeout() -> float | None:
+    timeout = _env_number(_TIMEOUT_ENV, _DEFAULT_TIMEOUT)
+    return timeout if timeout > 0 else None
+
+
+class ExecutorBusyError(RuntimeError):
+    """Raised when a ToolExecutor already holds its maximum of requests."""
+
+
+class ToolExecutor:
+    """Runs blocking tool work on a thread or process pool with a bounded queue.
+
+    At most ``max_queue`` requests may be running or waiting at once; further
+    requests are refused with ExecutorBusyError instead of queueing without
+    bound.  A request that does not finish within ``timeout`` seconds raises
+    TimeoutError: if it had not started it is dropped, otherwise its worker
+    finishes it in the background and its slot is freed then.  The pool is
+    created on first use, and each worker leases a parser when it starts.
+
+    Args:
+        kind: "thread" or "process".  Process workers need picklable
+            functions and arguments, and do not share the server's memory.
+        max_workers: Number of worker threads or processes.
+        max_queue: Maximum requests running or waiting.
+        timeout: Seconds before a request is abandoned, or None for no limit.
+        name: Name used for worker threads and in error messages.
+    """
+
+    def __init__(
+        self,
+        kind: str = "thread",
+        max_workers: int = 1,
+        max_queue: int = _DEFAULT_MAX_QUEUE,
+        timeout: float | None = None,
+        name: str = "tool",
+    ) -> None:
+        if kind not in EXECUTOR_KINDS:
+            raise ValueError(f"Unknown executor kind: {kind!r}")
+        self.kind = kind
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self.timeout = timeout
+        self.name = name
+        self._executor: Executor | None = None
+        self._lock = threading.Lock()
+        self._in_flight = 0
+
+    @property
+    def in_flight(self) -> int:
+        """Return the number of requests running or waiting."""
+        with self._lock:
+            return self._in_flight
+
+    async def run(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """Run ``func(*args, **kwargs)`` on the pool and return its result."""
+        with self._lock:
+            if self._in_flight >= self.max_queue:
+                raise ExecutorBusyError(
+                    f"Server busy: {self._in_flight} {self.name} request(s) "
+                    f"in progress (limit {self.max_queue}); retry later"
+                )
+            self._in_flight += 1
+            if self.kind == "thread":
+                # Like anyio.to_thread, run in a copy of the caller's context.
+                args = (func, *args)
+                func = contextvars.copy_context().run
+            try:
+                future = self._get_executor().submit(func, *args, **kwargs)
+            except BaseException:
+                self._in_flight -= 1
+                raise
+        future.add_done_callback(self._release)
+        try:
+            return await asyncio.wait_for(asyncio.wrap_future(future), self.timeout)
+        except asyncio.TimeoutError:
+            # wait_for has cancelled the future, which drops it if not started.
+            raise TimeoutError(
+                f"{self.name.capitalize()} request timed out after "
+                f"{self.timeout:g} seconds"
+            ) from None
+
+    async def warm_up(self) -> None:
+        """Start the workers so their parsers are ready before the first request.
+
+        Warm-up work is not counted against ``max_queue``.
+        """
+        with self._lock:
+            executor = self._get_executor()
+        await asyncio.gather(
+            *(
+                asyncio.wrap_future(executor.submit(_warm_up))
+                for _ in range(self.max_workers)
+            )
+        )
+
+    def shutdown(self, wait: bool = True) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait, cancel_futures=True)
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            if self.kind == "process":
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=_warm_up,
+                )
+            else:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix=self.name,
+                    initializer=_warm_up,
+                )
+        return self._executor
+
+    def _release(self, _future) -> None:
+        with self._lock:
+            self._in_flight -= 1
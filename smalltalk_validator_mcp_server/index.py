@@ -0,0 +1,360 @@
+"""
+Project-wide index of the classes defined and extended in Tonel files.
+
+The index gives the linter context that one file lacks: superclasses and
+their instance variables, and which names are project classes.  It is built
+in parallel worker processes, persisted as JSON, and updated incrementally:
+only files whose mtime or size changed are parsed again.  Updates are
+explicit; a saved index does not follow later edits to the project until
+``update_project_index`` runs again.
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+from smalltalk_validator_mcp_server.linter import MethodContext, extract_class_info
+from smalltalk_validator_mcp_server.parser import (
+    _PARSER_POOL,
+    _ston_map_get,
+    _ston_symbol_text,
+)
+from smalltalk_validator_mcp_server.source import open_source
+from smalltalk_validator_mcp_server.workers import iter_file_results, iter_tonel_files
+
+PROJECT_INDEX_ENV = "SMALLTALK_VALIDATOR_PROJECT_INDEX"
+_FORMAT_VERSION = 1
+# Guards against superclass cycles in broken code.
+_MAX_HIERARCHY_DEPTH = 256
+
+
+def default_index_path(root: str) -> str:
+    """Return the per-user file the index of *root* is saved to."""
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+        os.path.expanduser("~"), ".cache"
+    )
+    digest = hashlib.blake2b(
+        os.path.abspath(root).encode("utf-8", "surrogatepass"), digest_size=8
+    ).hexdigest()
+    return os.path.join(base, "smalltalk-validator", f"index-{digest}.json")
+
+
+def index_tonel_file(file_path: str) -> dict[str, Any] | None:
+    """Return the definition in a Tonel file, or None if it has none.
+
+    Runs in worker processes.  The result holds the definition ``kind``
+    (class, trait or extension), ``name``, ``superclass``, ``inst_vars``,
+    ``class_vars``, and the instance and class side ``selectors``.
+    """
+    with open_source(Path(file_path)) as source:
+        if source.encoding_error is not None:
+            return None
+        root = _PARSER_POOL.parse(source.data).root_node
+    name, inst_vars, class_vars, definition = extract_class_info(root)
+    if not name or definition is None:
+        return None
+    superclass = None
+    for child in definition.children:
+        if child.type == "ston_map":
+            value = _ston_map_get(child, "#superclass")
+            superclass = _ston_symbol_text(value) if value is not None else None
+            break
+    selectors: list[str] = []
+    class_selectors: list[str] = []
+    for child in root.children:
+        if child.type == "method_definition":
+            method = MethodContext(child, [])
+            if method.method_ref_node is not None:
+                (class_selectors if method.is_class_method else selectors).append(
+                    method.selector
+                )
+    return {
+        "kind": definition.type.removesuffix("_definition"),
+        "name": name,
+        "superclass": superclass,
+        "inst_vars": inst_vars,
+        "class_vars": class_vars,
+        "selectors": selectors,
+        "class_selectors": class_selectors,
+    }
+
+
+def _index_file_stamped(file_path: str) -> tuple[tuple[int, int], dict | None]:
+    """Stat and index one file (runs in worker processes)."""
+    stat = os.stat(file_path)
+    try:
+        definition = index_tonel_file(file_path)
+    except (OSError, UnicodeDecodeError):
+        definition = None
+    return (stat.st_mtime_ns, stat.st_size), definition
+
+
+class _ClassEntry:
+    """Everything the index knows about one class, merged over its files."""
+
+    __slots__ = (
+        "superclass",
+        "inst_vars",
+        "class_vars",
+        "selectors",
+        "class_selectors",
+        "defined",
+    )
+
+    def __init__(self) -> None:
+        self.superclass: str | None = None
+        self.inst_vars: tuple[str, ...] = ()
+        self.class_vars: tuple[str, ...] = ()
+        self.selectors: set[str] = set()
+        self.class_selectors: set[str] = set()
+        self.defined = False
+
+
+class ProjectIndex:
+    """Classes, superclasses, variables and selectors of a Tonel project.
+
+    ``update`` re-indexes the files under ``root`` that changed since the
+    last update, in parallel.  Lookups are dictionary reads; the inherited
+    instance variables of a class are computed once per update.
+
+    Args:
+        root: Directory searched recursively for ``*.st`` files.
+    """
+
+    def __init__(self, root: str) -> None:
+        self.root = os.path.abspath(root)
+        # Path -> ((mtime_ns, size), definition or None).
+        self._files: dict[str, tuple[tuple[int, int], dict | None]] = {}
+        self._classes: dict[str, _ClassEntry] = {}
+        self._inherited: dict[str, tuple[str, ...]] = {}
+        self._lock = threading.Lock()
+        self.fingerprint = ""
+
+    def update(self, max_workers: int | None = None) -> dict[str, int]:
+        """Re-index new and changed files and drop removed ones.
+
+        Returns:
+            Counts of files indexed and removed by this update
+        """
+        stamps: dict[str, tuple[int, int]] = {}
+        for path in iter_tonel_files([self.root]):
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            stamps[path] = (stat.st_mtime_ns, stat.st_size)
+
+        changed = [
+            path
+            for path, stamp in stamps.items()
+            if path not in self._files or self._files[path][0] != stamp
+        ]
+        removed = [path for path in self._files if path not in stamps]
+        files = dict(self._files)
+        for path in removed:
+            del files[path]
+        for path, (stamp, definition) in iter_file_results(
+            _index_file_stamped, changed, max_workers
+        ):
+            files[path] = (tuple(stamp), definition)
+        if changed or removed or not self.fingerprint:
+            self._replace(files)
+        return {
+            "indexed_files_count": len(changed),
+            "removed_files_count": len(removed),
+        }
+
+    def has_class(self, name: str) -> bool:
+        """Return True if a file in the project defines *name*."""
+        entry = self._classes.get(name)
+        return entry is not None and entry.defined
+
+    def superclass(self, name: str) -> str | None:
+        entry = self._classes.get(name)
+        return entry.superclass if entry is not None else None
+
+    def inst_vars(self, name: str) -> tuple[str, ...]:
+        """Return the instance variables of *name*, its own ones first."""
+        entry = self._classes.get(name)
+        own = entry.inst_vars if entry is not None else ()
+        return own + tuple(v for v in self.inherited_inst_vars(name) if v not in own)
+
+    def inherited_inst_vars(self, name: str) -> tuple[str, ...]:
+        """Return the instance variables *name* inherits from its superclasses."""
+        inherited = self._inherited.get(name)
+        if inherited is not None:
+            return inherited
+        names: list[str] = []
+        seen = {name}
+        current = self.superclass(name)
+        while current and current not in seen and len(seen) < _MAX_HIERARCHY_DEPTH:
+            seen.add(current)
+            entry = self._classes.get(current)
+            if entry is None:
+                break
+            names.extend(v for v in entry.inst_vars if v not in names)
+            current = entry.superclass
+        inherited = tuple(names)
+        with self._lock:
+            self._inherited[name] = inherited
+        return inherited
+
+    def selectors(self, name: str, class_side: bool = False) -> frozenset[str]:
+        """Return the selectors defined or added by extensions on *name*."""
+        entry = self._classes.get(name)
+        if entry is None:
+            return frozenset()
+        return frozenset(entry.class_selectors if class_side else entry.selectors)
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "directory": self.root,
+            "files_count": len(self._files),
+            "classes_count": sum(1 for e in self._classes.values() if e.defined),
+        }
+
+    def save(self, path: str) -> None:
+        """Write the index as JSON, replacing *path* atomically."""
+        data = {
+            "version": _FORMAT_VERSION,
+            "root": self.root,
+            "files": {
+                file_path: {"stamp": list(stamp), "definition": definition}
+                for file_path, (stamp, definition) in sorted(self._files.items())
+            },
+        }
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, separators=(",", ":"))
+        os.replace(temp_path, path)
+
+    @classmethod
+    def load(cls, path: str) -> "ProjectIndex":
+        """Read an index saved by ``save``; raise ValueError if unusable."""
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        if data.get("version") != _FORMAT_VERSION:
+            raise ValueError(f"Unsupported index format in {path}")
+        index = cls(data["root"])
+        index._replace(
+            {
+                file_path: (tuple(entry["stamp"]), entry["definition"])
+                for file_path, entry in data["files"].items()
+            }
+        )
+        return index
+
+    def contains(self, file_path: str) -> bool:
+        """Return True if *file_path* lies under the indexed directory."""
+        return os.path.abspath(file_path).startswith(self.root + os.sep)
+
+    def _replace(self, files: dict[str, tuple[tuple[int, int], dict | None]]) -> None:
+        classes: dict[str, _ClassEntry] = {}
+        definitions = sorted(
+            (d for _, d in files.values() if d is not None),
+            # Class definitions first, so extensions only add selectors.
+            key=lambda d: (d["kind"] == "extension", d["name"]),
+        )
+        for definition in definitions:
+            entry = classes.setdefault(definition["name"], _ClassEntry())
+            if definition["kind"] != "extension" and not entry.defined:
+                entry.defined = True
+                entry.superclass = definition["superclass"]
+                entry.inst_vars = tuple(definition["inst_vars"])
+                entry.class_vars = tuple(definition["class_vars"])
+            entry.selectors.update(definition["selectors"])
+            entry.class_selectors.update(definition["class_selectors"])
+        fingerprint = hashlib.blake2b(
+            json.dumps(definitions, sort_keys=True).encode("utf-8"), digest_size=16
+        ).hexdigest()
+        with self._lock:
+            self._files = files
+            self._classes = classes
+            self._inherited = {}
+            self.fingerprint = fingerprint
+
+
+# Index made active by index_tonel_project; overrides PROJECT_INDEX_ENV,
+# which is only read as the start-up setting.
+_active_index_path: str | None = None
+
+
+def activate_project_index(path: str | None) -> None:
+    """Use the index saved at *path* for file lints in this process (None: reset)."""
+    global _active_index_path
+    _active_index_path = path
+
+
+def configured_index_path() -> str | None:
+    return _active_index_path or os.environ.get(PROJECT_INDEX_ENV) or None
+
+
+_project_index: ProjectIndex | None = None
+_project_index_stamp: tuple[str, int] | None = None
+_project_index_lock = threading.Lock()
+
+
+def project_index(path: str | None = None) -> ProjectIndex | None:
+    """Return the project index, reloaded when its file changes.
+
+    *path* defaults to the active index, or SMALLTALK_VALIDATOR_PROJECT_INDEX
+    if none was activated.  Returns None
+    unless it names a readable index file.
+    """
+    global _project_index, _project_index_stamp
+    path = path or configured_index_path()
+    if path is None:
+        return None
+    try:
+        stamp = (path, os.stat(path).st_mtime_ns)
+    except OSError:
+        return None
+    with _project_index_lock:
+        if stamp != _project_index_stamp:
+            try:
+                _project_index = ProjectIndex.load(path)
+            except (OSError, ValueError, KeyError):
+                _project_index = None
+            _project_index_stamp = stamp
+        return _project_index
+
+
+def project_index_for(file_path: str, path: str | None = None) -> ProjectIndex | None:
+    """Return the project index (see ``project_index``) if it covers *file_path*."""
+    index = project_index(path)
+    if index is not None and index.contains(file_path):
+        return index
+    return None
+
+
+def update_project_index(
+    root: str, path: str | None = None, max_workers: int | None = None
+) -> tuple[ProjectIndex, dict[str, int], str]:
+    """Load the saved index of *root*, bring it up to date and save it.
+
+    Returns:
+        The index, the counts of the update, and the file it was saved to
+    """
+    path = path or default_index_path(root)
+    index: ProjectIndex | None = None
+    try:
+        index = ProjectIndex.load(path)
+    except (OSError, ValueError, KeyError):
+        pass
+    if index is None or index.root != os.path.abspath(root):
+        index = ProjectIndex(root)
+    start = time.perf_counter()
+    counts = index.update(max_workers)
+    counts["elapsed_ms"] = round((time.perf_counter() - start) * 1000, 3)
+    if (
+        counts["indexed_files_count"]
+        or counts["removed_files_count"]
+        or not os.path.exists(path)
+    ):
+        index.save(path)
+    return index, counts, path
@@ -2,83 +2,159 @@
 Tree-sitter based linter for Tonel Smalltalk source code.
 """
 
+import difflib
+import hashlib
+import json
+import os
 import re
+import threading
+from bisect import bisect_left
+from collections import OrderedDict
+from collections.abc import Callable, Iterable
+from functools import cache, cached_property
 from pathlib import Path
+from typing import TYPE_CHECKING
+
+from tree_sitter import Node, Query, QueryCursor, Tree
 
 from smalltalk_validator_mcp_server.parser import (
-    _make_parser,
+    _PARSER_POOL,
+    _language,
     _ston_list_strings,
     _ston_map_get,
     _ston_symbol_text,
 )
+from smalltalk_validator_mcp_server.source import open_source
+
+if TYPE_CHECKING:
+    from smalltalk_validator_mcp_server.index import ProjectIndex
 
 # Pre-compiled regex patterns for selector extraction
 _RE_KEYWORDS = re.compile(r"[A-Za-z_][A-Za-z0-9_]*:")
 _RE_BINARY_OP = re.compile(r"([^\s\w]+)")
 _RE_UNARY_ID = re.compile(r"([A-Za-z_][A-Za-z0-9_]*)")
 
-# Block content: matches [...] with up to two levels of bracket nesting
-_BLOCK_PAT = r"\[[^\[\]]*(?:\[[^\[\]]*\][^\[\]]*)*\]"
+# (predicate, keyword, preferred selector) for single-branch tests on the
+# receiver of ifTrue:/ifFalse:; e.g. ``x isNil ifTrue: [...]`` -> ifNil:.
+_NIL_SIMPLE_PATTERNS: list[tuple[str, str, str]] = [
+    ("isNil", "ifTrue:", "ifNil:"),
+    ("notNil", "ifTrue:", "ifNotNil:"),
+    ("isNil", "ifFalse:", "ifNotNil:"),
+    ("notNil", "ifFalse:", "ifNil:"),
+]
 
-_NIL_COMBINED_RE = re.compile(
-    rf"(?:\bisNil|\bnotNil)\s+ifTrue:\s*{_BLOCK_PAT}\s*ifFalse:"
-    rf"|(?:\bisNil|\bnotNil)\s+ifFalse:\s*{_BLOCK_PAT}\s*ifTrue:",
-    re.DOTALL,
-)
+_EMPTY_SIMPLE_PATTERNS: list[tuple[str, str, str]] = [
+    ("isEmpty", "ifTrue:", "ifEmpty:"),
+    ("notEmpty", "ifTrue:", "ifNotEmpty:"),
+    ("isEmpty", "ifFalse:", "ifNotEmpty:"),
+    ("notEmpty", "ifFalse:", "ifEmpty:"),
+]
 
-_EMPTY_COMBINED_RE = re.compile(
-    rf"(?:\bisEmpty|\bnotEmpty)\s+ifTrue:\s*{_BLOCK_PAT}\s*ifFalse:"
-    rf"|(?:\bisEmpty|\bnotEmpty)\s+ifFalse:\s*{_BLOCK_PAT}\s*ifTrue:",
-    re.DOTALL,
+_BRANCH_SELECTORS = ("ifTrue:", "ifFalse:", "ifTrue:ifFalse:", "ifFalse:ifTrue:")
+
+# Integer literal argument of at: -> positional accessor.
+_AT_NUMBER_ACCESSORS = {
+    "1": "first",
+    "2": "second",
+    "3": "third",
+    "4": "fourth",
+    "5": "fifth",
+    "6": "sixth",
+}
+
+# Receivers accepted in ``at: <collection> size``.
+_COLLECTION_NODE_TYPES = frozenset({"identifier", "self", "super"})
+
+_SEND_NODE_TYPES = frozenset(
+    {
+        "unary_message",
+        "binary_message",
+        "keyword_message",
+        "cascaded_unary_message",
+        "cascaded_binary_message",
+        "cascaded_keyword_message",
+    }
+)
+_SELECTOR_PART_TYPES = frozenset({"unary_identifier", "binary_operator", "keyword"})
+
+# Send node types with the node type of their selector parts.
+_SEND_PART_TYPES = (
+    ("unary_message", "unary_identifier"),
+    ("binary_message", "binary_operator"),
+    ("keyword_message", "keyword"),
+    ("cascaded_unary_message", "unary_identifier"),
+    ("cascaded_binary_message", "binary_operator"),
+    ("cascaded_keyword_message", "keyword"),
 )
 
-_NIL_SIMPLE_PATTERNS: list[tuple[re.Pattern[str], str, str]] = [
-    (re.compile(r"\bisNil\s+ifTrue:"), "isNil ifTrue:", "ifNil:"),
-    (re.compile(r"\bnotNil\s+ifTrue:"), "notNil ifTrue:", "ifNotNil:"),
-    (re.compile(r"\bisNil\s+ifFalse:"), "isNil ifFalse:", "ifNotNil:"),
-    (re.compile(r"\bnotNil\s+ifFalse:"), "notNil ifFalse:", "ifNil:"),
-]
-
-_EMPTY_SIMPLE_PATTERNS: list[tuple[re.Pattern[str], str, str]] = [
-    (re.compile(r"\bisEmpty\s+ifTrue:"), "isEmpty ifTrue:", "ifEmpty:"),
-    (re.compile(r"\bnotEmpty\s+ifTrue:"), "notEmpty ifTrue:", "ifNotEmpty:"),
-    (re.compile(r"\bisEmpty\s+ifFalse:"), "isEmpty ifFalse:", "ifNotEmpty:"),
-    (re.compile(r"\bnotEmpty\s+ifFalse:"), "notEmpty ifFalse:", "ifEmpty:"),
-]
 
-# Guard: exclude at:put:, at:ifAbsent:, and at: N + M (arithmetic) false positives
-_AT_ARG_GUARD = r"(?!\s*[-+*/])(?!\s*[A-Za-z_][A-Za-z0-9_]*:)"
+def _selector_parts(selector: str) -> list[str]:
+    """Split a keyword selector into its keywords; other selectors are one part."""
+    if not selector.endswith(":"):
+        return [selector]
+    return [part + ":" for part in selector[:-1].split(":")]
+
+
+@cache
+def _rule_query(node_types: frozenset[str], selectors: frozenset[str]) -> Query:
+    """Return the query for the rules' node types and selectors, compiled once.
+
+    Captures nodes of *node_types* as ``node`` and, when there are any, all
+    ``block`` nodes (for block argument scope).  Sends with a selector part
+    of one of *selectors* are captured as ``send``, once per such part.
+    """
+    patterns = [f"({node_type}) @node" for node_type in sorted(node_types)]
+    if node_types:
+        patterns.append("(block) @block")
+    if selectors:
+        parts = sorted({part for s in selectors for part in _selector_parts(s)})
+        quoted = " ".join(json.dumps(part) for part in parts)
+        patterns.extend(
+            f"(({send_type} ({part_type}) @part) @send (#any-of? @part {quoted}))"
+            for send_type, part_type in _SEND_PART_TYPES
+        )
+    return Query(_language(), "\n".join(patterns))
 
-_AT_NUMBER_PATTERNS: list[tuple[re.Pattern[str], str, str]] = [
-    (re.compile(rf"\bat:\s*1\b{_AT_ARG_GUARD}"), "at: 1", "first"),
-    (re.compile(rf"\bat:\s*2\b{_AT_ARG_GUARD}"), "at: 2", "second"),
-    (re.compile(rf"\bat:\s*3\b{_AT_ARG_GUARD}"), "at: 3", "third"),
-    (re.compile(rf"\bat:\s*4\b{_AT_ARG_GUARD}"), "at: 4", "fourth"),
-    (re.compile(rf"\bat:\s*5\b{_AT_ARG_GUARD}"), "at: 5", "fifth"),
-    (re.compile(rf"\bat:\s*6\b{_AT_ARG_GUARD}"), "at: 6", "sixth"),
-]
 
-# Excludes at: col size - N (arithmetic after size) to avoid false positives
-_AT_SIZE_RE = re.compile(
-    r"\bat:\s*\(?[A-Za-z_][A-Za-z0-9_]*\s+size\s*\)?(?!\s*[-+*/])",
-    re.DOTALL,
+# Comments, string literals and symbol literals, which the body checks skip.
+_LITERAL_PATTERN = (
+    r'(?P<comment>"[^"\n]*")'
+    r"|(?P<string>'(?:''|[^'])*')"
+    r"|(?P<quoted_symbol>#'(?:''|[^'])*')"
+    r"|(?P<symbol>#[A-Za-z_][A-Za-z0-9_]*)"
 )
+_LITERAL_RE = re.compile(_LITERAL_PATTERN)
+_LITERAL_REPLACEMENTS = {
+    "comment": "",
+    "string": "''",
+    "quoted_symbol": "#''",
+    "symbol": "#",
+}
 
 # Approximates "collaborators" for the class-comment importance score: any
 # capitalized identifier referenced in a method body is treated as a
-# reference to another class.
-_CAPITALIZED_IDENTIFIER_RE = re.compile(r"\b[A-Z][A-Za-z0-9_]*\b")
+# reference to another class.  Literals are matched first so identifiers
+# inside them are skipped in the same pass.
+_CAPITALIZED_NAME_RE = re.compile(r"[A-Z][A-Za-z0-9_]*")
+_BODY_SCAN_RE = re.compile(rf"{_LITERAL_PATTERN}|\b([A-Z][A-Za-z0-9_]*)\b")
+_HAS_UPPERCASE_RE = re.compile(r"[A-Z]")
 
 _TEST_CLASS_SUFFIXES = ("Test", "Tests", "TestCase")
 
 
 def _sanitize_body(body_text: str) -> str:
     """Remove comments, string literals, and symbol literals to avoid false positives."""
-    sanitized = re.sub(r'"[^"\n]*"', "", body_text)
-    sanitized = re.sub(r"'(?:''|[^'])*'", "''", sanitized)
-    sanitized = re.sub(r"#'(?:''|[^'])*'", "#''", sanitized)
-    sanitized = re.sub(r"#[A-Za-z_][A-Za-z0-9_]*", "#", sanitized)
-    return sanitized
+    return _LITERAL_RE.sub(lambda m: _LITERAL_REPLACEMENTS[m.lastgroup], body_text)
+
+
+def _scan_body(body_text: str) -> frozenset[str]:
+    """Return the capitalized identifiers of a body outside comments and literals."""
+    # Without an uppercase letter there is nothing to find.
+    if not _HAS_UPPERCASE_RE.search(body_text):
+        return frozenset()
+    names = {match[-1] for match in _BODY_SCAN_RE.findall(body_text)}
+    names.discard("")
+    return frozenset(names)
 
 
 def _method_formal_names(method_ref_node) -> set[str]:
@@ -127,39 +203,77 @@ def _block_argument_names(block_node) -> set[str]:
     return names
 
 
-def _collect_direct_inst_var_accesses(
-    method_body_node,
-    inst_vars: list[str],
-    excluded_names: set[str],
-) -> set[str]:
-    """Return inst var names used as bare identifiers inside a method body."""
-    inst_var_set = set(inst_vars)
-    if not inst_var_set:
-        return set()
+def _unwrap_parentheses(node):
+    """Return the expression inside any parentheses around *node*."""
+    while node is not None and node.type == "parenthesized_expression":
+        inner = [c for c in node.named_children if c.type != "comment"]
+        node = inner[0] if inner else None
+    return node
 
-    found: set[str] = set()
 
-    def walk(node, scope_excluded: set[str]) -> None:
-        if node.type == "block":
-            block_scope = scope_excluded | _block_argument_names(node)
-            for child in node.children:
-                walk(child, block_scope)
-            return
+def _first_node(nodes: Iterable[Node]) -> Node | None:
+    """Return the node that starts first in the source, or None."""
+    return min(nodes, key=lambda node: node.start_byte, default=None)
+
+
+class MessageSend:
+    """A message send in a method body, read from its CST node.
+
+    ``receiver`` and ``arguments`` have surrounding parentheses removed and
+    are only worked out when a rule asks for them.  For a cascaded message
+    the receiver is that of the cascade.
+    """
+
+    def __init__(self, node, selector: str) -> None:
+        self.node = node
+        self.selector = selector
+
+    @cached_property
+    def receiver(self):
+        node = self.node
+        if not node.type.startswith("cascaded_"):
+            return _unwrap_parentheses(node.children[0]) if node.children else None
+        receiver = node.parent.child_by_field_name("receiver") if node.parent else None
+        # The first message of a cascade is its "receiver" field.
+        if receiver is not None and receiver.type in _SEND_NODE_TYPES:
+            receiver = receiver.child_by_field_name("receiver")
+        return _unwrap_parentheses(receiver)
+
+    @cached_property
+    def arguments(self) -> tuple[Node, ...]:
+        children = self.node.children
+        if not self.node.type.startswith("cascaded_"):
+            children = children[1:]
+        return tuple(
+            _unwrap_parentheses(child)
+            for child in children
+            if child.is_named
+            and child.type not in _SELECTOR_PART_TYPES
+            and child.type != "comment"
+        )
 
-        if node.type == "identifier":
-            name = node.text.decode("utf-8") if node.text else ""
-            if name in inst_var_set and name not in scope_excluded:
-                found.add(name)
 
-        for child in node.children:
-            walk(child, scope_excluded)
+def _unary_selector(node) -> str | None:
+    """Return the selector if *node* is a unary send, else None."""
+    if node is None or node.type != "unary_message":
+        return None
+    for child in node.children:
+        if child.type == "unary_identifier":
+            return child.text.decode("utf-8") if child.text else None
+    return None
 
-    walk(method_body_node, excluded_names)
-    return found
+
+# (row, column) as in tree-sitter: zero-based, with the column in bytes.
+Point = tuple[int, int]
 
 
 class LintIssue:
-    """Represents a single linting issue."""
+    """Represents a single linting issue.
+
+    ``rule_id`` names the check that raised it (see docs/lint-checks.md),
+    and ``start_point`` / ``end_point`` give the region of the CST node it
+    was found at, when there is one.
+    """
 
     def __init__(
         self,
@@ -168,12 +282,52 @@ class LintIssue:
         class_name: str | None = None,
         selector: str | None = None,
         is_class_method: bool | None = None,
+        rule_id: str | None = None,
+        start_point: Point | None = None,
+        end_point: Point | None = None,
     ) -> None:
         self.severity = severity
         self.message = message
         self.class_name = class_name
         self.selector = selector
         self.is_class_method = is_class_method
+        self.rule_id = rule_id
+        self.start_point = start_point
+        self.end_point = end_point
+
+    def locate(self, node) -> "LintIssue":
+        """Set the region to that of *node* unless one is set; return self."""
+        if self.start_point is None and node is not None:
+            self.start_point = tuple(node.start_point)
+            self.end_point = tuple(node.end_point)
+        return self
+
+
+class LintResult:
+    """The issues found by one lint call, with their counts by severity.
+
+    Results are read-only and the linter keeps no per-call state, so one
+    ``TonelCSTLinter`` can be shared by concurrent callers.
+    """
+
+    __slots__ = ("_issues", "_warnings", "_errors")
+
+    def __init__(self, issues: Iterable[LintIssue]) -> None:
+        self._issues = tuple(issues)
+        self._errors = sum(1 for issue in self._issues if issue.severity == "error")
+        self._warnings = len(self._issues) - self._errors
+
+    @property
+    def issues(self) -> tuple[LintIssue, ...]:
+        return self._issues
+
+    @property
+    def warnings(self) -> int:
+        return self._warnings
+
+    @property
+    def errors(self) -> int:
+        return self._errors
 
 
 def _selector_from_after_arrow(after_arrow: str) -> str:
@@ -229,81 +383,848 @@ def _extract_var_list(ston_map_node, key: str) -> list[str]:
     return _ston_list_strings(val) if val is not None else []
 
 
-class TonelCSTLinter:
-    """Lints Tonel files for Smalltalk best practices using tree-sitter CST."""
-
-    def __init__(self) -> None:
-        self._parser = _make_parser()
-        self.warnings = 0
-        self.errors = 0
-
-    def lint(self, content: str) -> list[LintIssue]:
-        self.warnings = 0
-        self.errors = 0
-        tree = self._parser.parse(content.encode("utf-8"))
-        issues = self._run_checks(tree.root_node)
-        for issue in issues:
-            if issue.severity == "error":
-                self.errors += 1
-            else:
-                self.warnings += 1
+def extract_class_info(root) -> tuple[str, list[str], list[str], Node | None]:
+    """Return the class definition of a parsed Tonel file.
+
+    Returns:
+        (class_name, inst_vars, class_vars, definition), where definition is
+        the class, trait or extension definition node, or None if the file
+        has none
+    """
+    for child in root.children:
+        if child.type != "definition":
+            continue
+        for def_child in child.children:
+            if def_child.type not in (
+                "class_definition",
+                "trait_definition",
+                "extension_definition",
+            ):
+                continue
+            for ston_child in def_child.children:
+                if ston_child.type != "ston_map":
+                    continue
+                name_val = _ston_map_get(ston_child, "#name")
+                class_name = _ston_symbol_text(name_val) if name_val is not None else ""
+                inst_vars = _extract_var_list(ston_child, "#instVars")
+                class_vars = _extract_var_list(ston_child, "#classVars")
+                return class_name or "", inst_vars, class_vars, def_child
+    return "", [], [], None
+
+
+# Called as progress(done_methods, total_methods, new_issues) while linting.
+LintProgress = Callable[[int, int, list[LintIssue]], None]
+
+# Half-open range [start_row, end_row) of changed 0-based lines in the new content.
+LineRange = tuple[int, int]
+
+_HUNK_HEADER_RE = re.compile(r"@@ -\d+(?:,(\d+))? \+(\d+)(?:,(\d+))? @@")
+
+
+def _touched_rows(start: int, count: int) -> LineRange:
+    """Rows of *count* new lines at *start*; a deletion touches both neighbours."""
+    if count:
+        return start, start + count
+    return max(start - 1, 0), start + 1
+
+
+def _merge_ranges(ranges: Iterable[LineRange]) -> list[LineRange]:
+    merged: list[LineRange] = []
+    for start, end in sorted(ranges):
+        if merged and start <= merged[-1][1]:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def diff_line_ranges(diff: str) -> list[LineRange]:
+    """Return the new-file rows changed by a unified diff of one file.
+
+    Context lines are not counted as changed; a deletion marks the rows on
+    either side of it.
+    """
+    ranges: list[LineRange] = []
+    old_left = new_left = 0
+    row = 0
+    for line in diff.splitlines():
+        if old_left <= 0 and new_left <= 0:
+            match = _HUNK_HEADER_RE.match(line)
+            if match:
+                old_count, new_start, new_count = match.groups()
+                old_left = int(old_count or 1)
+                new_left = int(new_count or 1)
+                # A hunk adding no lines names the line before its position.
+                row = int(new_start) - 1 if new_left else int(new_start)
+            continue
+        tag = line[:1]
+        if tag == "+":
+            ranges.append(_touched_rows(row, 1))
+            row += 1
+            new_left -= 1
+        elif tag == "-":
+            ranges.append(_touched_rows(row, 0))
+            old_left -= 1
+        elif tag == "\\":
+            continue
+        else:
+            row += 1
+            old_left -= 1
+            new_left -= 1
+    return _merge_ranges(ranges)
+
+
+def content_line_ranges(old_content: str, new_content: str) -> list[LineRange]:
+    """Return the rows of *new_content* that differ from *old_content*."""
+    matcher = difflib.SequenceMatcher(
+        None, old_content.splitlines(), new_content.splitlines(), autojunk=False
+    )
+    return _merge_ranges(
+        _touched_rows(j1, j2 - j1)
+        for tag, _, _, j1, j2 in matcher.get_opcodes()
+        if tag != "equal"
+    )
+
+
+class MethodContext:
+    """Per-method data shared by every rule during one lint pass.
+
+    Derived values (method reference, category, body text, sanitized body,
+    capitalized names, declared names) are computed on first use and
+    cached, so rules that need the same data do not recompute it.  The
+    linter's pass over the body also fills in the message-send index
+    (``sends``) and the block nodes used to resolve block argument scope.
+    """
+
+    def __init__(self, method_node, inst_vars: list[str]) -> None:
+        self.node = method_node
+        self.inst_vars = inst_vars
+        self.method_ref_node = None
+        self.body_node = None
+        for child in method_node.children:
+            if child.type == "method_reference" and self.method_ref_node is None:
+                self.method_ref_node = child
+            elif child.type == "method_body" and self.body_node is None:
+                self.body_node = child
+        # Message sends by selector and the block nodes of the body; filled
+        # by the linter's query over the body.
+        self.sends: dict[str, list[MessageSend]] = {}
+        self.blocks: list[Node] = []
+        # Block scope sweep state for in_block_scope: the next block to
+        # enter, the (end_byte, names) of the enclosing blocks, and how many
+        # of them declare each name.
+        self._scope_position = -1
+        self._next_block = 0
+        self._open_blocks: list[tuple[int, set[str]]] = []
+        self._scope_names: dict[str, int] = {}
+
+    @cached_property
+    def _method_ref(self) -> tuple[str, str, bool]:
+        if self.method_ref_node is None:
+            return "", "", False
+        return _parse_method_ref(self.method_ref_node)
+
+    @property
+    def class_name(self) -> str:
+        return self._method_ref[0]
+
+    @property
+    def selector(self) -> str:
+        return self._method_ref[1]
+
+    @property
+    def is_class_method(self) -> bool:
+        return self._method_ref[2]
+
+    @cached_property
+    def category(self) -> str:
+        return _get_method_category(self.node)
+
+    @cached_property
+    def body_text(self) -> str:
+        if self.body_node is None or not self.body_node.text:
+            return ""
+        return self.body_node.text.decode("utf-8")
+
+    @cached_property
+    def sanitized(self) -> str:
+        """Body text without comments, string literals and symbol literals."""
+        return _sanitize_body(self.body_text)
+
+    @cached_property
+    def capitalized_names(self) -> frozenset[str]:
+        """Capitalized identifiers in the body, outside comments and literals."""
+        return _scan_body(self.body_text)
+
+    @cached_property
+    def declared_names(self) -> set[str]:
+        """Method argument and method-level temporary names."""
+        names = _method_formal_names(self.method_ref_node)
+        if self.body_node is not None:
+            names |= _temporary_names(self.body_node)
+        return names
+
+    def add_send(self, node) -> None:
+        """Index a send node under its full selector."""
+        selector = "".join(
+            child.text.decode("utf-8")
+            for child in node.children
+            if child.type in _SELECTOR_PART_TYPES and child.text
+        )
+        self.sends.setdefault(selector, []).append(MessageSend(node, selector))
+
+    def in_block_scope(self, name: str, node) -> bool:
+        """Return True if *name* is an argument of a block enclosing *node*.
+
+        Blocks are entered and left as the position moves forward, so
+        calls in document order take linear time overall; a call for an
+        earlier position restarts the sweep.
+        """
+        position = node.start_byte
+        if position < self._scope_position:
+            self._scope_position = -1
+            self._next_block = 0
+            self._open_blocks.clear()
+            self._scope_names.clear()
+        self._scope_position = position
+        blocks = self.blocks
+        while self._next_block < len(blocks):
+            block = blocks[self._next_block]
+            if block.start_byte > position:
+                break
+            self._next_block += 1
+            self._leave_blocks(block.start_byte)
+            if position < block.end_byte:
+                names = _block_argument_names(block)
+                self._open_blocks.append((block.end_byte, names))
+                for arg in names:
+                    self._scope_names[arg] = self._scope_names.get(arg, 0) + 1
+        self._leave_blocks(position)
+        return self._scope_names.get(name, 0) > 0
+
+    def _leave_blocks(self, position: int) -> None:
+        while self._open_blocks and self._open_blocks[-1][0] <= position:
+            for arg in self._open_blocks.pop()[1]:
+                self._scope_names[arg] -= 1
+
+    def issue(self, severity: str, message: str, node=None) -> LintIssue:
+        """Create an issue for this method, located at *node* if given."""
+        return LintIssue(
+            severity,
+            message,
+            class_name=self.class_name,
+            selector=self.selector,
+            is_class_method=self.is_class_method,
+        ).locate(node)
+
+
+class LintRule:
+    """A method-level check driven by the linter's single CST traversal.
+
+    For each method, ``start`` is called first; a rule returning False is
+    skipped for that method.  The node types registered by all active rules
+    are then matched by one tree-sitter query over the method body, and
+    ``visit`` is called for every node whose type is in ``node_types``.
+    Sends with a part of one of the rule's ``selectors`` are matched by the
+    same query and indexed in ``ctx.sends`` by their full selector, for
+    ``finish`` to look up; it then returns the rule's issues.  Issues get
+    the rule's ``rule_id``, and the method's region unless the rule located
+    them at a more precise node.
+    Rules are instantiated per lint run, so they may keep per-method state,
+    reset in ``start``.
+    """
+
+    rule_id: str = ""
+    node_types: frozenset[str] = frozenset()
+    selectors: frozenset[str] = frozenset()
+
+    def start(self, ctx: MethodContext) -> bool:
+        return True
+
+    def visit(self, node, ctx: MethodContext) -> None:
+        pass
+
+    def finish(self, ctx: MethodContext) -> list[LintIssue]:
+        return []
+
+
+class MethodLengthRule(LintRule):
+    rule_id = "method-length"
+    _SPECIAL_CATEGORIES = ("building", "initialization", "testing", "data", "examples")
+
+    def finish(self, ctx: MethodContext) -> list[LintIssue]:
+        body_lines = len(ctx.body_text.strip().split("\n"))
+        category = ctx.category.lower()
+        is_special = any(kw in category for kw in self._SPECIAL_CATEGORIES)
+        limit = 40 if is_special else 15
+
+        if body_lines <= limit:
+            return []
+
+        if body_lines > 24 and limit == 15:
+            return [
+                ctx.issue(
+                    "error", f"Method too long: {body_lines} lines (limit: {limit})"
+                )
+            ]
+        return [
+            ctx.issue(
+                "warning", f"Method long: {body_lines} lines (recommended: {limit})"
+            )
+        ]
+
+
+class DirectAccessRule(LintRule):
+    """Instance variables used as bare identifiers outside accessors."""
+
+    rule_id = "direct-access"
+    node_types = frozenset({"identifier"})
+
+    def start(self, ctx: MethodContext) -> bool:
+        if ctx.is_class_method or not ctx.inst_vars:
+            return False
+        category = ctx.category.lower()
+        is_accessing = re.search(r"(^|-)accessing($|-)", category) is not None
+        if is_accessing or "initializ" in category:
+            return False
+        self._inst_vars = set(ctx.inst_vars) - ctx.declared_names
+        # First access of each variable, in document order.
+        self._found: dict[str, Node] = {}
+        return bool(self._inst_vars)
+
+    def visit(self, node, ctx: MethodContext) -> None:
+        name = node.text.decode("utf-8") if node.text else ""
+        if name in self._inst_vars and not ctx.in_block_scope(name, node):
+            self._found.setdefault(name, node)
+
+    def finish(self, ctx: MethodContext) -> list[LintIssue]:
+        return [
+            ctx.issue(
+                "warning",
+                f"Direct access to '{var}' (use self {var})",
+                self._found[var],
+            )
+            for var in sorted(self._found)
+        ]
+
+
+class SelfClassReferenceRule(LintRule):
+    rule_id = "self-class-reference"
+
+    def finish(self, ctx: MethodContext) -> list[LintIssue]:
+        class_name = ctx.class_name
+        if not class_name:
+            return []
+        if _CAPITALIZED_NAME_RE.fullmatch(class_name):
+            if class_name not in ctx.capitalized_names:
+                return []
+        elif not re.search(rf"\b{re.escape(class_name)}\b", ctx.sanitized):
+            return []
+
+        replacement = "self" if ctx.is_class_method else "self class"
+        return [
+            ctx.issue(
+                "warning",
+                f"Direct reference to own class '{class_name}' (use {replacement} instead)",
+                ctx.body_node,
+            )
+        ]
+
+
+class IsKindOfRule(LintRule):
+    # "obj isKindOf : Foo" does not parse as a keyword send; its "isKindOf"
+    # is left as a unary send, which no real code sends.
+    rule_id = "is-kind-of"
+    selectors = frozenset({"isKindOf:", "isKindOf"})
+
+    def finish(self, ctx: MethodContext) -> list[LintIssue]:
+        sends = ctx.sends.get("isKindOf:", []) + ctx.sends.get("isKindOf", [])
+        if not sends:
+            return []
+        return [
+            ctx.issue(
+                "warning",
+                "Avoid isKindOf: checks (prefer isXxx predicate or polymorphism)",
+                _first_node(send.node for send in sends),
+            )
+        ]
+
+
+class _BranchingRule(LintRule):
+    """``<predicate> ifTrue:``-style sends that have a dedicated selector."""
+
+    selectors = frozenset(_BRANCH_SELECTORS)
+    combined_message: str
+    simple_patterns: list[tuple[str, str, str]]
+    label: str
+
+    def finish(self, ctx: MethodContext) -> list[LintIssue]:
+        predicates = {predicate for predicate, _, _ in self.simple_patterns}
+        combined: list[Node] = []
+        found: dict[tuple[str, str], list[Node]] = {}
+        for selector in _BRANCH_SELECTORS:
+            for send in ctx.sends.get(selector, ()):
+                predicate = _unary_selector(send.receiver)
+                if predicate not in predicates:
+                    continue
+                if selector.count(":") == 2:
+                    combined.append(send.node)
+                else:
+                    found.setdefault((predicate, selector), []).append(send.node)
+
+        issues: list[LintIssue] = []
+        if combined:
+            issues.append(
+                ctx.issue("warning", self.combined_message, _first_node(combined))
+            )
+        for predicate, keyword, good in self.simple_patterns:
+            if (predicate, keyword) in found:
+                issues.append(
+                    ctx.issue(
+                        "warning",
+                        f"Use {good} instead of {predicate} {keyword} ({self.label})",
+                        _first_node(found[predicate, keyword]),
+                    )
+                )
         return issues
 
-    def lint_from_file(self, file_path: Path) -> list[LintIssue]:
+
+class NilBranchingRule(_BranchingRule):
+    rule_id = "nil-branching"
+    combined_message = "Use ifNil:ifNotNil: instead of isNil/notNil with ifTrue:ifFalse: (nil-safe branching)"
+    simple_patterns = _NIL_SIMPLE_PATTERNS
+    label = "nil-safe branching"
+
+
+class EmptyBranchingRule(_BranchingRule):
+    rule_id = "empty-branching"
+    combined_message = "Use ifEmpty:ifNotEmpty: instead of isEmpty/notEmpty with ifTrue:ifFalse: (collection branching)"
+    simple_patterns = _EMPTY_SIMPLE_PATTERNS
+    label = "collection branching"
+
+
+class CollectionAccessRule(LintRule):
+    """Single-keyword ``at:`` sends with a dedicated accessor."""
+
+    rule_id = "collection-access"
+    selectors = frozenset({"at:"})
+
+    def finish(self, ctx: MethodContext) -> list[LintIssue]:
+        numbers: dict[str, list[Node]] = {}
+        size: list[Node] = []
+        for send in ctx.sends.get("at:", ()):
+            argument = send.arguments[0] if send.arguments else None
+            if argument is None:
+                continue
+            if argument.type == "number":
+                number = argument.text.decode("utf-8") if argument.text else ""
+                numbers.setdefault(number, []).append(send.node)
+            elif _unary_selector(argument) == "size":
+                receiver = _unwrap_parentheses(argument.children[0])
+                if receiver is not None and receiver.type in _COLLECTION_NODE_TYPES:
+                    size.append(send.node)
+
+        issues = [
+            ctx.issue(
+                "warning",
+                f"Use {good} instead of at: {number} (idiomatic collection access)",
+                _first_node(numbers[number]),
+            )
+            for number, good in _AT_NUMBER_ACCESSORS.items()
+            if number in numbers
+        ]
+        if size:
+            issues.append(
+                ctx.issue(
+                    "warning",
+                    "Use last instead of at: <collection> size (idiomatic collection access)",
+                    _first_node(size),
+                )
+            )
+        return issues
+
+
+# Method-level rules, in the order their issues are reported.
+METHOD_RULES: tuple[type[LintRule], ...] = (
+    MethodLengthRule,
+    DirectAccessRule,
+    SelfClassReferenceRule,
+    IsKindOfRule,
+    NilBranchingRule,
+    EmptyBranchingRule,
+    CollectionAccessRule,
+)
+
+
+def _overlapping_methods(
+    method_nodes: list[Node], changed: list[LineRange]
+) -> list[Node]:
+    """Return the method nodes whose rows overlap a changed range, in order."""
+    end_rows = [node.end_point[0] for node in method_nodes]
+    selected: dict[int, Node] = {}
+    for start, end in changed:
+        index = bisect_left(end_rows, start)
+        while index < len(method_nodes) and method_nodes[index].start_point[0] < end:
+            selected[index] = method_nodes[index]
+            index += 1
+    return [selected[index] for index in sorted(selected)]
+
+
+_METHOD_CACHE_ENTRIES_ENV = "SMALLTALK_VALIDATOR_METHOD_CACHE_ENTRIES"
+_DEFAULT_METHOD_CACHE_ENTRIES = 16384
+
+# An issue as stored by MethodIssueCache, with its points relative to the
+# start of the method.
+_StoredIssue = tuple[
+    str,
+    str,
+    str | None,
+    str | None,
+    bool | None,
+    str | None,
+    Point | None,
+    Point | None,
+]
+
+
+def _default_method_cache_entries() -> int:
+    try:
+        return max(int(os.environ[_METHOD_CACHE_ENTRIES_ENV]), 0)
+    except (KeyError, ValueError):
+        return _DEFAULT_METHOD_CACHE_ENTRIES
+
+
+def _relative_point(point: Point | None, origin: Point) -> Point | None:
+    if point is None:
+        return None
+    row, column = point
+    return row - origin[0], column - origin[1] if row == origin[0] else column
+
+
+def _absolute_point(point: Point | None, origin: Point) -> Point | None:
+    if point is None:
+        return None
+    row, column = point
+    return row + origin[0], column + origin[1] if row == 0 else column
+
+
+class MethodIssueCache:
+    """LRU cache of the method-level issues of unchanged methods.
+
+    Entries are keyed by the rules run, the class name and instance
+    variables of the definition, and a hash of the method's source
+    (category pragma included).  Issue points are stored relative to the
+    method, so a method that only moved within its file still hits.  The
+    capitalized names of the body are kept too, for the class comment
+    check.  A capacity of 0 disables the cache.
+
+    Args:
+        max_entries: Maximum number of cached methods. Defaults to the
+            SMALLTALK_VALIDATOR_METHOD_CACHE_ENTRIES environment variable,
+            or 16384.
+    """
+
+    def __init__(self, max_entries: int | None = None) -> None:
+        self._max_entries = (
+            _default_method_cache_entries() if max_entries is None else max_entries
+        )
+        self._entries: OrderedDict[
+            tuple, tuple[tuple[_StoredIssue, ...], frozenset[str]]
+        ] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self._max_entries > 0
+
+    @staticmethod
+    def make_key(
+        rules: tuple[type[LintRule], ...],
+        class_name: str,
+        inst_vars: list[str],
+        method_node: Node,
+    ) -> tuple:
+        digest = hashlib.blake2b(method_node.text or b"", digest_size=16).digest()
+        return rules, class_name, frozenset(inst_vars), digest
+
+    def get(self, key: tuple, ctx: MethodContext) -> list[LintIssue] | None:
+        """Return the issues cached for *key*, located at *ctx*'s method."""
+        if not self.enabled:
+            return None
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+        stored, capitalized_names = entry
+        # Seed the context so the class comment check does not rescan it.
+        ctx.capitalized_names = capitalized_names
+        origin = tuple(ctx.node.start_point)
+        return [
+            LintIssue(
+                severity,
+                message,
+                class_name=class_name,
+                selector=selector,
+                is_class_method=is_class_method,
+                rule_id=rule_id,
+                start_point=_absolute_point(start, origin),
+                end_point=_absolute_point(end, origin),
+            )
+            for (
+                severity,
+                message,
+                class_name,
+                selector,
+                is_class_method,
+                rule_id,
+                start,
+                end,
+            ) in stored
+        ]
+
+    def put(self, key: tuple, ctx: MethodContext, issues: list[LintIssue]) -> None:
+        if not self.enabled:
+            return
+        origin = tuple(ctx.node.start_point)
+        stored = tuple(
+            (
+                issue.severity,
+                issue.message,
+                issue.class_name,
+                issue.selector,
+                issue.is_class_method,
+                issue.rule_id,
+                _relative_point(issue.start_point, origin),
+                _relative_point(issue.end_point, origin),
+            )
+            for issue in issues
+        )
+        with self._lock:
+            self._entries[key] = (stored, ctx.capitalized_names)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all entries and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> dict[str, int | bool]:
+        with self._lock:
+            return {
+                "enabled": self.enabled,
+                "entries": len(self._entries),
+                "max_entries": self._max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+
+_METHOD_ISSUE_CACHE = MethodIssueCache()
+
+
+def method_issue_cache() -> MethodIssueCache:
+    """Return the process-wide method issue cache."""
+    return _METHOD_ISSUE_CACHE
+
+
+class TonelCSTLinter:
+    """Lints Tonel files for Smalltalk best practices using tree-sitter CST.
+
+    Method-level checks are the ``LintRule`` classes in ``method_rules``;
+    they share one walk of each method body and one ``MethodContext``.
+    Issues of methods seen before with the same source and class context
+    come from ``method_cache`` instead.
+    """
+
+    method_rules: tuple[type[LintRule], ...] = METHOD_RULES
+    method_cache: MethodIssueCache = _METHOD_ISSUE_CACHE
+
+    def __init__(self, index: "ProjectIndex | None" = None) -> None:
+        # With a project index, direct-access checks include inherited and
+        # extended classes' instance variables, and only project classes
+        # count as collaborators.
+        self.index = index
+
+    def lint(
+        self,
+        content: str,
+        progress: LintProgress | None = None,
+        changed: list[LineRange] | None = None,
+    ) -> LintResult:
+        return self.lint_tree(
+            _PARSER_POOL.parse(content.encode("utf-8")), progress, changed
+        )
+
+    def lint_tree(
+        self,
+        tree: Tree,
+        progress: LintProgress | None = None,
+        changed: list[LineRange] | None = None,
+    ) -> LintResult:
+        """Lint an already parsed tree (e.g. one kept by a document session).
+
+        If *progress* is given, it is called as ``progress(done, total,
+        new_issues)`` once after the class-level checks (with ``done`` 0) and
+        once after each method, so callers can report partial results.
+
+        If *changed* is given (see ``diff_line_ranges``), only the methods
+        overlapping those rows are checked.  A change before the first method
+        (the class definition or comment) runs the class-level checks and,
+        since ``#instVars`` may have changed, every method.
+        """
+        return LintResult(self._run_checks(tree.root_node, progress, changed))
+
+    def lint_from_file(
+        self, file_path: Path, progress: LintProgress | None = None
+    ) -> LintResult:
         try:
-            with open(file_path, encoding="utf-8") as f:
-                content = f.read()
-            return self.lint(content)
+            with open_source(file_path) as source:
+                if source.encoding_error is not None:
+                    row, column = source.encoding_error["point"]
+                    issue = LintIssue(
+                        "error",
+                        source.encoding_error["message"],
+                        rule_id="encoding-error",
+                        start_point=(row, column),
+                        end_point=(row, column + 1),
+                    )
+                    return LintResult([issue])
+                # Issues are built before the buffer (possibly a mmap) closes.
+                return self.lint_tree(_PARSER_POOL.parse(source.data), progress)
         except Exception as exc:
-            issue = LintIssue("error", f"Failed to read file: {exc}")
-            self.errors += 1
-            return [issue]
+            return LintResult(
+                [
+                    LintIssue(
+                        "error", f"Failed to read file: {exc}", rule_id="read-error"
+                    )
+                ]
+            )
 
-    def _run_checks(self, root) -> list[LintIssue]:
+    def _run_checks(
+        self,
+        root,
+        progress: LintProgress | None = None,
+        changed: list[LineRange] | None = None,
+    ) -> list[LintIssue]:
         issues: list[LintIssue] = []
-        class_name, inst_vars, class_vars, def_type = self._extract_class_info(root)
+        class_name, inst_vars, class_vars, definition = extract_class_info(root)
+        # Methods also see inherited variables; class-level checks only own ones.
+        method_inst_vars = (
+            self._indexed_inst_vars(class_name, inst_vars, definition)
+            if self.index is not None and class_name
+            else inst_vars
+        )
 
         method_nodes = [
             child for child in root.children if child.type == "method_definition"
         ]
+        if changed is not None:
+            header_end = method_nodes[0].start_point[0] if method_nodes else None
+            if header_end is None or any(start < header_end for start, _ in changed):
+                changed = None
+            else:
+                method_nodes = _overlapping_methods(method_nodes, changed)
+        methods = [MethodContext(node, method_inst_vars) for node in method_nodes]
+        cache = self.method_cache
+        keys = [
+            cache.make_key(self.method_rules, class_name, method_inst_vars, ctx.node)
+            if cache.enabled
+            else None
+            for ctx in methods
+        ]
+        cached = [
+            cache.get(key, ctx) if key is not None else None
+            for key, ctx in zip(keys, methods, strict=True)
+        ]
 
-        if class_name:
+        if class_name and changed is None:
             issues.extend(self._check_class_prefix(class_name))
             issues.extend(self._check_instance_variables(class_name, inst_vars))
             issues.extend(self._check_singleton_class_vars(class_name, class_vars))
-            if def_type == "class_definition":
+            if definition.type == "class_definition":
                 issues.extend(
-                    self._check_class_comment(root, class_name, inst_vars, method_nodes)
+                    self._check_class_comment(root, class_name, inst_vars, methods)
                 )
+            for issue in issues:
+                issue.locate(definition)
 
-        for method_node in method_nodes:
-            issues.extend(self._check_method(method_node, inst_vars))
+        total = len(methods)
+        if progress is not None:
+            progress(0, total, list(issues))
+
+        rules = [rule_class() for rule_class in self.method_rules]
+        for done, (ctx, key, method_issues) in enumerate(
+            zip(methods, keys, cached, strict=True), 1
+        ):
+            if method_issues is None:
+                method_issues = self._check_method(ctx, rules)
+                if key is not None:
+                    cache.put(key, ctx, method_issues)
+            issues.extend(method_issues)
+            if progress is not None:
+                progress(done, total, method_issues)
 
         return issues
 
-    def _extract_class_info(self, root) -> tuple[str, list[str], list[str], str]:
-        """Return (class_name, inst_vars, class_vars, def_type) from the source_file's definition node."""
-        for child in root.children:
-            if child.type != "definition":
-                continue
-            for def_child in child.children:
-                if def_child.type not in (
-                    "class_definition",
-                    "trait_definition",
-                    "extension_definition",
-                ):
-                    continue
-                for ston_child in def_child.children:
-                    if ston_child.type != "ston_map":
-                        continue
-                    name_val = _ston_map_get(ston_child, "#name")
-                    class_name = (
-                        _ston_symbol_text(name_val) if name_val is not None else ""
-                    )
-                    inst_vars = _extract_var_list(ston_child, "#instVars")
-                    class_vars = _extract_var_list(ston_child, "#classVars")
-                    return class_name or "", inst_vars, class_vars, def_child.type
-        return "", [], [], ""
+    def _check_method(
+        self, ctx: MethodContext, rules: list[LintRule]
+    ) -> list[LintIssue]:
+        """Run *rules* on one method with a single query over its body."""
+        if ctx.body_node is None:
+            return []
+
+        active = [rule for rule in rules if rule.start(ctx)]
+        handlers: dict[str, list[LintRule]] = {}
+        for rule in active:
+            for node_type in rule.node_types:
+                handlers.setdefault(node_type, []).append(rule)
+
+        selectors = frozenset().union(*(rule.selectors for rule in active))
+        if handlers or selectors:
+            query = _rule_query(frozenset(handlers), selectors)
+            visits = []
+            sends: dict[int, Node] = {}
+            for _, captures in QueryCursor(query).matches(ctx.body_node):
+                if "send" in captures:
+                    send = captures["send"][0]
+                    sends[send.id] = send
+                elif "block" in captures:
+                    ctx.blocks.append(captures["block"][0])
+                else:
+                    visits.append(captures["node"][0])
+            for send in sends.values():
+                ctx.add_send(send)
+            ctx.blocks.sort(key=lambda block: block.start_byte)
+            # Visit once the blocks are known, so scope can be resolved.
+            for node in visits:
+                for rule in handlers[node.type]:
+                    rule.visit(node, ctx)
+
+        issues: list[LintIssue] = []
+        for rule in active:
+            for issue in rule.finish(ctx):
+                issue.rule_id = issue.rule_id or rule.rule_id
+                issues.append(issue.locate(ctx.node))
+        return issues
+
+    def _indexed_inst_vars(
+        self, class_name: str, inst_vars: list[str], definition: Node
+    ) -> list[str]:
+        """Add the instance variables the class has through the project index."""
+        assert self.index is not None
+        if definition.type == "extension_definition":
+            return list(self.index.inst_vars(class_name))
+        inherited = self.index.inherited_inst_vars(class_name)
+        return inst_vars + [var for var in inherited if var not in inst_vars]
 
     def _check_class_prefix(self, class_name: str) -> list[LintIssue]:
         if class_name.startswith("BaselineOf") or class_name.endswith("Test"):
@@ -318,6 +1239,7 @@ class TonelCSTLinter:
                     "warning",
                     "No class prefix (consider adding project prefix)",
                     class_name=class_name,
+                    rule_id="class-prefix",
                 )
             ]
         return []
@@ -331,6 +1253,7 @@ class TonelCSTLinter:
                     "warning",
                     f"Too many instance variables: {len(inst_vars)} (consider splitting responsibilities)",
                     class_name=class_name,
+                    rule_id="too-many-instance-variables",
                 )
             ]
         return []
@@ -348,6 +1271,7 @@ class TonelCSTLinter:
                 "warning",
                 f"Class variable '{var}' looks like a singleton holder (use a class instance variable instead)",
                 class_name=class_name,
+                rule_id="singleton-class-variable",
             )
             for var in class_vars
             if var in self._SINGLETON_CLASS_VAR_NAMES
@@ -362,48 +1286,46 @@ class TonelCSTLinter:
     def _has_class_comment(self, root) -> bool:
         return any(child.type == "class_comment" for child in root.children)
 
-    def _estimate_collaborators(self, method_nodes, class_name: str) -> int:
+    def _estimate_collaborators(
+        self, methods: list[MethodContext], class_name: str
+    ) -> int:
         """Approximate the number of collaborator classes referenced from method bodies."""
         collaborators: set[str] = set()
-        for method_node in method_nodes:
-            body_node = None
-            for child in method_node.children:
-                if child.type == "method_body":
-                    body_node = child
-                    break
-            if body_node is None or not body_node.text:
-                continue
-            sanitized = _sanitize_body(body_node.text.decode("utf-8"))
-            for match in _CAPITALIZED_IDENTIFIER_RE.finditer(sanitized):
-                name = match.group(0)
-                if name != class_name:
-                    collaborators.add(name)
+        for ctx in methods:
+            collaborators |= ctx.capitalized_names
+        collaborators.discard(class_name)
+        if self.index is not None:
+            return sum(1 for name in collaborators if self.index.has_class(name))
         return len(collaborators)
 
     def _class_comment_score(
-        self, method_nodes, inst_vars: list[str], class_name: str, loc: int
+        self,
+        methods: list[MethodContext],
+        inst_vars: list[str],
+        class_name: str,
+        loc: int,
     ) -> float:
-        collaborators = self._estimate_collaborators(method_nodes, class_name)
-        return len(method_nodes) * 2 + len(inst_vars) * 3 + collaborators * 2 + loc / 50
+        collaborators = self._estimate_collaborators(methods, class_name)
+        return len(methods) * 2 + len(inst_vars) * 3 + collaborators * 2 + loc / 50
 
     def _check_class_comment(
         self,
         root,
         class_name: str,
         inst_vars: list[str],
-        method_nodes,
+        methods: list[MethodContext],
     ) -> list[LintIssue]:
         if class_name.startswith("BaselineOf") or class_name.endswith(
             _TEST_CLASS_SUFFIXES
         ):
             return []
-        if len(method_nodes) < self._CLASS_COMMENT_MIN_METHODS:
+        if len(methods) < self._CLASS_COMMENT_MIN_METHODS:
             return []
         if self._has_class_comment(root):
             return []
 
         loc = root.end_point[0] + 1
-        score = self._class_comment_score(method_nodes, inst_vars, class_name, loc)
+        score = self._class_comment_score(methods, inst_vars, class_name, loc)
         if score < self._CLASS_COMMENT_MODERATE_SCORE:
             return []
 
@@ -413,307 +1335,6 @@ class TonelCSTLinter:
                 "warning",
                 f"Missing class comment ({priority} priority, complexity score {score:.1f})",
                 class_name=class_name,
+                rule_id="missing-class-comment",
             )
         ]
-
-    def _check_method(self, method_def_node, inst_vars: list[str]) -> list[LintIssue]:
-        issues: list[LintIssue] = []
-
-        class_name, selector, is_class_method = "", "", False
-        method_ref_node = None
-        for child in method_def_node.children:
-            if child.type == "method_reference":
-                method_ref_node = child
-                class_name, selector, is_class_method = _parse_method_ref(child)
-                break
-
-        category = _get_method_category(method_def_node)
-
-        body_node = None
-        for child in method_def_node.children:
-            if child.type == "method_body":
-                body_node = child
-                break
-
-        if body_node is not None:
-            body_text = body_node.text.decode("utf-8") if body_node.text else ""
-            sanitized = _sanitize_body(body_text)
-            issues.extend(
-                self._check_method_length(
-                    body_text, class_name, selector, is_class_method, category
-                )
-            )
-            issues.extend(
-                self._check_direct_access(
-                    body_node,
-                    method_ref_node,
-                    class_name,
-                    selector,
-                    is_class_method,
-                    category,
-                    inst_vars,
-                )
-            )
-            issues.extend(
-                self._check_self_class_reference(
-                    sanitized,
-                    class_name,
-                    selector,
-                    is_class_method,
-                )
-            )
-            issues.extend(
-                self._check_iskindof_usage(
-                    sanitized,
-                    class_name,
-                    selector,
-                    is_class_method,
-                )
-            )
-            issues.extend(
-                self._check_nil_branching(
-                    sanitized,
-                    class_name,
-                    selector,
-                    is_class_method,
-                )
-            )
-            issues.extend(
-                self._check_empty_branching(
-                    sanitized,
-                    class_name,
-                    selector,
-                    is_class_method,
-                )
-            )
-            issues.extend(
-                self._check_collection_access(
-                    sanitized,
-                    class_name,
-                    selector,
-                    is_class_method,
-                )
-            )
-
-        return issues
-
-    def _check_method_length(
-        self,
-        body_text: str,
-        class_name: str,
-        selector: str,
-        is_class_method: bool,
-        category: str,
-    ) -> list[LintIssue]:
-        body_lines = len(body_text.strip().split("\n"))
-        is_special = any(
-            kw in category.lower()
-            for kw in ["building", "initialization", "testing", "data", "examples"]
-        )
-        limit = 40 if is_special else 15
-
-        if body_lines <= limit:
-            return []
-
-        if body_lines > 24 and limit == 15:
-            return [
-                LintIssue(
-                    "error",
-                    f"Method too long: {body_lines} lines (limit: {limit})",
-                    class_name=class_name,
-                    selector=selector,
-                    is_class_method=is_class_method,
-                )
-            ]
-        return [
-            LintIssue(
-                "warning",
-                f"Method long: {body_lines} lines (recommended: {limit})",
-                class_name=class_name,
-                selector=selector,
-                is_class_method=is_class_method,
-            )
-        ]
-
-    def _check_self_class_reference(
-        self,
-        sanitized: str,
-        class_name: str,
-        selector: str,
-        is_class_method: bool,
-    ) -> list[LintIssue]:
-        if not class_name:
-            return []
-
-        if not re.search(rf"\b{re.escape(class_name)}\b", sanitized):
-            return []
-
-        replacement = "self" if is_class_method else "self class"
-        return [
-            LintIssue(
-                "warning",
-                f"Direct reference to own class '{class_name}' (use {replacement} instead)",
-                class_name=class_name,
-                selector=selector,
-                is_class_method=is_class_method,
-            )
-        ]
-
-    def _check_iskindof_usage(
-        self,
-        sanitized: str,
-        class_name: str,
-        selector: str,
-        is_class_method: bool,
-    ) -> list[LintIssue]:
-        if not re.search(r"\bisKindOf\s*:", sanitized):
-            return []
-
-        return [
-            LintIssue(
-                "warning",
-                "Avoid isKindOf: checks (prefer isXxx predicate or polymorphism)",
-                class_name=class_name,
-                selector=selector,
-                is_class_method=is_class_method,
-            )
-        ]
-
-    def _check_branching(
-        self,
-        sanitized: str,
-        combined_re: re.Pattern[str],
-        combined_msg: str,
-        simple_patterns: list[tuple[re.Pattern[str], str, str]],
-        label: str,
-        class_name: str,
-        selector: str,
-        is_class_method: bool,
-    ) -> list[LintIssue]:
-        issues: list[LintIssue] = []
-        if combined_re.search(sanitized):
-            sanitized = combined_re.sub("", sanitized)
-            issues.append(
-                LintIssue(
-                    "warning",
-                    combined_msg,
-                    class_name=class_name,
-                    selector=selector,
-                    is_class_method=is_class_method,
-                )
-            )
-        for pat, bad, good in simple_patterns:
-            if pat.search(sanitized):
-                issues.append(
-                    LintIssue(
-                        "warning",
-                        f"Use {good} instead of {bad} ({label})",
-                        class_name=class_name,
-                        selector=selector,
-                        is_class_method=is_class_method,
-                    )
-                )
-        return issues
-
-    def _check_nil_branching(
-        self,
-        sanitized: str,
-        class_name: str,
-        selector: str,
-        is_class_method: bool,
-    ) -> list[LintIssue]:
-        return self._check_branching(
-            sanitized,
-            _NIL_COMBINED_RE,
-            "Use ifNil:ifNotNil: instead of isNil/notNil with ifTrue:ifFalse: (nil-safe branching)",
-            _NIL_SIMPLE_PATTERNS,
-            "nil-safe branching",
-            class_name,
-            selector,
-            is_class_method,
-        )
-
-    def _check_empty_branching(
-        self,
-        sanitized: str,
-        class_name: str,
-        selector: str,
-        is_class_method: bool,
-    ) -> list[LintIssue]:
-        return self._check_branching(
-            sanitized,
-            _EMPTY_COMBINED_RE,
-            "Use ifEmpty:ifNotEmpty: instead of isEmpty/notEmpty with ifTrue:ifFalse: (collection branching)",
-            _EMPTY_SIMPLE_PATTERNS,
-            "collection branching",
-            class_name,
-            selector,
-            is_class_method,
-        )
-
-    def _check_collection_access(
-        self,
-        sanitized: str,
-        class_name: str,
-        selector: str,
-        is_class_method: bool,
-    ) -> list[LintIssue]:
-        issues: list[LintIssue] = []
-
-        for pat, bad, good in _AT_NUMBER_PATTERNS:
-            if pat.search(sanitized):
-                issues.append(
-                    LintIssue(
-                        "warning",
-                        f"Use {good} instead of {bad} (idiomatic collection access)",
-                        class_name=class_name,
-                        selector=selector,
-                        is_class_method=is_class_method,
-                    )
-                )
-
-        if _AT_SIZE_RE.search(sanitized):
-            issues.append(
-                LintIssue(
-                    "warning",
-                    "Use last instead of at: <collection> size (idiomatic collection access)",
-                    class_name=class_name,
-                    selector=selector,
-                    is_class_method=is_class_method,
-                )
-            )
-
-        return issues
-
-    def _check_direct_access(
-        self,
-        body_node,
-        method_ref_node,
-        class_name: str,
-        selector: str,
-        is_class_method: bool,
-        category: str,
-        inst_vars: list[str],
-    ) -> list[LintIssue]:
-        if is_class_method or not inst_vars:
-            return []
-
-        cat_lower = category.lower()
-        is_accessing = re.search(r"(^|-)accessing($|-)", cat_lower) is not None
-        is_initializing = "initializ" in cat_lower
-        if is_accessing or is_initializing:
-            return []
-
-        excluded = _method_formal_names(method_ref_node) | _temporary_names(body_node)
-        accessed = _collect_direct_inst_var_accesses(body_node, inst_vars, excluded)
-
-        return [
-            LintIssue(
-                "warning",
-                f"Direct access to '{var}' (use self {var})",
-                class_name=class_name,
-                selector=selector,
-                is_class_method=is_class_method,
-            )
-            for var in sorted(accessed)
-        ]
@@ -2,67 +2,284 @@
 Tree-sitter based parsers for Tonel Smalltalk source code.
 """
 
+import threading
 import warnings
+import weakref
+from collections.abc import Callable, Iterator
+from functools import cache
 from typing import Any
 
-from tree_sitter import Parser
+from tree_sitter import Language, Node, Parser, Tree
 
-with warnings.catch_warnings():
-    warnings.simplefilter("ignore", DeprecationWarning)
-    import tree_sitter_tonel_smalltalk as ts_tonel
+from smalltalk_validator_mcp_server.source import open_source
 
-    _LANGUAGE = ts_tonel.language()
+
+@cache
+def _language() -> Language:
+    """Return the Tonel language, loading the grammar on first use."""
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", DeprecationWarning)
+        import tree_sitter_tonel_smalltalk as ts_tonel
+
+        return ts_tonel.language()
 
 
 def _make_parser() -> Parser:
-    return Parser(_LANGUAGE)
-
-
-def _is_inside_method_body(node) -> bool:
-    """Return True if node is a descendant of a method_body node."""
-    current = node.parent
-    while current:
-        if current.type == "method_body":
-            return True
-        current = current.parent
-    return False
-
-
-def _resolve_context(node) -> str | None:
-    """Walk up to the enclosing method_definition and return its reference text."""
-    current = node.parent
-    while current:
-        if current.type == "method_definition":
-            for child in current.children:
-                if child.type == "method_reference":
-                    return child.text.decode("utf-8") if child.text else None
-        current = current.parent
+    return Parser(_language())
+
+
+class _PooledParser:
+    """Holder for a thread's cached parser; finalized when the thread goes away."""
+
+    __slots__ = ("parser", "__weakref__")
+
+    def __init__(self, parser: Parser) -> None:
+        self.parser = parser
+
+
+class ParserPool:
+    """Bounded pool of reusable tree-sitter parsers shared by all tool paths.
+
+    Each thread leases its own parser on first use and keeps it for later
+    calls, so the hot path is a thread-local lookup with no locking.  At most
+    ``max_size`` parsers are cached at once; threads beyond that get a
+    throw-away parser.  A parser whose ``parse`` raised is reset and dropped
+    rather than reused, and a thread's lease is released when it exits.
+    """
+
+    def __init__(self, max_size: int = 32) -> None:
+        self._max_size = max_size
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._size = 0
+        self.created = 0
+
+    def parse(self, source: bytes, old_tree: Tree | None = None) -> Tree:
+        """Parse *source* with this thread's pooled parser."""
+        slot = getattr(self._local, "slot", None)
+        parser = slot.parser if slot is not None else self._lease()
+        try:
+            if old_tree is None:
+                return parser.parse(source)
+            return parser.parse(source, old_tree)
+        except BaseException:
+            parser.reset()
+            self._local.slot = None
+            raise
+
+    def size(self) -> int:
+        """Return the number of parsers currently leased to threads."""
+        with self._lock:
+            return self._size
+
+    def _lease(self) -> Parser:
+        parser = _make_parser()
+        with self._lock:
+            self.created += 1
+            if self._size >= self._max_size:
+                return parser
+            self._size += 1
+        slot = _PooledParser(parser)
+        weakref.finalize(slot, self._release)
+        self._local.slot = slot
+        return parser
+
+    def _release(self) -> None:
+        with self._lock:
+            self._size -= 1
+
+
+_PARSER_POOL = ParserPool()
+
+
+def parser_pool() -> ParserPool:
+    """Return the process-wide parser pool."""
+    return _PARSER_POOL
+
+
+_ERROR_NODE_TYPES = ("ERROR", "MISSING")
+
+# Default limits that keep error payloads small for badly broken input.
+DEFAULT_MAX_ERRORS = 100
+DEFAULT_MAX_SNIPPET_BYTES = 512
+
+
+def _walk(
+    node, descend: Callable[[Node], bool] | None = None
+) -> Iterator[tuple[Node, int]]:
+    """Yield ``(node, depth)`` for *node* and its descendants in document order.
+
+    Uses a single TreeCursor, so deep trees need neither recursion nor
+    per-level list copies.  When *descend* is given, the children of a node
+    are only visited if ``descend(node)`` is true.
+    """
+    cursor = node.walk()
+    depth = 0
+    while True:
+        current = cursor.node
+        yield current, depth
+        if (descend is None or descend(current)) and cursor.goto_first_child():
+            depth += 1
+            continue
+        while not cursor.goto_next_sibling():
+            if depth == 0 or not cursor.goto_parent():
+                return
+            depth -= 1
+
+
+def _find_first(node, node_type: str):
+    """Return the first node of *node_type* at or below *node*, or None."""
+    for current, _ in _walk(node):
+        if current.type == node_type:
+            return current
+    return None
+
+
+def _method_reference_text(method_def_node) -> str | None:
+    for child in method_def_node.children:
+        if child.type == "method_reference":
+            return child.text.decode("utf-8") if child.text else None
     return None
 
 
+def _iter_errors(
+    node, ignore_method_body: bool = False
+) -> Iterator[tuple[Node, str | None, str | None]]:
+    """Yield ``(error_node, parent_type, context)`` for ERROR/MISSING nodes.
+
+    The parent type and the enclosing method_reference text are tracked per
+    depth while descending, so no error has to walk back up the tree.  Only
+    subtrees whose ``has_error`` flag is set are entered, so the cost tracks
+    the number of errors rather than the size of the file.  ERROR nodes are
+    not entered either: nested errors lie within the range already reported
+    by the outer one.  With *ignore_method_body*, method_body subtrees are
+    not entered at all.
+    """
+    if not node.has_error:
+        return
+    start_parent = node.parent
+    # ancestors[d] holds (type, context) of the parent of a node at depth d.
+    ancestors: list[tuple[str | None, str | None]] = [
+        (start_parent.type if start_parent else None, None)
+    ]
+
+    def descend(current) -> bool:
+        if not current.has_error or current.type == "ERROR":
+            return False
+        return not (ignore_method_body and current.type == "method_body")
+
+    for current, depth in _walk(node, descend):
+        del ancestors[depth + 1 :]
+        parent_type, context = ancestors[depth]
+        node_type = current.type
+        if node_type in _ERROR_NODE_TYPES:
+            yield current, parent_type, context
+        elif node_type == "method_definition":
+            context = _method_reference_text(current)
+        ancestors.append((node_type, context))
+
+
+def _error_snippet(node, max_snippet_bytes: int | None) -> tuple[str, bool]:
+    """Return the (possibly shortened) text of *node* and whether it was cut."""
+    if (
+        max_snippet_bytes is None
+        or node.end_byte - node.start_byte <= max_snippet_bytes
+    ):
+        return (node.text.decode("utf-8") if node.text else ""), False
+    # "ignore" drops a multi-byte character split by the cut.
+    return node.text[:max_snippet_bytes].decode("utf-8", "ignore"), True
+
+
 def _make_error_dict(
-    node, row_offset: int = 0, context: str | None = None
+    node,
+    parent_type: str | None,
+    row_offset: int = 0,
+    context: str | None = None,
+    max_snippet_bytes: int | None = None,
 ) -> dict[str, Any]:
-    """Build a structured error dict from an ERROR/MISSING node."""
-    return {
+    """Build a structured error dict from an ERROR/MISSING node.
+
+    The text is cut to *max_snippet_bytes*, in which case the dict gets a
+    ``text_truncated`` flag.
+    """
+    text, text_truncated = _error_snippet(node, max_snippet_bytes)
+    error = {
         "type": node.type,
         "start_point": [node.start_point[0] - row_offset, node.start_point[1]],
         "end_point": [node.end_point[0] - row_offset, node.end_point[1]],
-        "text": node.text.decode("utf-8") if node.text else "",
-        "parent_type": node.parent.type if node.parent else None,
+        "text": text,
+        "parent_type": parent_type,
         "context": context,
     }
+    if text_truncated:
+        error["text_truncated"] = True
+    return error
+
+
+def _limit_errors(
+    found: Iterator[tuple[Node, str | None, str | None]],
+    max_errors: int | None,
+    max_snippet_bytes: int | None,
+    row_offset: int = 0,
+    with_context: bool = True,
+) -> tuple[list[dict[str, Any]], bool]:
+    """Build at most *max_errors* error dicts; return them and a truncated flag."""
+    errors = []
+    truncated = False
+    for error_node, parent_type, context in found:
+        if max_errors is not None and len(errors) >= max_errors:
+            truncated = True
+            break
+        error = _make_error_dict(
+            error_node,
+            parent_type,
+            row_offset=row_offset,
+            context=context if with_context else None,
+            max_snippet_bytes=max_snippet_bytes,
+        )
+        truncated = truncated or "text_truncated" in error
+        errors.append(error)
+    return errors, truncated
+
+
+def _validation_result(
+    errors: list[dict[str, Any]], truncated: bool = False
+) -> dict[str, Any]:
+    # A truncated result found at least one error, even if none is listed
+    # (max_errors may cut every error).
+    result: dict[str, Any] = {"valid": not errors and not truncated, "errors": errors}
+    if truncated:
+        result["truncated"] = True
+    return result
+
+
+def _make_encoding_error_dict(encoding_error: dict[str, Any]) -> dict[str, Any]:
+    """Build a structured error dict for an invalid UTF-8 sequence."""
+    row, column = encoding_error["point"]
+    return {
+        "type": "ENCODING",
+        "start_point": [row, column],
+        "end_point": [row, column + 1],
+        "text": "",
+        "parent_type": None,
+        "context": None,
+        "message": encoding_error["message"],
+    }
+
 
+def _collect_errors(
+    node,
+    ignore_method_body: bool = False,
+    max_errors: int | None = None,
+    max_snippet_bytes: int | None = None,
+) -> tuple[list[dict[str, Any]], bool]:
+    """Collect ERROR/MISSING nodes from the CST as structured error dicts.
 
-def _collect_errors(node, ignore_method_body: bool = False) -> list[dict[str, Any]]:
-    """Collect ERROR/MISSING nodes from the CST, returning structured error dicts."""
-    errors: list[dict[str, Any]] = []
-    if node.type in ("ERROR", "MISSING"):
-        if not (ignore_method_body and _is_inside_method_body(node)):
-            errors.append(_make_error_dict(node, context=_resolve_context(node)))
-    for child in node.children:
-        errors.extend(_collect_errors(child, ignore_method_body))
-    return errors
+    Returns the error dicts and whether they were cut by the limits.
+    """
+    return _limit_errors(
+        _iter_errors(node, ignore_method_body), max_errors, max_snippet_bytes
+    )
 
 
 def _ston_map_get(ston_map_node, key: str):
@@ -126,21 +343,48 @@ class TonelTreeSitterParser:
     Args:
         ignore_method_body_errors: When True, errors inside method_body nodes
             are suppressed (equivalent to old TonelParser / tonel-only mode).
+        max_errors: Maximum number of errors reported (None for no limit).
+        max_snippet_bytes: Maximum bytes of source text per error (None for
+            no limit).
+
+    Results cut by either limit carry ``"truncated": True``.
     """
 
-    def __init__(self, ignore_method_body_errors: bool = False) -> None:
+    def __init__(
+        self,
+        ignore_method_body_errors: bool = False,
+        max_errors: int | None = DEFAULT_MAX_ERRORS,
+        max_snippet_bytes: int | None = DEFAULT_MAX_SNIPPET_BYTES,
+    ) -> None:
         self._ignore = ignore_method_body_errors
-        self._parser = _make_parser()
+        self._max_errors = max_errors
+        self._max_snippet_bytes = max_snippet_bytes
 
     def parse(self, content: str) -> dict[str, Any]:
-        tree = self._parser.parse(content.encode("utf-8"))
-        errors = _collect_errors(tree.root_node, self._ignore)
-        return {"valid": len(errors) == 0, "errors": errors}
+        return self.validate_tree(_PARSER_POOL.parse(content.encode("utf-8")))
+
+    def validate_tree(self, tree: Tree) -> dict[str, Any]:
+        """Validate an already parsed tree (e.g. one kept by a document session)."""
+        if not tree.root_node.has_error:
+            return {"valid": True, "errors": []}
+        errors, truncated = _collect_errors(
+            tree.root_node, self._ignore, self._max_errors, self._max_snippet_bytes
+        )
+        return _validation_result(errors, truncated)
 
     def parse_from_file(self, file_path: str) -> dict[str, Any]:
-        with open(file_path, encoding="utf-8") as f:
-            content = f.read()
-        return self.parse(content)
+        """Validate a file from its raw bytes, without decoding it to str.
+
+        Invalid UTF-8 is reported as a single error of type "ENCODING".
+        """
+        with open_source(file_path) as source:
+            if source.encoding_error is not None:
+                return {
+                    "valid": False,
+                    "errors": [_make_encoding_error_dict(source.encoding_error)],
+                }
+            # Error dicts are built before the buffer (possibly a mmap) closes.
+            return self.validate_tree(_PARSER_POOL.parse(source.data))
 
 
 # Synthetic Tonel wrapper for method-body-only validation.
@@ -148,38 +392,96 @@ class TonelTreeSitterParser:
 _METHOD_PREFIX = "Class { #name : #__Temp__ }\n\n__Temp__ >> __method__ [\n"
 _METHOD_PREFIX_ROWS = _METHOD_PREFIX.count("\n")  # == 3
 
+# Synthetic Tonel wrapper for batch validation: one method per body.
+_BATCH_PREFIX = b"Class { #name : #__Temp__ }\n\n"
+_BATCH_METHOD_HEADER = b"__Temp__ >> __method%d__ [\n"
+
 
 class SmalltalkMethodParser:
-    """Validates a standalone Smalltalk method body by wrapping it in synthetic Tonel."""
+    """Validates a standalone Smalltalk method body by wrapping it in synthetic Tonel.
 
-    def __init__(self) -> None:
-        self._parser = _make_parser()
+    Args:
+        max_errors: Maximum number of errors reported per body (None for no
+            limit).
+        max_snippet_bytes: Maximum bytes of source text per error (None for
+            no limit).
+    """
+
+    def __init__(
+        self,
+        max_errors: int | None = DEFAULT_MAX_ERRORS,
+        max_snippet_bytes: int | None = DEFAULT_MAX_SNIPPET_BYTES,
+    ) -> None:
+        self._max_errors = max_errors
+        self._max_snippet_bytes = max_snippet_bytes
 
     def parse(self, method_body_content: str) -> dict[str, Any]:
         wrapped = _METHOD_PREFIX + method_body_content + "\n]\n"
-        tree = self._parser.parse(wrapped.encode("utf-8"))
-        errors = self._method_body_errors(tree.root_node)
-        return {"valid": len(errors) == 0, "errors": errors}
-
-    def _method_body_errors(self, root) -> list[dict[str, Any]]:
+        tree = _PARSER_POOL.parse(wrapped.encode("utf-8"))
+        errors, truncated = self._method_body_errors(tree.root_node)
+        return _validation_result(errors, truncated)
+
+    def parse_many(self, method_bodies: list[str]) -> list[dict[str, Any]]:
+        """Validate several method bodies with a single parse.
+
+        The bodies are packed into one synthetic Tonel document, one method
+        per body, and errors are mapped back to each body's own rows.  A body
+        that breaks out of its method (e.g. an unmatched ``]`` or an
+        unterminated string) would shift the methods after it, so any body
+        whose method does not span exactly its own source is parsed alone.
+        """
+        chunks = [_BATCH_PREFIX]
+        spans: list[tuple[int, int, int]] = []
+        offset = len(_BATCH_PREFIX)
+        row = _BATCH_PREFIX.count(b"\n")
+        for index, body in enumerate(method_bodies):
+            header = _BATCH_METHOD_HEADER % index
+            method = header + body.encode("utf-8") + b"\n]\n\n"
+            chunks.append(method)
+            # (method start byte, method end byte, row of the body's first line)
+            spans.append((offset, offset + len(method) - 2, row + 1))
+            offset += len(method)
+            row += method.count(b"\n")
+
+        root = _PARSER_POOL.parse(b"".join(chunks)).root_node
+        if not root.has_error:
+            return [{"valid": True, "errors": []} for _ in method_bodies]
+
+        methods = {
+            child.start_byte: child
+            for child in root.children
+            if child.type == "method_definition"
+        }
+        results = []
+        for body, (start, end, body_row) in zip(method_bodies, spans, strict=True):
+            method = methods.get(start)
+            if method is None or method.end_byte != end:
+                results.append(self.parse(body))
+                continue
+            errors, truncated = self._method_body_errors(method, row_offset=body_row)
+            results.append(_validation_result(errors, truncated))
+        return results
+
+    def _method_body_errors(
+        self, root, row_offset: int = _METHOD_PREFIX_ROWS
+    ) -> tuple[list[dict[str, Any]], bool]:
+        if not root.has_error:
+            return [], False
         method_body = self._find_method_body(root)
         if method_body is None:
-            return []
-        return self._errors_under(method_body)
+            return [], False
+        return self._errors_under(method_body, row_offset)
 
     def _find_method_body(self, node):
-        if node.type == "method_body":
-            return node
-        for child in node.children:
-            result = self._find_method_body(child)
-            if result is not None:
-                return result
-        return None
-
-    def _errors_under(self, node) -> list[dict[str, Any]]:
-        errors: list[dict[str, Any]] = []
-        if node.type in ("ERROR", "MISSING"):
-            errors.append(_make_error_dict(node, row_offset=_METHOD_PREFIX_ROWS))
-        for child in node.children:
-            errors.extend(self._errors_under(child))
-        return errors
+        return _find_first(node, "method_body")
+
+    def _errors_under(
+        self, node, row_offset: int = _METHOD_PREFIX_ROWS
+    ) -> tuple[list[dict[str, Any]], bool]:
+        return _limit_errors(
+            _iter_errors(node),
+            self._max_errors,
+            self._max_snippet_bytes,
+            row_offset=row_offset,
+            with_context=False,
+        )
@@ -0,0 +1,269 @@
+"""
+SARIF 2.1.0 output for lint issues and validation errors.
+
+The log is written as results arrive: the run header and the rule table go
+out first, each file's results are appended as the file finishes, and the
+closing brackets are written last.  Nothing but counters is kept in memory,
+so reports for very large repositories can be streamed to disk.
+"""
+
+import json
+import os
+from importlib.metadata import PackageNotFoundError, version
+from pathlib import Path
+from typing import Any, TextIO
+from urllib.parse import quote
+
+from smalltalk_validator_mcp_server.source import open_source
+
+SARIF_VERSION = "2.1.0"
+SARIF_SCHEMA = "https://json.schemastore.org/sarif-2.1.0.json"
+TOOL_NAME = "smalltalk-validator"
+_INFORMATION_URI = "https://github.com/mumez/smalltalk-validator-mcp-server"
+_SRCROOT = "%SRCROOT%"
+
+# Stable rule ids with their short descriptions, in rule table order.  Lint
+# rule ids are those set by TonelCSTLinter (see docs/lint-checks.md); the
+# validation ids correspond to the ERROR, MISSING and ENCODING error types.
+RULES: tuple[tuple[str, str], ...] = (
+    ("syntax-error", "Source does not parse (ERROR node)"),
+    ("missing-node", "Parser had to insert missing syntax (MISSING node)"),
+    ("encoding-error", "Source is not valid UTF-8"),
+    ("read-error", "File could not be read or checked"),
+    ("class-prefix", "Class name without a project prefix"),
+    ("too-many-instance-variables", "Class declares more than 10 instance variables"),
+    ("singleton-class-variable", "Class variable used as a singleton holder"),
+    ("missing-class-comment", "Complex class without a class comment"),
+    ("method-length", "Method longer than recommended"),
+    ("direct-access", "Direct instance variable access outside accessors"),
+    ("self-class-reference", "Method refers to its own class by name"),
+    ("is-kind-of", "isKindOf: type check"),
+    ("nil-branching", "isNil/notNil with ifTrue:/ifFalse:"),
+    ("empty-branching", "isEmpty/notEmpty with ifTrue:/ifFalse:"),
+    ("collection-access", "at: with a dedicated accessor"),
+)
+_RULE_INDEX = {rule_id: index for index, (rule_id, _) in enumerate(RULES)}
+
+_ERROR_RULE_IDS = {
+    "ERROR": "syntax-error",
+    "MISSING": "missing-node",
+    "ENCODING": "encoding-error",
+}
+_MAX_MESSAGE_SNIPPET = 80
+
+
+def _tool_version() -> str | None:
+    try:
+        return version("smalltalk-validator-mcp-server")
+    except PackageNotFoundError:
+        return None
+
+
+def _non_ascii_lines(file_path: str | None) -> list[bytes] | None:
+    """Return the lines of *file_path* as the parser saw them.
+
+    Returns None when byte columns need no conversion: the file is ASCII,
+    or it cannot be read.
+    """
+    if not file_path:
+        return None
+    try:
+        with open_source(Path(file_path)) as source:
+            data = bytes(source.data)
+    except (OSError, UnicodeDecodeError):
+        return None
+    return None if data.isascii() else data.split(b"\n")
+
+
+def _column(point, lines: list[bytes] | None) -> int:
+    """Return the one-based code point column of a tree-sitter point."""
+    row, byte_column = point[0], point[1]
+    if lines is None or row >= len(lines):
+        return byte_column + 1
+    return len(lines[row][:byte_column].decode("utf-8", "replace")) + 1
+
+
+def _region(
+    start_point, end_point, lines: list[bytes] | None = None
+) -> dict[str, int] | None:
+    """Convert zero-based tree-sitter points to a one-based SARIF region.
+
+    Tree-sitter columns count UTF-8 bytes; with the file's *lines* they are
+    converted to code points.
+    """
+    if start_point is None:
+        return None
+    region = {
+        "startLine": start_point[0] + 1,
+        "startColumn": _column(start_point, lines),
+    }
+    if end_point is not None:
+        region["endLine"] = end_point[0] + 1
+        region["endColumn"] = _column(end_point, lines)
+    return region
+
+
+def _error_message(error: dict[str, Any]) -> str:
+    """Describe a validation error dict in one line."""
+    if error.get("message"):
+        return error["message"]
+    context = f" in {error['context']}" if error.get("context") else ""
+    if error["type"] == "MISSING":
+        return f"Missing syntax{context}"
+    lines = error.get("text", "").strip().splitlines()
+    snippet = lines[0][:_MAX_MESSAGE_SNIPPET] if lines else ""
+    return f"Syntax error{context}" + (f": {snippet}" if snippet else "")
+
+
+class SarifWriter:
+    """Writes one SARIF run to *out*, appending results as files finish.
+
+    File paths under *base_dir* (default: the working directory) are written
+    relative to ``%SRCROOT%``; other paths as absolute ``file:`` URIs.
+    Columns count Unicode code points; for files that are not ASCII, the
+    file is read again to convert tree-sitter's UTF-8 byte columns.  Call
+    ``close`` (or use the writer as a context manager) to finish the log.
+    """
+
+    def __init__(
+        self, out: TextIO, base_dir: str | None = None, tool_name: str = TOOL_NAME
+    ) -> None:
+        self._out = out
+        self._base_dir = Path(base_dir or os.getcwd()).resolve()
+        self.results_count = 0
+        self._closed = False
+
+        driver: dict[str, Any] = {"name": tool_name, "informationUri": _INFORMATION_URI}
+        tool_version = _tool_version()
+        if tool_version is not None:
+            driver["version"] = tool_version
+        driver["rules"] = [
+            {"id": rule_id, "shortDescription": {"text": description}}
+            for rule_id, description in RULES
+        ]
+        run_header = {
+            "tool": {"driver": driver},
+            "originalUriBaseIds": {
+                _SRCROOT: {"uri": self._base_dir.as_uri().rstrip("/") + "/"}
+            },
+            "columnKind": "unicodeCodePoints",
+        }
+        # Emit the run up to its (still open) results array.
+        header = json.dumps(
+            {"version": SARIF_VERSION, "$schema": SARIF_SCHEMA, "runs": [run_header]},
+            separators=(",", ":"),
+        )
+        self._out.write(header[: -len("}]}")] + ',"results":[\n')
+
+    def __enter__(self) -> "SarifWriter":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def add_lint_result(self, result: dict[str, Any]) -> None:
+        """Append the issues of a lint tool result."""
+        location = self._artifact_location(result.get("file_path"))
+        if not result.get("success", False):
+            self._add_failure(result, location)
+            return
+        issues = result["issue_list"]
+        lines = _non_ascii_lines(result.get("file_path")) if issues else None
+        for issue in issues:
+            entry = self._result(
+                issue.get("rule_id"),
+                issue["severity"],
+                issue["message"],
+                location,
+                _region(issue.get("start_point"), issue.get("end_point"), lines),
+            )
+            logical = self._logical_location(issue)
+            if logical is not None:
+                entry.setdefault("locations", [{}])[0]["logicalLocations"] = [logical]
+            self._write(entry)
+
+    def add_validation_result(self, result: dict[str, Any]) -> None:
+        """Append the errors of a validation tool result."""
+        location = self._artifact_location(result.get("file_path"))
+        if "error" in result:
+            self._add_failure(result, location)
+            return
+        errors = result.get("errors", ())
+        lines = _non_ascii_lines(result.get("file_path")) if errors else None
+        for error in errors:
+            self._write(
+                self._result(
+                    _ERROR_RULE_IDS.get(error["type"], "syntax-error"),
+                    "error",
+                    _error_message(error),
+                    location,
+                    _region(error.get("start_point"), error.get("end_point"), lines),
+                )
+            )
+
+    def close(self, properties: dict[str, Any] | None = None) -> None:
+        """Finish the log, recording *properties* (e.g. a summary) on the run."""
+        if self._closed:
+            return
+        self._closed = True
+        footer = "]"
+        if properties is not None:
+            footer += ',"properties":' + json.dumps(properties, separators=(",", ":"))
+        self._out.write(footer + "}]}\n")
+        self._out.flush()
+
+    def _add_failure(self, result: dict[str, Any], location) -> None:
+        message = result.get("error") or "File could not be checked"
+        self._write(self._result("read-error", "error", message, location, None))
+
+    def _result(
+        self,
+        rule_id: str | None,
+        severity: str,
+        message: str,
+        artifact_location: dict[str, str] | None,
+        region: dict[str, int] | None,
+    ) -> dict[str, Any]:
+        entry: dict[str, Any] = {
+            "ruleId": rule_id or "lint",
+            "level": "error" if severity == "error" else "warning",
+            "message": {"text": message},
+        }
+        if rule_id in _RULE_INDEX:
+            entry["ruleIndex"] = _RULE_INDEX[rule_id]
+        physical: dict[str, Any] = {}
+        if artifact_location is not None:
+            physical["artifactLocation"] = artifact_location
+        if region is not None:
+            physical["region"] = region
+        if physical:
+            entry["locations"] = [{"physicalLocation": physical}]
+        return entry
+
+    def _artifact_location(self, file_path: str | None) -> dict[str, str] | None:
+        if not file_path:
+            return None
+        path = Path(file_path).resolve()
+        try:
+            relative = path.relative_to(self._base_dir)
+        except ValueError:
+            return {"uri": path.as_uri()}
+        return {"uri": quote(relative.as_posix()), "uriBaseId": _SRCROOT}
+
+    @staticmethod
+    def _logical_location(issue: dict[str, Any]) -> dict[str, str] | None:
+        class_name = issue.get("class_name")
+        if not class_name:
+            return None
+        if not issue.get("selector"):
+            return {"fullyQualifiedName": class_name, "kind": "type"}
+        side = " class" if issue.get("is_class_method") else ""
+        return {
+            "fullyQualifiedName": f"{class_name}{side} >> {issue['selector']}",
+            "kind": "function",
+        }
+
+    def _write(self, entry: dict[str, Any]) -> None:
+        separator = ",\n" if self.results_count else ""
+        self._out.write(separator + json.dumps(entry, separators=(",", ":")))
+        self.results_count += 1
@@ -2,21 +2,209 @@
 MCP Server for validating Tonel formatted Smalltalk source code.
 """
 
+import argparse
+import functools
+import os
+import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from typing import Any
 
+import anyio.from_thread
+import anyio.lowlevel
 from fastmcp import Context, FastMCP
 from mcp.types import ToolAnnotations
+from starlette.requests import Request
+from starlette.responses import JSONResponse
 
 from .core import (
+    close_tonel_session_impl,
+    edit_tonel_session_impl,
+    index_tonel_project_impl,
+    lint_tonel_session_impl,
+    lint_tonel_smalltalk_changes_impl,
     lint_tonel_smalltalk_from_file_impl,
     lint_tonel_smalltalk_impl,
+    open_tonel_session_impl,
+    start_tonel_watch_impl,
+    stop_tonel_watch_impl,
+    tonel_watch_diagnostics_impl,
+    validate_smalltalk_method_bodies_impl,
     validate_smalltalk_method_body_impl,
+    validate_tonel_directory_impl,
+    validate_tonel_session_impl,
     validate_tonel_smalltalk_from_file_impl,
     validate_tonel_smalltalk_impl,
 )
+from .executor import (
+    ExecutorBusyError,
+    ToolExecutor,
+    default_kind,
+    default_max_queue,
+    default_timeout,
+    default_workers,
+)
+from .index import activate_project_index, configured_index_path
+from .session import _SESSION_STORE
+from .watch import DEFAULT_DEBOUNCE, DEFAULT_INTERVAL, watch_store
+from .workers import shutdown_process_pool
+
+TRANSPORTS = ("stdio", "http", "sse")
+
+# HTTP settings handed from main() to the app factory, which uvicorn calls
+# in each worker process.
+_HTTP_TRANSPORT_ENV = "SMALLTALK_VALIDATOR_HTTP_TRANSPORT"
+_HTTP_PATH_ENV = "SMALLTALK_VALIDATOR_HTTP_PATH"
+_HTTP_STATELESS_ENV = "SMALLTALK_VALIDATOR_HTTP_STATELESS"
+_HTTP_WORKERS_ENV = "SMALLTALK_VALIDATOR_HTTP_WORKERS"
+
+# Tools and resources whose state lives in one server process: document
+# sessions, directory watches and the project index set by
+# index_tonel_project.  They are left out when several HTTP workers serve
+# requests, since a client's next request may reach another worker.
+_PER_PROCESS_TAG = "per-process"
+
+_WATCH_RESOURCE_URI = "tonel-watch://{watch_id}/diagnostics"
+
+
+@asynccontextmanager
+async def _lifespan(_: FastMCP) -> AsyncIterator[dict[str, Any]]:
+    """Warm the tool executors on start-up and stop them on shutdown."""
+    await _FAST_EXECUTOR.warm_up()
+    await _HEAVY_EXECUTOR.warm_up()
+    try:
+        yield {}
+    finally:
+        watch_store().stop_all()
+        _FAST_EXECUTOR.shutdown(wait=False)
+        _HEAVY_EXECUTOR.shutdown(wait=False)
+        _DIRECTORY_EXECUTOR.shutdown(wait=False)
+        shutdown_process_pool()
+
 
 # FastMCP app setup
-app = FastMCP("smalltalk-validator-mcp-server")
+app = FastMCP("smalltalk-validator-mcp-server", lifespan=_lifespan)
+
+# Minimum seconds between progress notifications for one tool call.
+_PROGRESS_INTERVAL = 0.2
+
+# Content up to this size is checked on the fast lane.
+_FAST_LANE_MAX_BYTES = 64 * 1024
+_FAST_LANE_WORKERS = 2
+_DIRECTORY_LANE_WORKERS = 2
+
+# Tool work runs on two bounded executors so that quick requests (method
+# bodies, sessions, small content) are not stuck behind large file lints.
+# The fast lane always uses threads: sessions live in this process.
+_FAST_EXECUTOR = ToolExecutor(
+    "thread",
+    max_workers=_FAST_LANE_WORKERS,
+    max_queue=default_max_queue(),
+    timeout=default_timeout(),
+    name="fast",
+)
+_HEAVY_EXECUTOR = ToolExecutor(
+    default_kind(),
+    max_workers=default_workers(),
+    max_queue=default_max_queue(),
+    timeout=default_timeout(),
+    name="heavy",
+)
+# Directory tools fan their files out over the shared process pool, so they
+# run on threads: starting that pool inside a process worker would nest
+# pools, which do not shut down cleanly.
+_DIRECTORY_EXECUTOR = ToolExecutor(
+    "thread",
+    max_workers=_DIRECTORY_LANE_WORKERS,
+    max_queue=default_max_queue(),
+    timeout=default_timeout(),
+    name="directory",
+)
+
+
+class _ProgressRelay:
+    """Forwards core progress callbacks from a worker thread to the MCP client.
+
+    Progress is sent with ``ctx.report_progress``; partial results gathered
+    since the last update are sent alongside as an info log message whose
+    ``extra`` holds the batch, so clients can act before the run finishes.
+    Updates are throttled to one per ``_PROGRESS_INTERVAL`` seconds, except
+    for the final one.
+    """
+
+    def __init__(self, ctx: Context, unit: str) -> None:
+        self._ctx = ctx
+        self._unit = unit
+        self._token = anyio.lowlevel.current_token()
+        self._pending: list[dict[str, Any]] = []
+        self._last_sent = 0.0
+        self.closed = False
+
+    def __call__(self, done: int, total: int, batch: list[dict[str, Any]]) -> None:
+        if self.closed:
+            return
+        self._pending.extend(batch)
+        now = time.monotonic()
+        if done < total and now - self._last_sent < _PROGRESS_INTERVAL:
+            return
+        self._last_sent = now
+        pending, self._pending = self._pending, []
+        anyio.from_thread.run(self._send, done, total, pending, token=self._token)
+
+    async def _send(self, done: int, total: int, batch: list[dict[str, Any]]) -> None:
+        await self._ctx.report_progress(done, total, f"{done}/{total} {self._unit}")
+        if batch:
+            await self._ctx.info(
+                f"Partial results: {len(batch)} item(s) after {done}/{total} {self._unit}",
+                logger_name="smalltalk-validator",
+                extra={"done": done, "total": total, "partial_results": batch},
+            )
+
+
+def _lane_for(content: str) -> ToolExecutor:
+    """Return the executor for content of this size."""
+    if len(content) <= _FAST_LANE_MAX_BYTES:
+        return _FAST_EXECUTOR
+    return _HEAVY_EXECUTOR
+
+
+async def _offload(
+    executor: ToolExecutor,
+    func,
+    *args,
+    ctx: Context | None = None,
+    unit: str = "",
+    status_key: str = "success",
+) -> dict[str, Any]:
+    """Run a core function on *executor*, relaying its progress to *ctx*.
+
+    Progress is only relayed by thread executors.  When the executor is
+    saturated or the call times out, an error result is returned instead,
+    with *status_key* ("valid" for validation tools) set to False.
+    """
+    relay = None
+    kwargs: dict[str, Any] = {}
+    if ctx is not None and executor.kind == "thread":
+        relay = kwargs["progress"] = _ProgressRelay(ctx, unit)
+    try:
+        return await executor.run(func, *args, **kwargs)
+    except ExecutorBusyError as e:
+        return {
+            status_key: False,
+            "busy": True,
+            "error": str(e),
+            "exception": type(e).__name__,
+        }
+    except TimeoutError as e:
+        return {
+            status_key: False,
+            "timed_out": True,
+            "error": str(e),
+            "exception": type(e).__name__,
+        }
+    finally:
+        if relay is not None:
+            relay.closed = True
 
 
 @app.tool(
@@ -29,7 +217,7 @@ app = FastMCP("smalltalk-validator-mcp-server")
         openWorldHint=False,
     ),
 )
-def validate_tonel_smalltalk_from_file(
+async def validate_tonel_smalltalk_from_file(
     _: Context, file_path: str, options: dict[str, Any] | None = None
 ) -> dict[str, Any]:
     """
@@ -39,11 +227,67 @@ def validate_tonel_smalltalk_from_file(
         file_path: Path to the Tonel file to validate
         options: Optional validation options
             - without-method-body: If true, only validates tonel structure
+            - max-errors: Maximum number of errors reported (default 100)
+            - max-snippet-bytes: Maximum bytes of source text per error
+              (default 512)
 
     Returns:
         Dictionary with validation results including success status and error details
     """
-    return validate_tonel_smalltalk_from_file_impl(file_path, options)
+    return await _offload(
+        _HEAVY_EXECUTOR,
+        validate_tonel_smalltalk_from_file_impl,
+        file_path,
+        options,
+        status_key="valid",
+    )
+
+
+@app.tool(
+    "validate_tonel_directory",
+    annotations=ToolAnnotations(
+        title="Validate Tonel Directory",
+        readOnlyHint=True,
+        destructiveHint=False,
+        idempotentHint=True,
+        openWorldHint=False,
+    ),
+)
+async def validate_tonel_directory(
+    ctx: Context,
+    target: str,
+    options: dict[str, Any] | None = None,
+    max_workers: int | None = None,
+) -> dict[str, Any]:
+    """
+    Validate every Tonel file in a directory or matching a glob pattern, in parallel.
+
+    Progress is reported per file, and file results are streamed as log
+    messages while the run is in progress.
+
+    Args:
+        target: Directory (searched recursively for *.st files) or glob pattern
+        options: Optional validation options applied to every file
+            - without-method-body: If true, only validates tonel structure
+            - max-errors: Maximum number of errors reported (default 100)
+            - max-snippet-bytes: Maximum bytes of source text per error
+              (default 512)
+        max_workers: Number of worker processes (defaults to and is capped at
+            the CPU count)
+
+    Returns:
+        Dictionary with aggregated results and per-file results with timings
+    """
+    return await _offload(
+        _DIRECTORY_EXECUTOR,
+        validate_tonel_directory_impl,
+        target,
+        options,
+        max_workers,
+        ctx=ctx,
+        unit="files",
+        status_key="valid",
+    )
 
 
 @app.tool(
@@ -56,7 +300,7 @@ def validate_tonel_smalltalk_from_file(
         openWorldHint=False,
     ),
 )
-def validate_tonel_smalltalk(
+async def validate_tonel_smalltalk(
     _: Context, file_content: str, options: dict[str, Any] | None = None
 ) -> dict[str, Any]:
     """
@@ -66,11 +310,20 @@ def validate_tonel_smalltalk(
         file_content: The Tonel file content as a string
         options: Optional validation options
             - without-method-body: If true, only validates tonel structure
+            - max-errors: Maximum number of errors reported (default 100)
+            - max-snippet-bytes: Maximum bytes of source text per error
+              (default 512)
 
     Returns:
         Dictionary with validation results including success status and error details
     """
-    return validate_tonel_smalltalk_impl(file_content, options)
+    return await _offload(
+        _lane_for(file_content),
+        validate_tonel_smalltalk_impl,
+        file_content,
+        options,
+        status_key="valid",
+    )
 
 
 @app.tool(
@@ -83,7 +336,7 @@ def validate_tonel_smalltalk(
         openWorldHint=False,
     ),
 )
-def validate_smalltalk_method_body(
+async def validate_smalltalk_method_body(
     _: Context, method_body_content: str
 ) -> dict[str, Any]:
     """
@@ -95,7 +348,46 @@ def validate_smalltalk_method_body(
     Returns:
         Dictionary with validation results including success status and error details
     """
-    return validate_smalltalk_method_body_impl(method_body_content)
+    return await _offload(
+        _FAST_EXECUTOR,
+        validate_smalltalk_method_body_impl,
+        method_body_content,
+        status_key="valid",
+    )
+
+
+@app.tool(
+    "validate_smalltalk_method_bodies",
+    annotations=ToolAnnotations(
+        title="Validate Smalltalk Method Bodies",
+        readOnlyHint=True,
+        destructiveHint=False,
+        idempotentHint=True,
+        openWorldHint=False,
+    ),
+)
+async def validate_smalltalk_method_bodies(
+    _: Context, method_bodies: list[str]
+) -> dict[str, Any]:
+    """
+    Validate several Smalltalk method bodies for syntax correctness at once.
+
+    All bodies are checked in a single parse; use this instead of calling
+    validate_smalltalk_method_body once per method.
+
+    Args:
+        method_bodies: The Smalltalk method bodies to validate
+
+    Returns:
+        Dictionary with overall validity and one result per body (in input
+        order, with its index) whose error positions are relative to that body
+    """
+    return await _offload(
+        _FAST_EXECUTOR,
+        validate_smalltalk_method_bodies_impl,
+        method_bodies,
+        status_key="valid",
+    )
 
 
 @app.tool(
@@ -108,17 +400,74 @@ def validate_smalltalk_method_body(
         openWorldHint=False,
     ),
 )
-def lint_tonel_smalltalk_from_file(_: Context, file_path: str) -> dict[str, Any]:
+async def lint_tonel_smalltalk_from_file(
+    ctx: Context, file_path: str
+) -> dict[str, Any]:
     """
     Lint Tonel formatted Smalltalk source code from a file.
 
+    Progress is reported per method, and issues are streamed as log messages
+    while linting is in progress.
+
     Args:
         file_path: Path to the Tonel file to lint
 
     Returns:
         Dictionary with lint results including issues found
     """
-    return lint_tonel_smalltalk_from_file_impl(file_path)
+    lint = lint_tonel_smalltalk_from_file_impl
+    index_path = configured_index_path()
+    if index_path is not None:
+        # Passed on since process workers do not see later index changes.
+        lint = functools.partial(lint, index_path=index_path)
+    return await _offload(
+        _HEAVY_EXECUTOR,
+        lint,
+        file_path,
+        ctx=ctx,
+        unit="methods",
+    )
+
+
+@app.tool(
+    "index_tonel_project",
+    tags={_PER_PROCESS_TAG},
+    annotations=ToolAnnotations(
+        title="Index Tonel Project",
+        readOnlyHint=False,
+        destructiveHint=False,
+        idempotentHint=True,
+        openWorldHint=False,
+    ),
+)
+async def index_tonel_project(
+    _: Context, directory: str, max_workers: int | None = None
+) -> dict[str, Any]:
+    """
+    Build or update the class index of a Tonel project for cross-file lint checks.
+
+    Classes, superclasses, instance and class variables and selectors of
+    every *.st file under the directory are indexed in parallel and saved;
+    later calls only re-parse changed files. Afterwards,
+    lint_tonel_smalltalk_from_file sees inherited instance variables and
+    extended classes, and counts only project classes as collaborators.
+    The index is not refreshed on its own: call this tool again after
+    changing class definitions.
+
+    Args:
+        directory: Project directory searched recursively for *.st files
+        max_workers: Number of worker processes (defaults to and is capped at
+            the CPU count)
+
+    Returns:
+        Dictionary with file and class counts and the index file path
+    """
+    result = await _offload(
+        _DIRECTORY_EXECUTOR, index_tonel_project_impl, directory, max_workers
+    )
+    if result.get("success"):
+        activate_project_index(result["index_path"])
+    return result
 
 
 @app.tool(
@@ -131,22 +480,420 @@ def lint_tonel_smalltalk_from_file(_: Context, file_path: str) -> dict[str, Any]
         openWorldHint=False,
     ),
 )
-def lint_tonel_smalltalk(_: Context, file_content: str) -> dict[str, Any]:
+async def lint_tonel_smalltalk(ctx: Context, file_content: str) -> dict[str, Any]:
     """
     Lint Tonel formatted Smalltalk source code from content string.
 
+    Progress is reported per method, and issues are streamed as log messages
+    while linting is in progress.
+
     Args:
         file_content: The Tonel file content as a string
 
     Returns:
         Dictionary with lint results including issues found
     """
-    return lint_tonel_smalltalk_impl(file_content)
+    return await _offload(
+        _lane_for(file_content),
+        lint_tonel_smalltalk_impl,
+        file_content,
+        ctx=ctx,
+        unit="methods",
+    )
+
+
+@app.tool(
+    "lint_tonel_smalltalk_changes",
+    annotations=ToolAnnotations(
+        title="Lint Changed Tonel Smalltalk Methods",
+        readOnlyHint=True,
+        destructiveHint=False,
+        idempotentHint=True,
+        openWorldHint=False,
+    ),
+)
+async def lint_tonel_smalltalk_changes(
+    ctx: Context,
+    file_content: str,
+    diff: str | None = None,
+    old_content: str | None = None,
+) -> dict[str, Any]:
+    """
+    Lint only the methods of Tonel content that a change touched.
+
+    Give either a unified diff that produced file_content or the previous
+    content. Changing the class definition or comment lints the whole file.
+
+    Args:
+        file_content: The new Tonel file content as a string
+        diff: Unified diff of this file whose result is file_content
+        old_content: The previous content, used when no diff is given
+
+    Returns:
+        Dictionary with lint results for the changed methods and the changed
+        line ranges
+    """
+    return await _offload(
+        _lane_for(file_content),
+        lint_tonel_smalltalk_changes_impl,
+        file_content,
+        diff,
+        old_content,
+        ctx=ctx,
+        unit="methods",
+    )
+
+
+@app.tool(
+    "open_tonel_session",
+    tags={_PER_PROCESS_TAG},
+    annotations=ToolAnnotations(
+        title="Open Tonel Document Session",
+        readOnlyHint=False,
+        destructiveHint=False,
+        idempotentHint=False,
+        openWorldHint=False,
+    ),
+)
+async def open_tonel_session(_: Context, file_content: str) -> dict[str, Any]:
+    """
+    Open a document session holding Tonel content for incremental edits.
+
+    Use edit_tonel_session to change the document, then validate_tonel_session
+    or lint_tonel_session to check it without re-sending the whole file.
+    Sessions expire when idle.
+
+    Args:
+        file_content: The initial Tonel file content as a string
+
+    Returns:
+        Dictionary with the new session id
+    """
+    return await _offload(_FAST_EXECUTOR, open_tonel_session_impl, file_content)
+
+
+@app.tool(
+    "edit_tonel_session",
+    tags={_PER_PROCESS_TAG},
+    annotations=ToolAnnotations(
+        title="Edit Tonel Document Session",
+        readOnlyHint=False,
+        destructiveHint=False,
+        idempotentHint=False,
+        openWorldHint=False,
+    ),
+)
+async def edit_tonel_session(
+    _: Context, session_id: str, edits: list[dict[str, Any]]
+) -> dict[str, Any]:
+    """
+    Apply range edits to a document session; only changed regions are re-parsed.
+
+    Args:
+        session_id: Id returned by open_tonel_session
+        edits: Edits applied in order, each relative to the previous result
+            - start: [line, character] (0-based) where the replaced range starts
+            - end: [line, character] (0-based) where the replaced range ends
+            - text: Replacement text
+
+    Returns:
+        Dictionary with the new content length and the changed ranges
+    """
+    return await _offload(_FAST_EXECUTOR, edit_tonel_session_impl, session_id, edits)
+
+
+@app.tool(
+    "validate_tonel_session",
+    tags={_PER_PROCESS_TAG},
+    annotations=ToolAnnotations(
+        title="Validate Tonel Document Session",
+        readOnlyHint=True,
+        destructiveHint=False,
+        idempotentHint=True,
+        openWorldHint=False,
+    ),
+)
+async def validate_tonel_session(
+    _: Context, session_id: str, options: dict[str, Any] | None = None
+) -> dict[str, Any]:
+    """
+    Validate the current content of a document session.
+
+    Args:
+        session_id: Id returned by open_tonel_session
+        options: Optional validation options
+            - without-method-body: If true, only validates tonel structure
+            - max-errors: Maximum number of errors reported (default 100)
+            - max-snippet-bytes: Maximum bytes of source text per error
+              (default 512)
+
+    Returns:
+        Dictionary with validation results including success status and error details
+    """
+    return await _offload(
+        _FAST_EXECUTOR,
+        validate_tonel_session_impl,
+        session_id,
+        options,
+        status_key="valid",
+    )
+
+
+@app.tool(
+    "lint_tonel_session",
+    tags={_PER_PROCESS_TAG},
+    annotations=ToolAnnotations(
+        title="Lint Tonel Document Session",
+        readOnlyHint=True,
+        destructiveHint=False,
+        idempotentHint=True,
+        openWorldHint=False,
+    ),
+)
+async def lint_tonel_session(_: Context, session_id: str) -> dict[str, Any]:
+    """
+    Lint the current content of a document session.
+
+    Args:
+        session_id: Id returned by open_tonel_session
+
+    Returns:
+        Dictionary with lint results including issues found
+    """
+    return await _offload(_FAST_EXECUTOR, lint_tonel_session_impl, session_id)
+
+
+@app.tool(
+    "close_tonel_session",
+    tags={_PER_PROCESS_TAG},
+    annotations=ToolAnnotations(
+        title="Close Tonel Document Session",
+        readOnlyHint=False,
+        destructiveHint=False,
+        idempotentHint=True,
+        openWorldHint=False,
+    ),
+)
+async def close_tonel_session(_: Context, session_id: str) -> dict[str, Any]:
+    """
+    Close a document session and release its parsed tree.
+
+    Args:
+        session_id: Id returned by open_tonel_session
+
+    Returns:
+        Dictionary with success status
+    """
+    return await _offload(_FAST_EXECUTOR, close_tonel_session_impl, session_id)
+
+
+@app.tool(
+    "watch_tonel_directory",
+    tags={_PER_PROCESS_TAG},
+    annotations=ToolAnnotations(
+        title="Watch Tonel Directory",
+        readOnlyHint=False,
+        destructiveHint=False,
+        idempotentHint=False,
+        openWorldHint=False,
+    ),
+)
+async def watch_tonel_directory(
+    ctx: Context,
+    directory: str,
+    options: dict[str, Any] | None = None,
+    interval: float = DEFAULT_INTERVAL,
+    debounce: float = DEFAULT_DEBOUNCE,
+) -> dict[str, Any]:
+    """
+    Watch a directory and keep validation and lint results of its *.st files current.
+
+    Files are polled every `interval` seconds; a changed file is checked again
+    once it has been unchanged for `debounce` seconds.  The diagnostics are
+    published as the returned resource, and the client is sent a
+    resource-updated notification whenever they change.
+
+    Args:
+        directory: Directory searched recursively for *.st files
+        options: Optional validation options applied to every file
+            - without-method-body: If true, only validates tonel structure
+            - max-errors: Maximum number of errors reported per file
+            - max-snippet-bytes: Maximum bytes of source text per error
+        interval: Seconds between polls (default 1.0)
+        debounce: Seconds a file must stay unchanged before re-checking (default 0.5)
+
+    Returns:
+        Dictionary with the watch id and the diagnostics resource URI
+    """
+    session = ctx.session
+    token = anyio.lowlevel.current_token()
+
+    def notify(watch_id: str) -> None:
+        uri = _WATCH_RESOURCE_URI.format(watch_id=watch_id)
+        try:
+            anyio.from_thread.run(session.send_resource_updated, uri, token=token)
+        except Exception:
+            # The client disconnected or the server is shutting down.
+            pass
+
+    result = await _offload(
+        _FAST_EXECUTOR,
+        start_tonel_watch_impl,
+        directory,
+        options,
+        interval,
+        debounce,
+        notify,
+    )
+    if result.get("success"):
+        result["resource_uri"] = _WATCH_RESOURCE_URI.format(watch_id=result["watch_id"])
+    return result
+
+
+@app.tool(
+    "unwatch_tonel_directory",
+    tags={_PER_PROCESS_TAG},
+    annotations=ToolAnnotations(
+        title="Stop Watching Tonel Directory",
+        readOnlyHint=False,
+        destructiveHint=False,
+        idempotentHint=True,
+        openWorldHint=False,
+    ),
+)
+async def unwatch_tonel_directory(_: Context, watch_id: str) -> dict[str, Any]:
+    """
+    Stop a directory watch started by watch_tonel_directory.
 
+    Args:
+        watch_id: Id returned by watch_tonel_directory
+
+    Returns:
+        Dictionary with success status
+    """
+    return await _offload(_FAST_EXECUTOR, stop_tonel_watch_impl, watch_id)
 
-def main():
+
+@app.resource(
+    _WATCH_RESOURCE_URI,
+    name="tonel_watch_diagnostics",
+    description="Current validation and lint results of a watched directory",
+    mime_type="application/json",
+    tags={_PER_PROCESS_TAG},
+)
+def tonel_watch_diagnostics(watch_id: str) -> dict[str, Any]:
+    """Return the latest diagnostics of a directory watch."""
+    return tonel_watch_diagnostics_impl(watch_id)
+
+
+@app.custom_route("/health", methods=["GET"])
+async def health(_: Request) -> JSONResponse:
+    """Report that this worker is serving, with its executor load."""
+    return JSONResponse(
+        {
+            "status": "ok",
+            "pid": os.getpid(),
+            "sessions": len(_SESSION_STORE),
+            "watches": len(watch_store()),
+            "executors": {
+                executor.name: {
+                    "kind": executor.kind,
+                    "workers": executor.max_workers,
+                    "in_flight": executor.in_flight,
+                    "max_queue": executor.max_queue,
+                }
+                for executor in (_FAST_EXECUTOR, _HEAVY_EXECUTOR, _DIRECTORY_EXECUTOR)
+            },
+        }
+    )
+
+
+def http_app():
+    """Return the ASGI app for HTTP serving (uvicorn factory).
+
+    Settings are read from the environment set up by ``main``, since
+    uvicorn calls this in each worker process.  With several workers, the
+    per-process tools and resources are disabled.
+    """
+    if int(os.environ.get(_HTTP_WORKERS_ENV, "1")) > 1:
+        app.disable(tags={_PER_PROCESS_TAG})
+    return app.http_app(
+        path=os.environ.get(_HTTP_PATH_ENV, "/mcp"),
+        transport=os.environ.get(_HTTP_TRANSPORT_ENV, "http"),
+        stateless_http=os.environ.get(_HTTP_STATELESS_ENV) == "1",
+    )
+
+
+def _parse_args(argv: list[str] | None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="smalltalk-validator-mcp-server",
+        description="MCP server for validating and linting Tonel Smalltalk code.",
+    )
+    parser.add_argument(
+        "--transport",
+        choices=TRANSPORTS,
+        default="stdio",
+        help="stdio (default), streamable HTTP, or SSE",
+    )
+    parser.add_argument("--host", default="127.0.0.1", help="HTTP bind address")
+    parser.add_argument("--port", type=int, default=8000, help="HTTP port")
+    parser.add_argument(
+        "--path", default=None, help="MCP endpoint path (default /mcp, /sse for SSE)"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="HTTP worker processes; more than one implies --stateless and "
+        "leaves out the session, watch and index tools",
+    )
+    parser.add_argument(
+        "--stateless",
+        action="store_true",
+        help="serve each HTTP request without an MCP session",
+    )
+    parser.add_argument(
+        "--shutdown-timeout",
+        type=float,
+        default=30.0,
+        help="seconds to let in-flight requests finish on shutdown",
+    )
+    parser.add_argument("--log-level", default="info", help="uvicorn log level")
+    args = parser.parse_args(argv)
+    if args.workers < 1:
+        parser.error("--workers must be at least 1")
+    if args.workers > 1 and args.transport == "sse":
+        parser.error("SSE needs a single worker; use --transport http")
+    return args
+
+
+def main(argv: list[str] | None = None) -> None:
     """Main entry point for the MCP server."""
-    app.run()
+    args = _parse_args(argv)
+    if args.transport == "stdio":
+        app.run()
+        return
+
+    import uvicorn
+
+    # Requests of one MCP session may reach any worker, so with several
+    # workers the server must not keep per-session state.
+    stateless = args.stateless or args.workers > 1
+    os.environ[_HTTP_TRANSPORT_ENV] = args.transport
+    os.environ[_HTTP_PATH_ENV] = args.path or (
+        "/sse" if args.transport == "sse" else "/mcp"
+    )
+    os.environ[_HTTP_STATELESS_ENV] = "1" if stateless else "0"
+    os.environ[_HTTP_WORKERS_ENV] = str(args.workers)
+    uvicorn.run(
+        "smalltalk_validator_mcp_server.server:http_app",
+        factory=True,
+        host=args.host,
+        port=args.port,
+        workers=args.workers,
+        timeout_graceful_shutdown=args.shutdown_timeout,
+        log_level=args.log_level,
+    )
 
 
 if __name__ == "__main__":
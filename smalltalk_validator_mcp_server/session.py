@@ -0,0 +1,235 @@
+"""
+Document sessions that keep a parsed Tonel CST and re-parse it incrementally.
+"""
+
+import os
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from typing import Any
+
+from tree_sitter import Tree
+
+from smalltalk_validator_mcp_server.parser import _PARSER_POOL
+
+_IDLE_SECONDS_ENV = "SMALLTALK_VALIDATOR_SESSION_IDLE_SECONDS"
+_MAX_BYTES_ENV = "SMALLTALK_VALIDATOR_SESSION_MAX_BYTES"
+_DEFAULT_IDLE_SECONDS = 15 * 60
+_DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+# A tree-sitter CST is several times larger than its source; the memory cap
+# is applied to this estimate since the tree's real footprint is not exposed.
+_TREE_BYTES_PER_SOURCE_BYTE = 10
+
+
+def _env_number(name: str, default: float) -> float:
+    try:
+        return float(os.environ[name])
+    except (KeyError, ValueError):
+        return default
+
+
+def _point_after(start_row: int, start_column: int, text: bytes) -> tuple[int, int]:
+    """Return the (row, byte column) reached by inserting *text* at a point."""
+    newlines = text.count(b"\n")
+    if newlines == 0:
+        return start_row, start_column + len(text)
+    return start_row + newlines, len(text) - text.rfind(b"\n") - 1
+
+
+def _byte_position(source: bytes, row: int, character: int) -> tuple[int, int]:
+    """Return (byte offset, byte column) of a [line, character] position."""
+    if row < 0 or character < 0:
+        raise ValueError(f"Invalid position [{row}, {character}]")
+    line_start = 0
+    for _ in range(row):
+        newline = source.find(b"\n", line_start)
+        if newline < 0:
+            raise ValueError(f"Line {row} is past the end of the document")
+        line_start = newline + 1
+    line_end = source.find(b"\n", line_start)
+    if line_end < 0:
+        line_end = len(source)
+    line = source[line_start:line_end].decode("utf-8")
+    if character > len(line):
+        raise ValueError(f"Character {character} is past the end of line {row}")
+    column = len(line[:character].encode("utf-8"))
+    return line_start + column, column
+
+
+def _apply_edit(tree: Tree, source: bytes, edit: dict[str, Any]) -> bytes:
+    """Record *edit* on *tree* and return the edited source."""
+    start_row, start_char = edit["start"]
+    end_row, end_char = edit["end"]
+    new_text = edit.get("text", "").encode("utf-8")
+
+    start_byte, start_column = _byte_position(source, start_row, start_char)
+    old_end_byte, old_end_column = _byte_position(source, end_row, end_char)
+    if old_end_byte < start_byte:
+        raise ValueError(f"Edit end {edit['end']} precedes start {edit['start']}")
+
+    tree.edit(
+        start_byte=start_byte,
+        old_end_byte=old_end_byte,
+        new_end_byte=start_byte + len(new_text),
+        start_point=(start_row, start_column),
+        old_end_point=(end_row, old_end_column),
+        new_end_point=_point_after(start_row, start_column, new_text),
+    )
+    return source[:start_byte] + new_text + source[old_end_byte:]
+
+
+class DocumentSession:
+    """An open Tonel document whose tree is updated with ``Tree.edit``.
+
+    Edits address the document by 0-based ``[line, character]`` positions
+    and are applied in order, each relative to the result of the previous
+    one.  After a batch of edits the document is re-parsed once, passing
+    the edited old tree so tree-sitter only re-parses the changed regions.
+    A document whose estimated memory would exceed ``max_bytes`` is rejected
+    with ValueError before it is parsed, whether opened or grown by edits.
+    """
+
+    def __init__(
+        self, session_id: str, content: str, max_bytes: int | None = None
+    ) -> None:
+        self.session_id = session_id
+        self.last_used = time.monotonic()
+        self.lock = threading.Lock()
+        self.max_bytes = max_bytes
+        self._source = content.encode("utf-8")
+        self._check_size(self._source)
+        self._tree: Tree = _PARSER_POOL.parse(self._source)
+
+    @property
+    def tree(self) -> Tree:
+        return self._tree
+
+    @property
+    def content(self) -> str:
+        return self._source.decode("utf-8")
+
+    @property
+    def content_length(self) -> int:
+        return len(self.content)
+
+    @property
+    def estimated_bytes(self) -> int:
+        return len(self._source) * _TREE_BYTES_PER_SOURCE_BYTE
+
+    def _check_size(self, source: bytes) -> None:
+        if (
+            self.max_bytes is not None
+            and len(source) * _TREE_BYTES_PER_SOURCE_BYTE > self.max_bytes
+        ):
+            raise ValueError("Document is too large for a session")
+
+    def apply_edits(self, edits: list[dict[str, Any]]) -> list[list[list[int]]]:
+        """Apply range edits and re-parse; return the changed ranges as points.
+
+        Each edit is ``{"start": [line, character], "end": [line, character],
+        "text": str}``.  Raises ValueError for positions outside the document,
+        in which case the session is left unchanged, as it is when the edited
+        document would be too large.
+        """
+        edited_tree = self._tree.copy()
+        source = self._source
+        for edit in edits:
+            source = _apply_edit(edited_tree, source, edit)
+        self._check_size(source)
+        new_tree = _PARSER_POOL.parse(source, edited_tree)
+        self._source = source
+        self._tree = new_tree
+        return [
+            [list(r.start_point), list(r.end_point)]
+            for r in edited_tree.changed_ranges(new_tree)
+        ]
+
+
+class DocumentSessionStore:
+    """Holds open document sessions with idle expiry and a memory cap.
+
+    Sessions unused for ``idle_seconds`` are closed, and the least recently
+    used sessions are closed while the estimated memory of all sessions
+    exceeds ``max_bytes``.
+
+    Args:
+        idle_seconds: Idle time before a session expires. Defaults to the
+            SMALLTALK_VALIDATOR_SESSION_IDLE_SECONDS environment variable,
+            or 15 minutes.
+        max_bytes: Memory cap for all sessions. Defaults to the
+            SMALLTALK_VALIDATOR_SESSION_MAX_BYTES environment variable,
+            or 256 MiB.
+    """
+
+    def __init__(
+        self, idle_seconds: float | None = None, max_bytes: int | None = None
+    ) -> None:
+        self._idle_seconds = (
+            _env_number(_IDLE_SECONDS_ENV, _DEFAULT_IDLE_SECONDS)
+            if idle_seconds is None
+            else idle_seconds
+        )
+        self._max_bytes = (
+            int(_env_number(_MAX_BYTES_ENV, _DEFAULT_MAX_BYTES))
+            if max_bytes is None
+            else max_bytes
+        )
+        self._sessions: OrderedDict[str, DocumentSession] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def open(self, content: str) -> DocumentSession:
+        """Parse *content* into a new session; raise ValueError if over the cap."""
+        # Characters are a lower bound on UTF-8 bytes, so this rejects most
+        # oversized documents before they are even encoded.
+        if len(content) * _TREE_BYTES_PER_SOURCE_BYTE > self._max_bytes:
+            raise ValueError("Document is too large for a session")
+        session = DocumentSession(uuid.uuid4().hex, content, self._max_bytes)
+        with self._lock:
+            self._sessions[session.session_id] = session
+            self._expire(keep=session.session_id)
+        return session
+
+    def get(self, session_id: str) -> DocumentSession:
+        """Return an open session and mark it used; raise KeyError if unknown."""
+        with self._lock:
+            self._expire()
+            session = self._sessions[session_id]
+            self._sessions.move_to_end(session_id)
+            session.last_used = time.monotonic()
+            return session
+
+    def close(self, session_id: str) -> bool:
+        with self._lock:
+            return self._sessions.pop(session_id, None) is not None
+
+    def enforce_limits(self, keep: str | None = None) -> None:
+        """Re-apply the memory cap, e.g. after a session grew through edits."""
+        with self._lock:
+            self._expire(keep=keep)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._sessions)
+
+    def _expire(self, keep: str | None = None) -> None:
+        deadline = time.monotonic() - self._idle_seconds
+        for session_id, session in list(self._sessions.items()):
+            if session.last_used < deadline and session_id != keep:
+                del self._sessions[session_id]
+        total = sum(s.estimated_bytes for s in self._sessions.values())
+        for session_id in list(self._sessions):
+            if total <= self._max_bytes:
+                break
+            if session_id == keep:
+                continue
+            total -= self._sessions.pop(session_id).estimated_bytes
+
+
+_SESSION_STORE = DocumentSessionStore()
+
+
+def session_store() -> DocumentSessionStore:
+    """Return the process-wide document session store."""
+    return _SESSION_STORE
@@ -0,0 +1,153 @@
+"""
+Bytes-native reading of Tonel source files for tree-sitter.
+"""
+
+import codecs
+import mmap
+import os
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Any
+
+# Files at least this large are memory-mapped instead of read into memory.
+_MMAP_THRESHOLD = 1024 * 1024
+
+# Chunk size for the UTF-8 check, so mapped files are never copied whole.
+_CHECK_CHUNK = 1024 * 1024
+
+# UTF-32 BOMs must be tested before UTF-16 since BOM_UTF32_LE starts with BOM_UTF16_LE.
+_TRANSCODED_BOMS = (
+    (codecs.BOM_UTF32_LE, "utf-32"),
+    (codecs.BOM_UTF32_BE, "utf-32"),
+    (codecs.BOM_UTF16_LE, "utf-16"),
+    (codecs.BOM_UTF16_BE, "utf-16"),
+)
+
+
+class SourceBuffer:
+    """UTF-8 source bytes of a file, ready to hand straight to tree-sitter.
+
+    Attributes:
+        data: The source as bytes or a memoryview over a memory map, with any
+            byte order mark removed.
+        encoding_error: None, or a dict describing the first invalid byte
+            sequence (message, byte offset and [row, column] point).
+
+    Tree-sitter points, including the encoding error's, are relative to
+    ``data``: after a UTF-8 byte order mark, columns on the first line are 3
+    less than byte columns in the file, and equal to what an editor shows.
+    The error's ``offset`` is a byte offset in the file as stored.
+    """
+
+    def __init__(self, data, encoding_error: dict[str, Any] | None = None) -> None:
+        self.data = data
+        self.encoding_error = encoding_error
+
+
+def _point_at(data, offset: int) -> list[int]:
+    """Return the [row, byte column] of *offset* in a bytes-like buffer."""
+    row = 0
+    line_start = 0
+    for start in range(0, offset, _CHECK_CHUNK):
+        chunk = bytes(data[start : min(start + _CHECK_CHUNK, offset)])
+        newlines = chunk.count(b"\n")
+        if newlines:
+            row += newlines
+            line_start = start + chunk.rfind(b"\n") + 1
+    return [row, offset - line_start]
+
+
+def _find_invalid_utf8(data, base_offset: int = 0) -> dict[str, Any] | None:
+    """Return a structured error for the first invalid UTF-8 sequence, or None.
+
+    *base_offset* is added to the reported offset, for data that starts after
+    a byte order mark.
+    """
+    size = len(data)
+    start = 0
+    while start < size:
+        end = min(start + _CHECK_CHUNK, size)
+        chunk = bytes(data[start:end])
+        if chunk.isascii():
+            start = end
+            continue
+        try:
+            chunk.decode("utf-8")
+        except UnicodeDecodeError as exc:
+            # A multi-byte sequence cut at the chunk boundary is carried over.
+            if end < size and exc.reason == "unexpected end of data":
+                start += exc.start
+                continue
+            offset = start + exc.start
+            return {
+                "message": (
+                    f"Invalid UTF-8 byte 0x{chunk[exc.start]:02x} "
+                    f"at byte offset {base_offset + offset}"
+                ),
+                "offset": base_offset + offset,
+                "point": _point_at(data, offset),
+            }
+        start = end
+    return None
+
+
+def _transcode(raw: bytes, codec: str) -> tuple[bytes, dict[str, Any] | None]:
+    """Transcode UTF-16/32 *raw*, byte order mark included, to UTF-8.
+
+    Malformed input yields the valid prefix and a structured error at the
+    first bad code unit instead of raising.
+    """
+    try:
+        return raw.decode(codec).encode("utf-8"), None
+    except UnicodeDecodeError as exc:
+        data = raw[: exc.start].decode(codec).encode("utf-8")
+        return data, {
+            "message": f"Invalid {codec.upper()} data at byte offset {exc.start}",
+            "offset": exc.start,
+            "point": _point_at(data, len(data)),
+        }
+
+
+def _decode_bom(head: bytes) -> tuple[int, str | None]:
+    """Return (BOM length, codec to transcode from or None for UTF-8)."""
+    for bom, codec in _TRANSCODED_BOMS:
+        if head.startswith(bom):
+            return len(bom), codec
+    if head.startswith(codecs.BOM_UTF8):
+        return len(codecs.BOM_UTF8), None
+    return 0, None
+
+
+@contextmanager
+def open_source(file_path) -> Iterator[SourceBuffer]:
+    """Open a source file as UTF-8 bytes without decoding it to str.
+
+    Files of ``_MMAP_THRESHOLD`` bytes or more are memory-mapped.  A UTF-8
+    byte order mark is skipped without copying, and UTF-16/32 files with a
+    BOM are transcoded to UTF-8.  Invalid UTF-8, and malformed UTF-16/32
+    after the valid part, are reported through ``SourceBuffer.encoding_error``
+    rather than raised.  The buffer is only
+    valid inside the ``with`` block.
+    """
+    with open(file_path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if size < _MMAP_THRESHOLD or size == 0:
+            data = f.read()
+            bom_length, codec = _decode_bom(data[:4])
+            if codec is not None:
+                yield SourceBuffer(*_transcode(data, codec))
+                return
+            data = data[bom_length:]
+            yield SourceBuffer(data, _find_invalid_utf8(data, bom_length))
+            return
+
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            bom_length, codec = _decode_bom(mapped[:4])
+            if codec is not None:
+                yield SourceBuffer(*_transcode(mapped[:], codec))
+                return
+            view = memoryview(mapped)[bom_length:]
+            try:
+                yield SourceBuffer(view, _find_invalid_utf8(view, bom_length))
+            finally:
+                view.release()
@@ -0,0 +1,235 @@
+"""
+Directory watches that keep diagnostics current by polling file stats.
+"""
+
+import os
+import threading
+import time
+import uuid
+from collections.abc import Callable
+from typing import Any
+
+_MAX_WATCHES_ENV = "SMALLTALK_VALIDATOR_MAX_WATCHES"
+_DEFAULT_MAX_WATCHES = 8
+DEFAULT_INTERVAL = 1.0
+DEFAULT_DEBOUNCE = 0.5
+
+# (mtime_ns, size) of a file when it was last scanned.
+Stamp = tuple[int, int]
+# Called as on_update(checked_results, removed_paths) after a poll that
+# changed the diagnostics.
+UpdateCallback = Callable[[list[dict[str, Any]], list[str]], None]
+
+
+def _env_number(name: str, default: float) -> float:
+    try:
+        return float(os.environ[name])
+    except (KeyError, ValueError):
+        return default
+
+
+def _scan(root: str) -> dict[str, Stamp]:
+    """Return the stamp of every ``*.st`` file under *root*."""
+    stamps: dict[str, Stamp] = {}
+    for directory, _, filenames in os.walk(root):
+        for filename in filenames:
+            if not filename.endswith(".st"):
+                continue
+            path = os.path.join(directory, filename)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            stamps[path] = (stat.st_mtime_ns, stat.st_size)
+    return stamps
+
+
+class DirectoryWatcher:
+    """Re-checks the ``*.st`` files under a directory as they change.
+
+    Each poll stats every file and compares it with the previous poll; no
+    OS-specific notification API is used.  A changed file is checked once
+    its stat has stayed the same for ``debounce`` seconds, so a burst of
+    writes costs one check.  The first poll checks every file at once.
+    ``check(path)`` produces a file's result dict; results of files that
+    disappeared are dropped.
+
+    Args:
+        root: Directory to watch recursively.
+        check: Called with a file path to produce its result.
+        interval: Seconds between polls when started as a thread.
+        debounce: Seconds a file must stay unchanged before it is checked.
+        on_update: Optional callback run after a poll that changed results.
+    """
+
+    def __init__(
+        self,
+        root: str,
+        check: Callable[[str], dict[str, Any]],
+        interval: float = DEFAULT_INTERVAL,
+        debounce: float = DEFAULT_DEBOUNCE,
+        on_update: UpdateCallback | None = None,
+    ) -> None:
+        if not os.path.isdir(root):
+            raise ValueError(f"Not a directory: {root}")
+        self.watch_id = uuid.uuid4().hex
+        self.root = root
+        self.interval = interval
+        self.debounce = debounce
+        self.on_update = on_update
+        self._check = check
+        self._stamps: dict[str, Stamp] = {}
+        # Path -> monotonic time its stamp last changed, until it is checked.
+        self._pending: dict[str, float] = {}
+        self._results: dict[str, dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._first_poll = True
+        self.generation = 0
+
+    def poll(self, now: float | None = None) -> tuple[list[str], list[str]]:
+        """Scan once and check the files that are due; return (checked, removed).
+
+        A file whose check raises stays pending and is checked again on the
+        next poll.  The other results of the poll are still recorded, and the
+        first such error is raised afterwards.
+        """
+        now = time.monotonic() if now is None else now
+        stamps = _scan(self.root)
+        for path, stamp in stamps.items():
+            if self._stamps.get(path) != stamp:
+                self._pending[path] = now
+        removed = sorted(set(self._stamps) - set(stamps))
+        for path in removed:
+            self._pending.pop(path, None)
+        self._stamps = stamps
+
+        due = sorted(
+            path
+            for path, changed in self._pending.items()
+            if self._first_poll or now - changed >= self.debounce
+        )
+        self._first_poll = False
+        done: list[str] = []
+        checked = []
+        error: Exception | None = None
+        for path in due:
+            try:
+                result = self._check(path)
+            except Exception as e:
+                error = error or e
+                continue
+            del self._pending[path]
+            done.append(path)
+            checked.append(result)
+
+        if checked or any(path in self._results for path in removed):
+            with self._lock:
+                for path in removed:
+                    self._results.pop(path, None)
+                for path, result in zip(done, checked, strict=True):
+                    self._results[path] = result
+                self.generation += 1
+            if self.on_update is not None:
+                self.on_update(checked, removed)
+        if error is not None:
+            raise error
+        return done, removed
+
+    def results(self) -> dict[str, dict[str, Any]]:
+        """Return the current result of every checked file, by path."""
+        with self._lock:
+            return dict(self._results)
+
+    def snapshot(self) -> dict[str, Any]:
+        """Return the current results, sorted by path, with the generation."""
+        with self._lock:
+            return {
+                "watch_id": self.watch_id,
+                "directory": self.root,
+                "generation": self.generation,
+                "pending_count": len(self._pending),
+                "results": [self._results[path] for path in sorted(self._results)],
+            }
+
+    def start(self) -> None:
+        """Poll every ``interval`` seconds on a daemon thread until stopped."""
+        self._thread = threading.Thread(
+            target=self._run, name=f"watch-{self.watch_id[:8]}", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self, timeout: float | None = None) -> None:
+        self._stop.set()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join(timeout)
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            try:
+                self.poll()
+            except Exception:
+                # A directory removed mid-scan is retried on the next poll.
+                pass
+            self._stop.wait(self.interval)
+
+
+class WatchStore:
+    """Holds the running directory watches, at most ``max_watches`` at once.
+
+    Args:
+        max_watches: Maximum concurrent watches. Defaults to the
+            SMALLTALK_VALIDATOR_MAX_WATCHES environment variable, or 8.
+    """
+
+    def __init__(self, max_watches: int | None = None) -> None:
+        self._max_watches = (
+            int(_env_number(_MAX_WATCHES_ENV, _DEFAULT_MAX_WATCHES))
+            if max_watches is None
+            else max_watches
+        )
+        self._watchers: dict[str, DirectoryWatcher] = {}
+        self._lock = threading.Lock()
+
+    def start(self, watcher: DirectoryWatcher) -> DirectoryWatcher:
+        with self._lock:
+            if len(self._watchers) >= self._max_watches:
+                raise ValueError(
+                    f"Too many directory watches ({self._max_watches}); stop one first"
+                )
+            self._watchers[watcher.watch_id] = watcher
+        watcher.start()
+        return watcher
+
+    def get(self, watch_id: str) -> DirectoryWatcher:
+        """Return a running watch; raise KeyError if unknown."""
+        with self._lock:
+            return self._watchers[watch_id]
+
+    def stop(self, watch_id: str) -> bool:
+        with self._lock:
+            watcher = self._watchers.pop(watch_id, None)
+        if watcher is None:
+            return False
+        watcher.stop()
+        return True
+
+    def stop_all(self) -> None:
+        with self._lock:
+            watchers = list(self._watchers.values())
+            self._watchers.clear()
+        for watcher in watchers:
+            watcher.stop()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._watchers)
+
+
+_WATCH_STORE = WatchStore()
+
+
+def watch_store() -> WatchStore:
+    """Return the process-wide watch store."""
+    return _WATCH_STORE
@@ -0,0 +1,151 @@
+"""
+Process pool for fanning multi-file work out across CPU cores.
+"""
+
+import glob
+import multiprocessing
+import os
+import threading
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from pathlib import Path
+from typing import Any
+
+from smalltalk_validator_mcp_server.parser import _PARSER_POOL
+
+_WARM_UP_SOURCE = b"Class { #name : #Warm }\n\nWarm >> up [\n  ^ self\n]\n"
+
+# In-flight futures per worker; keeps memory bounded on very large file sets.
+_IN_FLIGHT_PER_WORKER = 4
+
+# The one shared worker pool, sized by the CPU count.  Callers asking for
+# fewer workers keep fewer files in flight instead of getting a pool of
+# their own, so requests cannot make the process start more workers.
+_pool: ProcessPoolExecutor | None = None
+_pool_lock = threading.Lock()
+
+
+def default_workers() -> int:
+    return os.cpu_count() or 1
+
+
+def clamp_workers(max_workers: int | None) -> int:
+    """Bound a requested worker count to ``[1, default_workers()]``; None means all."""
+    if max_workers is None:
+        return default_workers()
+    return max(1, min(max_workers, default_workers()))
+
+
+def collect_tonel_files(target: str) -> list[str]:
+    """Expand a directory (searched recursively for ``*.st``) or a glob pattern."""
+    if os.path.isdir(target):
+        paths = (str(p) for p in Path(target).rglob("*.st"))
+    else:
+        paths = glob.iglob(target, recursive=True)
+    return sorted(p for p in paths if os.path.isfile(p))
+
+
+def iter_tonel_files(targets: Iterable[str]) -> Iterator[str]:
+    """Lazily expand files, directories and glob patterns, yielding each file once.
+
+    Directories are walked in sorted order for ``*.st`` files without listing
+    the whole tree first.  A plain path that does not exist is yielded as is,
+    so the caller can report it.
+    """
+    seen: set[str] = set()
+    for target in targets:
+        if os.path.isdir(target):
+            paths = _walk_tonel_files(target)
+        elif glob.has_magic(target):
+            matches = sorted(glob.iglob(target, recursive=True))
+            paths = (p for p in matches if os.path.isfile(p))
+        else:
+            paths = iter((target,))
+        for path in paths:
+            key = os.path.normpath(path)
+            if key not in seen:
+                seen.add(key)
+                yield path
+
+
+def _walk_tonel_files(directory: str) -> Iterator[str]:
+    for root, dirnames, filenames in os.walk(directory):
+        dirnames.sort()
+        for filename in sorted(filenames):
+            if filename.endswith(".st"):
+                yield os.path.join(root, filename)
+
+
+def _warm_up() -> None:
+    """Process initializer: lease a parser so the first task does not pay for it."""
+    _PARSER_POOL.parse(_WARM_UP_SOURCE)
+
+
+def process_pool() -> ProcessPoolExecutor:
+    """Return the shared worker pool of ``default_workers()`` processes.
+
+    Workers are started with the "spawn" method, since the server process
+    runs threads, and are kept between calls so their parsers stay warm.
+    The pool is never replaced while in use, so one caller's work is not
+    cancelled by another's.
+    """
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ProcessPoolExecutor(
+                max_workers=default_workers(),
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_warm_up,
+            )
+        return _pool
+
+
+def shutdown_process_pool() -> None:
+    """Shut down the shared worker pool; later calls start a new one."""
+    global _pool
+    with _pool_lock:
+        pool, _pool = _pool, None
+    if pool is not None:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+def iter_file_results(
+    func: Callable[..., Any],
+    file_paths: Iterable[str],
+    max_workers: int | None = None,
+    *args: Any,
+) -> Iterator[tuple[str, Any]]:
+    """Yield ``(path, func(path, *args))`` as each file finishes.
+
+    With more than one worker, files are fanned out across the shared process
+    pool.  Each worker reads and parses its own files, so file reads overlap
+    with parsing in the other workers.  Only a bounded number of files is in
+    flight at once, so *file_paths* may be a lazy iterable of any length.
+    Results arrive in completion order, not input order.  *max_workers* is
+    clamped to the CPU count and bounds how many files this call keeps in
+    flight.
+    """
+    workers = clamp_workers(max_workers)
+    if workers <= 1:
+        for path in file_paths:
+            yield path, func(path, *args)
+        return
+
+    pool = process_pool()
+    limit = workers * _IN_FLIGHT_PER_WORKER
+    pending: dict[Future, str] = {}
+    paths = iter(file_paths)
+    exhausted = False
+
+    while True:
+        while not exhausted and len(pending) < limit:
+            path = next(paths, None)
+            if path is None:
+                exhausted = True
+                break
+            pending[pool.submit(func, path, *args)] = path
+        if not pending:
+            return
+        done, _ = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            yield pending.pop(future), future.result()
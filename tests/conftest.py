@@ -0,0 +1,18 @@
+"""
+Shared pytest fixtures.
+"""
+
+import pytest
+
+from smalltalk_validator_mcp_server.cache import result_cache
+from smalltalk_validator_mcp_server.linter import method_issue_cache
+
+
+@pytest.fixture(autouse=True)
+def _clear_result_cache():
+    """Keep cached tool results and method issues from leaking between tests."""
+    result_cache().clear()
+    method_issue_cache().clear()
+    yield
+    result_cache().clear()
+    method_issue_cache().clear()
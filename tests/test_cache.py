@@ -0,0 +1,130 @@
+"""
+Unit tests for the in-process result cache.
+"""
+
+from unittest.mock import patch
+
+from smalltalk_validator_mcp_server.cache import ResultCache, result_cache
+from smalltalk_validator_mcp_server.core import (
+    lint_tonel_smalltalk_impl,
+    validate_smalltalk_method_body_impl,
+    validate_tonel_smalltalk_impl,
+)
+
+_CONTENT = "Class { #name : #CacheClass }\n\nCacheClass >> foo [\n  ^ 1\n]\n"
+
+
+class TestResultCache:
+    """Tests for ResultCache."""
+
+    def test_hit_returns_copy_of_stored_result(self):
+        cache = ResultCache(max_bytes=1024)
+        key = cache.make_key("full", "content")
+        cache.put(key, {"valid": False, "errors": [{"text": "x"}]})
+
+        first = cache.get(key)
+        first["errors"].append({"text": "mutated"})
+
+        assert cache.get(key) == {"valid": False, "errors": [{"text": "x"}]}
+        assert cache.hits == 2
+        assert cache.misses == 0
+
+    def test_key_depends_on_mode_and_options(self):
+        keys = {
+            ResultCache.make_key("full", "x"),
+            ResultCache.make_key("tonel_only", "x"),
+            ResultCache.make_key("full", "y"),
+            ResultCache.make_key("full", "x", {"without-method-body": False}),
+        }
+        assert len(keys) == 4
+
+    def test_evicts_least_recently_used_by_byte_budget(self):
+        cache = ResultCache(max_bytes=200)
+        payload = {"text": "a" * 40}
+        keys = [cache.make_key("lint", str(i)) for i in range(3)]
+        cache.put(keys[0], payload)
+        cache.put(keys[1], payload)
+        cache.get(keys[0])
+        cache.put(keys[2], payload)
+
+        assert cache.get(keys[0]) is not None
+        assert cache.get(keys[1]) is None
+        assert cache.get(keys[2]) is not None
+        assert cache.stats()["size_bytes"] <= 200
+
+    def test_disabled_cache_never_stores(self):
+        cache = ResultCache(max_bytes=0)
+        key = cache.make_key("full", "content")
+        cache.put(key, {"valid": True})
+
+        assert cache.enabled is False
+        assert cache.get(key) is None
+        assert cache.stats()["entries"] == 0
+
+    def test_configure_zero_disables_and_empties(self):
+        cache = ResultCache(max_bytes=1024)
+        cache.put(cache.make_key("full", "content"), {"valid": True})
+        cache.configure(0)
+
+        assert cache.stats()["entries"] == 0
+
+    def test_max_bytes_from_environment(self, monkeypatch):
+        monkeypatch.setenv("SMALLTALK_VALIDATOR_CACHE_MAX_BYTES", "0")
+        assert ResultCache().enabled is False
+
+
+class TestToolResultCaching:
+    """Tests for cache use in the content-based tool implementations."""
+
+    def test_validate_hit_skips_parsing(self):
+        first = validate_tonel_smalltalk_impl(_CONTENT)
+        with patch(
+            "smalltalk_validator_mcp_server.core.TonelTreeSitterParser"
+        ) as mock_parser_class:
+            second = validate_tonel_smalltalk_impl(_CONTENT)
+
+        assert second == first
+        mock_parser_class.assert_not_called()
+        assert result_cache().hits == 1
+
+    def test_validate_modes_cached_separately(self):
+        content = "Class { #name : #Foo }\n\nFoo >> x [\n  ^ 1 + + 2\n]\n"
+        full = validate_tonel_smalltalk_impl(content)
+        tonel_only = validate_tonel_smalltalk_impl(
+            content, options={"without-method-body": True}
+        )
+
+        assert full["valid"] is False
+        assert tonel_only["valid"] is True
+        assert result_cache().hits == 0
+
+    def test_method_body_hit_skips_parsing(self):
+        validate_smalltalk_method_body_impl("^ self name")
+        with patch(
+            "smalltalk_validator_mcp_server.core.SmalltalkMethodParser"
+        ) as mock_parser_class:
+            result = validate_smalltalk_method_body_impl("^ self name")
+
+        assert result["valid"] is True
+        mock_parser_class.assert_not_called()
+
+    def test_lint_hit_skips_linting(self):
+        first = lint_tonel_smalltalk_impl(_CONTENT)
+        with patch(
+            "smalltalk_validator_mcp_server.core.TonelCSTLinter"
+        ) as mock_linter_class:
+            second = lint_tonel_smalltalk_impl(_CONTENT)
+
+        assert second == first
+        mock_linter_class.assert_not_called()
+
+    def test_failures_are_not_cached(self):
+        with patch(
+            "smalltalk_validator_mcp_server.core.TonelTreeSitterParser"
+        ) as mock_parser_class:
+            mock_parser_class.return_value.parse.side_effect = RuntimeError("boom")
+            failed = validate_tonel_smalltalk_impl(_CONTENT)
+
+        assert failed["valid"] is False
+        assert validate_tonel_smalltalk_impl(_CONTENT)["valid"] is True
+        assert result_cache().stats()["entries"] == 1
@@ -0,0 +1,181 @@
+"""
+Unit tests for the smalltalk-validator command-line tool.
+"""
+
+import io
+import json
+import os
+import shutil
+
+import pytest
+
+from smalltalk_validator_mcp_server import cli
+from smalltalk_validator_mcp_server.workers import iter_tonel_files
+
+_FIXTURES_DIR = os.path.join(os.path.dirname(__file__), "fixtures")
+
+_ERROR_CLASS = (
+    """Class {
+\t#name : #STErrorClass,
+\t#superclass : #Object,
+\t#category : #'Test-Category'
+}
+
+{ #category : #accessing }
+STErrorClass >> report [
+"""
+    + "".join(f"\tTranscript show: {i} printString.\n" for i in range(30))
+    + "]\n"
+)
+
+
+def _run(argv: list[str]) -> tuple[int, list[dict], dict]:
+    out = io.StringIO()
+    code = cli.run(cli._parse_args(argv), out)
+    records = [json.loads(line) for line in out.getvalue().splitlines()]
+    return code, records[:-1], records[-1]["summary"]
+
+
+@pytest.fixture
+def fixtures_copy(tmp_path):
+    shutil.copytree(_FIXTURES_DIR, tmp_path / "src")
+    return tmp_path / "src"
+
+
+class TestIterTonelFiles:
+    """Tests for expanding command-line targets."""
+
+    def test_directories_are_walked_in_sorted_order(self, tmp_path):
+        (tmp_path / "b").mkdir()
+        for name in ("b/Z.st", "b/A.st", "a.st", "notes.txt"):
+            (tmp_path / name).write_text("")
+
+        assert list(iter_tonel_files([str(tmp_path)])) == [
+            str(tmp_path / "a.st"),
+            str(tmp_path / "b" / "A.st"),
+            str(tmp_path / "b" / "Z.st"),
+        ]
+
+    def test_each_file_is_yielded_once(self, fixtures_copy):
+        valid = str(fixtures_copy / "valid_class.st")
+        paths = list(
+            iter_tonel_files([valid, str(fixtures_copy / "*.st"), str(fixtures_copy)])
+        )
+
+        assert len(paths) == len(set(paths)) == 3
+        assert paths[0] == valid
+
+    def test_missing_plain_path_is_kept_and_empty_glob_is_dropped(self, tmp_path):
+        missing = str(tmp_path / "Missing.st")
+
+        assert list(iter_tonel_files([missing, str(tmp_path / "*.st")])) == [missing]
+
+
+class TestCli:
+    """Tests for the validate and lint subcommands."""
+
+    def test_validate_streams_one_record_per_file(self, fixtures_copy):
+        code, records, summary = _run(["validate", "-j", "1", str(fixtures_copy)])
+
+        assert code == cli.EXIT_FAILED
+        by_name = {os.path.basename(r["file_path"]): r for r in records}
+        assert set(by_name) == {
+            "invalid_syntax.st",
+            "tonel_structure_only.st",
+            "valid_class.st",
+        }
+        assert by_name["valid_class.st"]["valid"] is True
+        assert by_name["invalid_syntax.st"]["valid"] is False
+        assert by_name["tonel_structure_only.st"]["valid"] is True
+        assert summary["command"] == "validate"
+        assert summary["files_count"] == 3
+        assert summary["failed_files_count"] == 1
+
+    def test_validate_options_are_passed_through(self, fixtures_copy):
+        code, records, _ = _run(
+            [
+                "validate",
+                "-j",
+                "1",
+                "--without-method-body",
+                str(fixtures_copy / "tonel_structure_only.st"),
+            ]
+        )
+
+        assert code == cli.EXIT_OK
+        assert records[0]["parser_type"] == "tonel_only"
+
+    def test_missing_file_fails(self, tmp_path):
+        code, records, summary = _run(["validate", str(tmp_path / "Missing.st")])
+
+        assert code == cli.EXIT_FAILED
+        assert "File not found" in records[0]["error"]
+        assert summary["failed_files_count"] == 1
+
+    def test_lint_fails_on_errors_only_by_default(self, tmp_path):
+        (tmp_path / "STErrorClass.st").write_text(_ERROR_CLASS)
+        (tmp_path / "Warnings.st").write_text(
+            open(os.path.join(_FIXTURES_DIR, "valid_class.st")).read()
+        )
+
+        code, records, summary = _run(["lint", "-j", "1", str(tmp_path)])
+
+        assert code == cli.EXIT_FAILED
+        assert summary["files_count"] == 2
+        assert summary["failed_files_count"] == 1
+        assert summary["errors_count"] == 1
+        assert summary["warnings_count"] == sum(r["warnings_count"] for r in records)
+
+    def test_lint_fail_on_warning(self, fixtures_copy):
+        target = str(fixtures_copy / "valid_class.st")
+
+        assert _run(["lint", "-j", "1", target])[0] == cli.EXIT_OK
+        assert (
+            _run(["lint", "-j", "1", "--fail-on", "warning", target])[0]
+            == cli.EXIT_FAILED
+        )
+
+    def test_parallel_jobs_match_single_process(self, fixtures_copy):
+        _, inline, _ = _run(["lint", "-j", "1", str(fixtures_copy)])
+        _, parallel, _ = _run(["lint", "-j", "2", str(fixtures_copy)])
+
+        def key(record):
+            return record["file_path"]
+
+        assert sorted(parallel, key=key) == sorted(inline, key=key)
+
+    def test_sarif_output_to_file(self, fixtures_copy, tmp_path):
+        output = tmp_path / "report.sarif"
+        with pytest.raises(SystemExit) as excinfo:
+            cli.main(
+                ["lint", "-j", "1", "--format", "sarif", "-o", str(output)]
+                + [str(fixtures_copy)]
+            )
+
+        assert excinfo.value.code == cli.EXIT_OK
+        run = json.loads(output.read_text())["runs"][0]
+        assert run["properties"]["summary"]["files_count"] == 3
+        assert len(run["results"]) == run["properties"]["summary"]["warnings_count"]
+        assert {r["ruleId"] for r in run["results"]} >= {"class-prefix"}
+
+    def test_rejects_zero_jobs(self, capsys):
+        with pytest.raises(SystemExit) as excinfo:
+            cli._parse_args(["lint", "-j", "0", "."])
+
+        assert excinfo.value.code == 2
+        assert "--jobs must be at least 1" in capsys.readouterr().err
+
+    def test_rejects_zero_max_errors(self, capsys):
+        with pytest.raises(SystemExit) as excinfo:
+            cli._parse_args(["validate", "--max-errors", "0", "."])
+
+        assert excinfo.value.code == 2
+        assert "--max-errors must be at least 1" in capsys.readouterr().err
+
+    def test_main_exits_with_run_status(self, fixtures_copy, capsys):
+        with pytest.raises(SystemExit) as excinfo:
+            cli.main(["validate", "-j", "1", str(fixtures_copy / "valid_class.st")])
+
+        assert excinfo.value.code == cli.EXIT_OK
+        lines = capsys.readouterr().out.splitlines()
+        assert json.loads(lines[-1])["summary"]["files_count"] == 1
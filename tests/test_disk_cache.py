@@ -0,0 +1,225 @@
+"""
+Unit tests for the persistent disk result cache.
+"""
+
+import io
+import json
+import os
+import shutil
+from unittest.mock import patch
+
+import pytest
+
+from smalltalk_validator_mcp_server import cli
+from smalltalk_validator_mcp_server import disk_cache as disk_cache_module
+from smalltalk_validator_mcp_server.core import (
+    lint_tonel_smalltalk_from_file_impl,
+    validate_tonel_smalltalk_from_file_impl,
+)
+from smalltalk_validator_mcp_server.disk_cache import DiskCache, disk_cache
+
+_FIXTURES_DIR = os.path.join(os.path.dirname(__file__), "fixtures")
+
+
+@pytest.fixture
+def source(tmp_path):
+    path = tmp_path / "src" / "valid_class.st"
+    path.parent.mkdir()
+    shutil.copy(os.path.join(_FIXTURES_DIR, "valid_class.st"), path)
+    return path
+
+
+@pytest.fixture
+def cache_path(tmp_path, monkeypatch):
+    path = str(tmp_path / "cache" / "results.sqlite3")
+    monkeypatch.setenv("SMALLTALK_VALIDATOR_DISK_CACHE", path)
+    return path
+
+
+def _store(cache: DiskCache, path, payload: str = "x") -> None:
+    cache.put("lint", str(path), None, os.stat(path), {"payload": payload})
+
+
+class TestDiskCache:
+    """Tests for DiskCache."""
+
+    def test_round_trip(self, tmp_path, source):
+        cache = DiskCache(str(tmp_path / "c.sqlite3"))
+        stat = os.stat(source)
+        assert cache.get("lint", str(source), None, stat) is None
+
+        cache.put("lint", str(source), None, stat, {"file_path": "x", "n": 1})
+
+        assert cache.get("lint", str(source), None, stat) == {
+            "file_path": str(source),
+            "n": 1,
+        }
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_key_includes_mode_and_options(self, tmp_path, source):
+        cache = DiskCache(str(tmp_path / "c.sqlite3"))
+        stat = os.stat(source)
+        cache.put("full", str(source), {"max-errors": 1}, stat, {"n": 1})
+
+        assert cache.get("lint", str(source), {"max-errors": 1}, stat) is None
+        assert cache.get("full", str(source), {"max-errors": 2}, stat) is None
+        assert cache.get("full", str(source), {"max-errors": 1}, stat) is not None
+
+    def test_touched_file_with_same_content_hits(self, tmp_path, source):
+        cache = DiskCache(str(tmp_path / "c.sqlite3"))
+        _store(cache, source)
+        os.utime(source, ns=(1, 1))
+
+        with patch.object(
+            disk_cache_module, "_file_digest", wraps=disk_cache_module._file_digest
+        ) as digest:
+            assert cache.get("lint", str(source), None, os.stat(source)) is not None
+            assert cache.get("lint", str(source), None, os.stat(source)) is not None
+
+        # Hashed once; the new mtime was recorded.
+        assert digest.call_count == 1
+
+    def test_changed_content_misses(self, tmp_path, source):
+        cache = DiskCache(str(tmp_path / "c.sqlite3"))
+        _store(cache, source)
+        stat = os.stat(source)
+        source.write_text(source.read_text().replace("TestClass", "TestClasz"))
+        os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+
+        assert cache.get("lint", str(source), None, os.stat(source)) is None
+
+    def test_file_changed_while_checked_is_not_stored(self, tmp_path, source):
+        cache = DiskCache(str(tmp_path / "c.sqlite3"))
+        stat = os.stat(source)
+        source.write_text("changed")
+
+        cache.put("lint", str(source), None, stat, {"n": 1})
+
+        assert cache.stats()["entries"] == 0
+
+    def test_other_fingerprint_drops_entries(self, tmp_path, source):
+        path = str(tmp_path / "c.sqlite3")
+        cache = DiskCache(path)
+        _store(cache, source)
+        cache.close()
+
+        with patch.object(disk_cache_module, "cache_fingerprint", return_value="new"):
+            assert DiskCache(path).stats()["entries"] == 0
+
+    def test_put_trims_least_recently_used_to_budget(self, tmp_path):
+        cache = DiskCache(str(tmp_path / "c.sqlite3"), max_bytes=2000)
+        for i in range(disk_cache_module._PRUNE_EVERY):
+            path = tmp_path / f"F{i}.st"
+            path.write_text(str(i))
+            _store(cache, path, payload="a" * 100)
+
+        stats = cache.stats()
+        assert stats["size_bytes"] <= 2000 * disk_cache_module._PRUNE_TARGET
+        last = tmp_path / f"F{disk_cache_module._PRUNE_EVERY - 1}.st"
+        assert cache.get("lint", str(last), None, os.stat(last)) is not None
+
+    def test_prune_drops_deleted_files(self, tmp_path, source):
+        cache = DiskCache(str(tmp_path / "c.sqlite3"))
+        other = tmp_path / "Other.st"
+        other.write_text("x")
+        _store(cache, source)
+        _store(cache, other)
+        other.unlink()
+
+        assert cache.prune() == {"missing_files": 1, "trimmed_entries": 0}
+        assert cache.stats()["entries"] == 1
+
+    def test_clear(self, tmp_path, source):
+        cache = DiskCache(str(tmp_path / "c.sqlite3"))
+        _store(cache, source)
+
+        cache.clear()
+
+        assert cache.stats()["entries"] == 0
+
+    def test_unusable_database_misses(self, tmp_path, source):
+        (tmp_path / "c.sqlite3").mkdir()
+        cache = DiskCache(str(tmp_path / "c.sqlite3"))
+
+        _store(cache, source)
+        assert cache.get("lint", str(source), None, os.stat(source)) is None
+
+
+class TestFileTools:
+    """Tests for the disk cache behind the from_file tools."""
+
+    def test_disabled_without_environment(self, monkeypatch):
+        monkeypatch.delenv("SMALLTALK_VALIDATOR_DISK_CACHE", raising=False)
+
+        assert disk_cache() is None
+
+    def test_lint_hit_skips_linting(self, cache_path, source):
+        first = lint_tonel_smalltalk_from_file_impl(str(source))
+        with patch(
+            "smalltalk_validator_mcp_server.core.TonelCSTLinter",
+            side_effect=AssertionError("linted a cached file"),
+        ):
+            second = lint_tonel_smalltalk_from_file_impl(str(source))
+
+        assert second == first
+        assert disk_cache().stats()["entries"] == 1
+
+    def test_validate_hit_skips_parsing(self, cache_path, source):
+        options = {"without-method-body": True}
+        first = validate_tonel_smalltalk_from_file_impl(str(source), options)
+        with patch(
+            "smalltalk_validator_mcp_server.core._tonel_parser",
+            side_effect=AssertionError("parsed a cached file"),
+        ):
+            second = validate_tonel_smalltalk_from_file_impl(str(source), options)
+
+        assert second == first
+        assert second["parser_type"] == "tonel_only"
+
+    def test_read_errors_are_not_cached(self, cache_path, tmp_path):
+        path = tmp_path / "Bad.st"
+        path.write_bytes(b"\xff")
+        with patch(
+            "smalltalk_validator_mcp_server.linter.open_source",
+            side_effect=OSError("boom"),
+        ):
+            result = lint_tonel_smalltalk_from_file_impl(str(path))
+
+        assert result["issue_list"][0]["rule_id"] == "read-error"
+        assert disk_cache().stats()["entries"] == 0
+
+
+class TestCacheCommand:
+    """Tests for the CLI --cache option and cache subcommand."""
+
+    def _run(self, argv: list[str]) -> list[dict]:
+        out = io.StringIO()
+        assert cli.run(cli._parse_args(argv), out) == cli.EXIT_OK
+        return [json.loads(line) for line in out.getvalue().splitlines()]
+
+    def test_lint_fills_cache_and_subcommands_maintain_it(self, tmp_path, source):
+        cache = str(tmp_path / "cli.sqlite3")
+        try:
+            first = self._run(["lint", "-j", "1", "--cache", cache, str(source)])
+            second = self._run(["lint", "-j", "1", "--cache", cache, str(source)])
+        finally:
+            disk_cache_module.use_disk_cache(None)
+
+        assert first[0] == second[0]
+        (stats,) = self._run(["cache", "stats", "--cache", cache])
+        assert stats["entries"] == 1
+        source.unlink()
+        prune, stats = self._run(["cache", "prune", "--cache", cache])
+        assert prune["missing_files"] == 1
+        assert stats["entries"] == 0
+        (stats,) = self._run(["cache", "clear", "--cache", cache])
+        assert stats["entries"] == 0
+
+    def test_cache_option_defaults_to_user_cache_file(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+        monkeypatch.delenv("SMALLTALK_VALIDATOR_DISK_CACHE", raising=False)
+
+        args = cli._parse_args(["lint", "x.st", "--cache"])
+
+        assert args.cache == str(tmp_path / "smalltalk-validator" / "results.sqlite3")
+        assert cli._parse_args(["lint", "x.st"]).cache is None
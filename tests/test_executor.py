@@ -0,0 +1,155 @@
+"""
+Unit tests for the bounded tool executors.
+"""
+
+import asyncio
+import contextvars
+import threading
+import time
+
+import pytest
+
+from smalltalk_validator_mcp_server import executor as executor_module
+from smalltalk_validator_mcp_server.core import validate_smalltalk_method_body_impl
+from smalltalk_validator_mcp_server.executor import ExecutorBusyError, ToolExecutor
+
+
+def _wait_for(event: threading.Event) -> str:
+    assert event.wait(5)
+    return "released"
+
+
+class TestToolExecutor:
+    """Tests for ToolExecutor."""
+
+    def test_runs_function_with_arguments(self):
+        pool = ToolExecutor(max_workers=2)
+        try:
+            result = asyncio.run(pool.run(divmod, 7, 2))
+        finally:
+            pool.shutdown()
+
+        assert result == (3, 1)
+        assert pool.in_flight == 0
+
+    def test_rejects_unknown_kind(self):
+        with pytest.raises(ValueError, match="Unknown executor kind"):
+            ToolExecutor("fiber")
+
+    def test_refuses_requests_beyond_max_queue(self):
+        pool = ToolExecutor(max_workers=1, max_queue=2, name="heavy")
+        release = threading.Event()
+
+        async def run():
+            first = asyncio.ensure_future(pool.run(_wait_for, release))
+            second = asyncio.ensure_future(pool.run(_wait_for, release))
+            await asyncio.sleep(0.05)
+            with pytest.raises(ExecutorBusyError, match="2 heavy request"):
+                await pool.run(_wait_for, release)
+            release.set()
+            return await asyncio.gather(first, second)
+
+        try:
+            assert asyncio.run(run()) == ["released", "released"]
+        finally:
+            pool.shutdown()
+        assert pool.in_flight == 0
+
+    def test_timeout_frees_slot_when_work_finishes(self):
+        pool = ToolExecutor(max_workers=1, max_queue=1, timeout=0.05)
+        release = threading.Event()
+
+        async def run():
+            with pytest.raises(TimeoutError, match="timed out after 0.05 seconds"):
+                await pool.run(_wait_for, release)
+            # The worker still runs the abandoned call, holding its slot.
+            assert pool.in_flight == 1
+            release.set()
+            while pool.in_flight:
+                await asyncio.sleep(0.01)
+            return await pool.run(divmod, 9, 4)
+
+        try:
+            assert asyncio.run(run()) == (2, 1)
+        finally:
+            pool.shutdown()
+
+    def test_timed_out_request_that_has_not_started_is_dropped(self):
+        pool = ToolExecutor(max_workers=1, timeout=0.05)
+        release = threading.Event()
+        ran = []
+
+        async def run():
+            blocker = asyncio.ensure_future(pool.run(_wait_for, release))
+            await asyncio.sleep(0.01)
+            with pytest.raises(TimeoutError):
+                await pool.run(ran.append, "late")
+            release.set()
+            with pytest.raises(TimeoutError):
+                await blocker
+
+        try:
+            asyncio.run(run())
+        finally:
+            pool.shutdown()
+        time.sleep(0.05)
+        assert ran == []
+        assert pool.in_flight == 0
+
+    def test_thread_work_sees_caller_context(self):
+        pool = ToolExecutor()
+        token = contextvars.ContextVar("token", default=None)
+
+        async def run():
+            token.set("caller")
+            return await pool.run(token.get)
+
+        try:
+            assert asyncio.run(run()) == "caller"
+        finally:
+            pool.shutdown()
+
+    def test_process_kind_runs_core_functions(self):
+        pool = ToolExecutor("process", max_workers=1)
+        try:
+            result = asyncio.run(
+                pool.run(validate_smalltalk_method_body_impl, "^ 1 + 2")
+            )
+        finally:
+            pool.shutdown()
+
+        assert result["valid"] is True
+
+
+class TestDefaults:
+    """Tests for the environment-based executor settings."""
+
+    def test_defaults(self, monkeypatch):
+        for name in (
+            "SMALLTALK_VALIDATOR_EXECUTOR",
+            "SMALLTALK_VALIDATOR_WORKERS",
+            "SMALLTALK_VALIDATOR_MAX_QUEUE",
+            "SMALLTALK_VALIDATOR_TIMEOUT_SECONDS",
+        ):
+            monkeypatch.delenv(name, raising=False)
+
+        assert executor_module.default_kind() == "thread"
+        assert 1 <= executor_module.default_workers() <= 4
+        assert executor_module.default_max_queue() == 32
+        assert executor_module.default_timeout() == 300
+
+    def test_environment_overrides(self, monkeypatch):
+        monkeypatch.setenv("SMALLTALK_VALIDATOR_EXECUTOR", "process")
+        monkeypatch.setenv("SMALLTALK_VALIDATOR_WORKERS", "6")
+        monkeypatch.setenv("SMALLTALK_VALIDATOR_MAX_QUEUE", "3")
+        monkeypatch.setenv("SMALLTALK_VALIDATOR_TIMEOUT_SECONDS", "0")
+
+        assert executor_module.default_kind() == "process"
+        assert executor_module.default_workers() == 6
+        assert executor_module.default_max_queue() == 3
+        assert executor_module.default_timeout() is None
+
+    def test_unknown_kind_falls_back_to_threads(self, monkeypatch):
+        monkeypatch.setenv("SMALLTALK_VALIDATOR_EXECUTOR", "fiber")
+
+        assert executor_module.default_kind() == "thread"
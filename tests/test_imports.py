@@ -0,0 +1,63 @@
+"""
+Tests for lazy imports of the package.
+"""
+
+import subprocess
+import sys
+
+import pytest
+
+import smalltalk_validator_mcp_server
+
+
+def _run_fresh(code: str) -> str:
+    """Run *code* in a fresh interpreter and return its stdout."""
+    completed = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    return completed.stdout.strip()
+
+
+class TestLazyImports:
+    """Tests that library imports do not pull in the server or the grammar."""
+
+    def test_core_import_does_not_load_fastmcp_or_grammar(self):
+        output = _run_fresh(
+            "import sys\n"
+            "import smalltalk_validator_mcp_server.core as core\n"
+            "print('fastmcp' in sys.modules, "
+            "'tree_sitter_tonel_smalltalk' in sys.modules)\n"
+            "core.validate_smalltalk_method_body_impl('^ 1')\n"
+            "print('fastmcp' in sys.modules, "
+            "'tree_sitter_tonel_smalltalk' in sys.modules)\n"
+        )
+
+        assert output.splitlines() == ["False False", "False True"]
+
+    def test_core_import_does_not_load_file_helpers(self):
+        output = _run_fresh(
+            "import sys\n"
+            "import smalltalk_validator_mcp_server.core\n"
+            "print(sorted(m for m in ('sqlite3', 'importlib.metadata', "
+            "'multiprocessing', 'smalltalk_validator_mcp_server.disk_cache', "
+            "'smalltalk_validator_mcp_server.index', "
+            "'smalltalk_validator_mcp_server.session', "
+            "'smalltalk_validator_mcp_server.watch') if m in sys.modules))\n"
+        )
+
+        assert output == "[]"
+
+    def test_package_app_is_loaded_on_access(self):
+        output = _run_fresh(
+            "import sys\n"
+            "import smalltalk_validator_mcp_server as pkg\n"
+            "print('smalltalk_validator_mcp_server.server' in sys.modules)\n"
+            "from smalltalk_validator_mcp_server.server import app\n"
+            "print(pkg.app is app)\n"
+        )
+
+        assert output.splitlines() == ["False", "True"]
+
+    def test_unknown_attribute(self):
+        with pytest.raises(AttributeError, match="no attribute 'missing'"):
+            smalltalk_validator_mcp_server.missing  # noqa: B018
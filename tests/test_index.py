@@ -0,0 +1,316 @@
+"""
+Unit tests for the project-wide class index.
+"""
+
+import asyncio
+import io
+import json
+import os
+
+import pytest
+from fastmcp import Client
+
+from smalltalk_validator_mcp_server import cli
+from smalltalk_validator_mcp_server import index as index_module
+from smalltalk_validator_mcp_server.core import (
+    index_tonel_project_impl,
+    lint_tonel_smalltalk_from_file_impl,
+)
+from smalltalk_validator_mcp_server.index import (
+    PROJECT_INDEX_ENV,
+    ProjectIndex,
+    configured_index_path,
+    default_index_path,
+    index_tonel_file,
+    project_index,
+)
+from smalltalk_validator_mcp_server.linter import MethodContext, TonelCSTLinter
+from smalltalk_validator_mcp_server.parser import _PARSER_POOL
+from smalltalk_validator_mcp_server.server import app
+
+_BASE = """Class {
+    #name : #AbBase,
+    #superclass : #Object,
+    #instVars : [ 'name' ],
+    #category : #'Ab-Core'
+}
+
+{ #category : #accessing }
+AbBase >> name [
+    ^ name
+]
+
+{ #category : #'instance creation' }
+AbBase class >> named: aString [
+    ^ self new setName: aString
+]
+"""
+
+_SUB = """Class {
+    #name : #AbSub,
+    #superclass : #AbBase,
+    #instVars : [ 'age' ],
+    #category : #'Ab-Core'
+}
+
+{ #category : #printing }
+AbSub >> describe [
+    ^ name , self age printString
+]
+"""
+
+_EXTENSION = """Extension { #name : #AbSub }
+
+{ #category : #'*Ab-Extras' }
+AbSub >> shout [
+    ^ name asUppercase
+]
+"""
+
+
+@pytest.fixture
+def project(tmp_path):
+    root = tmp_path / "project"
+    (root / "Ab-Core").mkdir(parents=True)
+    (root / "Ab-Extras").mkdir()
+    (root / "Ab-Core" / "AbBase.class.st").write_text(_BASE)
+    (root / "Ab-Core" / "AbSub.class.st").write_text(_SUB)
+    (root / "Ab-Extras" / "AbSub.extension.st").write_text(_EXTENSION)
+    return root
+
+
+@pytest.fixture
+def index_env(tmp_path, monkeypatch):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    monkeypatch.setenv(PROJECT_INDEX_ENV, "")
+    # Restored on teardown, so an index activated by a tool does not leak.
+    monkeypatch.setattr(index_module, "_active_index_path", None)
+
+
+def _rule_ids(issues) -> list[str]:
+    return [issue.rule_id for issue in issues]
+
+
+class TestProjectIndex:
+    """Tests for ProjectIndex."""
+
+    def test_index_tonel_file(self, project):
+        definition = index_tonel_file(str(project / "Ab-Core" / "AbBase.class.st"))
+
+        assert definition == {
+            "kind": "class",
+            "name": "AbBase",
+            "superclass": "Object",
+            "inst_vars": ["name"],
+            "class_vars": [],
+            "selectors": ["name"],
+            "class_selectors": ["named:"],
+        }
+
+    def test_lookups(self, project):
+        index = ProjectIndex(str(project))
+        assert index.update(max_workers=1) == {
+            "indexed_files_count": 3,
+            "removed_files_count": 0,
+        }
+
+        assert index.has_class("AbSub")
+        assert not index.has_class("Object")
+        assert index.superclass("AbSub") == "AbBase"
+        assert index.inst_vars("AbSub") == ("age", "name")
+        assert index.inherited_inst_vars("AbSub") == ("name",)
+        assert index.selectors("AbSub") == {"describe", "shout"}
+        assert index.selectors("AbBase", class_side=True) == {"named:"}
+        assert index.stats()["classes_count"] == 2
+
+    def test_update_only_reparses_changed_files(self, project):
+        index = ProjectIndex(str(project))
+        index.update(max_workers=1)
+        fingerprint = index.fingerprint
+
+        assert index.update(max_workers=1)["indexed_files_count"] == 0
+        sub = project / "Ab-Core" / "AbSub.class.st"
+        sub.write_text(_SUB.replace("'age'", "'age', 'height'"))
+        (project / "Ab-Extras" / "AbSub.extension.st").unlink()
+
+        assert index.update(max_workers=1) == {
+            "indexed_files_count": 1,
+            "removed_files_count": 1,
+        }
+        assert index.inst_vars("AbSub") == ("age", "height", "name")
+        assert index.selectors("AbSub") == {"describe"}
+        assert index.fingerprint != fingerprint
+
+    def test_touched_file_keeps_fingerprint(self, project):
+        index = ProjectIndex(str(project))
+        index.update(max_workers=1)
+        fingerprint = index.fingerprint
+        base = project / "Ab-Core" / "AbBase.class.st"
+        stat = os.stat(base)
+        os.utime(base, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        assert index.update(max_workers=1)["indexed_files_count"] == 1
+        assert index.fingerprint == fingerprint
+
+    def test_save_and_load(self, project, tmp_path):
+        index = ProjectIndex(str(project))
+        index.update(max_workers=1)
+        path = str(tmp_path / "index.json")
+
+        index.save(path)
+        loaded = ProjectIndex.load(path)
+
+        assert loaded.root == index.root
+        assert loaded.fingerprint == index.fingerprint
+        assert loaded.inst_vars("AbSub") == ("age", "name")
+        assert loaded.update(max_workers=1)["indexed_files_count"] == 0
+
+    def test_parallel_build_matches_inline(self, project):
+        inline = ProjectIndex(str(project))
+        inline.update(max_workers=1)
+        parallel = ProjectIndex(str(project))
+        parallel.update(max_workers=2)
+
+        assert parallel.fingerprint == inline.fingerprint
+
+    def test_superclass_cycle_terminates(self, tmp_path):
+        (tmp_path / "A.st").write_text(
+            "Class { #name : #A, #superclass : #B, #instVars : [ 'a' ] }\n"
+        )
+        (tmp_path / "B.st").write_text(
+            "Class { #name : #B, #superclass : #A, #instVars : [ 'b' ] }\n"
+        )
+        index = ProjectIndex(str(tmp_path))
+        index.update(max_workers=1)
+
+        assert index.inst_vars("A") == ("a", "b")
+
+
+class TestIndexedLinting:
+    """Tests for lint checks that use the project index."""
+
+    def _index(self, project) -> ProjectIndex:
+        index = ProjectIndex(str(project))
+        index.update(max_workers=1)
+        return index
+
+    def test_inherited_inst_var_access_is_reported(self, project):
+        without = TonelCSTLinter().lint(_SUB).issues
+        with_index = TonelCSTLinter(index=self._index(project)).lint(_SUB).issues
+
+        assert "direct-access" not in _rule_ids(without)
+        (issue,) = [i for i in with_index if i.rule_id == "direct-access"]
+        assert issue.message == "Direct access to 'name' (use self name)"
+
+    def test_extension_inst_var_access_is_reported(self, project):
+        issues = TonelCSTLinter(index=self._index(project)).lint(_EXTENSION).issues
+
+        assert "direct-access" in _rule_ids(issues)
+
+    def test_inherited_inst_vars_do_not_count_towards_class_checks(self, tmp_path):
+        names = ", ".join(f"'v{i}'" for i in range(8))
+        (tmp_path / "AbWide.class.st").write_text(
+            f"Class {{ #name : #AbWide, #superclass : #Object, #instVars : [ {names} ] }}\n"
+        )
+        sub = (
+            "Class { #name : #AbWider, #superclass : #AbWide,"
+            " #instVars : [ 'a', 'b', 'c' ] }\n\n"
+            "AbWider >> first [\n    ^ self a\n]\n"
+        )
+        (tmp_path / "AbWider.class.st").write_text(sub)
+        linter = TonelCSTLinter(index=self._index(tmp_path))
+
+        assert "too-many-instance-variables" not in _rule_ids(linter.lint(sub).issues)
+
+    def test_only_project_classes_are_collaborators(self, project):
+        linter = TonelCSTLinter(index=self._index(project))
+        root = _PARSER_POOL.parse(
+            b"Class { #name : #AbUser }\n\n"
+            b"AbUser >> run [\n    ^ AbSub new , OrderedCollection new , Foo\n]\n"
+        ).root_node
+        methods = [
+            MethodContext(child, [])
+            for child in root.children
+            if child.type == "method_definition"
+        ]
+
+        assert TonelCSTLinter()._estimate_collaborators(methods, "AbUser") == 3
+        assert linter._estimate_collaborators(methods, "AbUser") == 1
+
+
+class TestIndexTools:
+    """Tests for index_tonel_project and the file lint tool."""
+
+    def test_index_then_lint_file(self, project, index_env):
+        sub = str(project / "Ab-Core" / "AbSub.class.st")
+        assert "direct-access" not in [
+            issue["rule_id"]
+            for issue in lint_tonel_smalltalk_from_file_impl(sub)["issue_list"]
+        ]
+
+        result = index_tonel_project_impl(str(project), max_workers=1)
+
+        assert result["success"] is True
+        assert result["files_count"] == 3
+        assert result["index_path"] == default_index_path(str(project))
+        assert os.environ[PROJECT_INDEX_ENV] == ""
+        assert project_index(result["index_path"]) is not None
+        issues = lint_tonel_smalltalk_from_file_impl(
+            sub, index_path=result["index_path"]
+        )["issue_list"]
+        assert "direct-access" in [issue["rule_id"] for issue in issues]
+
+        again = index_tonel_project_impl(str(project), max_workers=1)
+        assert again["indexed_files_count"] == 0
+
+    def test_files_outside_the_index_are_unaffected(self, project, index_env, tmp_path):
+        index_path = index_tonel_project_impl(str(project), max_workers=1)["index_path"]
+        outside = tmp_path / "AbSub.class.st"
+        outside.write_text(_SUB)
+
+        issues = lint_tonel_smalltalk_from_file_impl(
+            str(outside), index_path=index_path
+        )["issue_list"]
+
+        assert "direct-access" not in [issue["rule_id"] for issue in issues]
+
+    def test_server_tool_applies_the_index_to_file_lints(self, project, index_env):
+        sub = str(project / "Ab-Core" / "AbSub.class.st")
+
+        async def run():
+            async with Client(app) as client:
+                indexed = await client.call_tool(
+                    "index_tonel_project", {"directory": str(project), "max_workers": 1}
+                )
+                linted = await client.call_tool(
+                    "lint_tonel_smalltalk_from_file", {"file_path": sub}
+                )
+                return indexed.structured_content, linted.structured_content
+
+        indexed, linted = asyncio.run(run())
+
+        assert configured_index_path() == indexed["index_path"]
+        assert os.environ[PROJECT_INDEX_ENV] == ""
+        assert "direct-access" in [issue["rule_id"] for issue in linted["issue_list"]]
+
+    def test_not_a_directory(self, tmp_path):
+        result = index_tonel_project_impl(str(tmp_path / "missing"))
+
+        assert result["success"] is False
+        assert "Not a directory" in result["error"]
+
+    @pytest.mark.parametrize("jobs", ["1", "2"])
+    def test_cli_lint_with_index(self, project, index_env, jobs):
+        sub = str(project / "Ab-Core" / "AbSub.class.st")
+        other = str(project / "Ab-Core" / "AbBase.class.st")
+        out = io.StringIO()
+
+        args = cli._parse_args(
+            ["lint", "-j", jobs, sub, other, "--index", str(project)]
+        )
+        cli.run(args, out)
+
+        results = [json.loads(line) for line in out.getvalue().splitlines()[:-1]]
+        (result,) = [r for r in results if r["file_path"] == sub]
+        assert "direct-access" in [issue["rule_id"] for issue in result["issue_list"]]
+        assert os.path.exists(default_index_path(str(project)))
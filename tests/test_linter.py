@@ -3,16 +3,26 @@ Unit tests for TonelCSTLinter.
 """
 
 import os
+import random
+import sys
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import Mock, patch
 
+import pytest
+
+from smalltalk_validator_mcp_server import linter as linter_module
+from smalltalk_validator_mcp_server.core import (
+    lint_tonel_smalltalk_changes_impl as lint_tonel_smalltalk_changes,
+)
 from smalltalk_validator_mcp_server.core import (
     lint_tonel_smalltalk_from_file_impl as lint_tonel_smalltalk_from_file,
 )
 from smalltalk_validator_mcp_server.core import (
     lint_tonel_smalltalk_impl as lint_tonel_smalltalk,
 )
-from smalltalk_validator_mcp_server.linter import TonelCSTLinter
+from smalltalk_validator_mcp_server.linter import LintResult, LintRule, TonelCSTLinter
+from smalltalk_validator_mcp_server.parser import _PARSER_POOL
 
 _CLASS_HEADER = (
     "Class {\n"
@@ -38,9 +48,7 @@ class TestLintTonelSmalltalkFromFile:
     def test_successful_linting_no_issues(self, mock_linter_class):
         """Test successful linting with no issues."""
         mock_linter = Mock()
-        mock_linter.lint_from_file.return_value = []
-        mock_linter.warnings = 0
-        mock_linter.errors = 0
+        mock_linter.lint_from_file.return_value = LintResult([])
         mock_linter_class.return_value = mock_linter
 
         with tempfile.NamedTemporaryFile(mode="w", suffix=".st", delete=False) as f:
@@ -68,11 +76,12 @@ class TestLintTonelSmalltalkFromFile:
         mock_issue.class_name = "TestClass"
         mock_issue.selector = "longMethod"
         mock_issue.is_class_method = False
+        mock_issue.rule_id = "method-length"
+        mock_issue.start_point = (6, 0)
+        mock_issue.end_point = (30, 1)
 
         mock_linter = Mock()
-        mock_linter.lint_from_file.return_value = [mock_issue]
-        mock_linter.warnings = 1
-        mock_linter.errors = 0
+        mock_linter.lint_from_file.return_value = LintResult([mock_issue])
         mock_linter_class.return_value = mock_linter
 
         with tempfile.NamedTemporaryFile(mode="w", suffix=".st", delete=False) as f:
@@ -92,6 +101,9 @@ class TestLintTonelSmalltalkFromFile:
             assert result["issue_list"][0]["class_name"] == "TestClass"
             assert result["issue_list"][0]["selector"] == "longMethod"
             assert result["issue_list"][0]["is_class_method"] is False
+            assert result["issue_list"][0]["rule_id"] == "method-length"
+            assert result["issue_list"][0]["start_point"] == [6, 0]
+            assert result["issue_list"][0]["end_point"] == [30, 1]
         finally:
             os.unlink(temp_path)
 
@@ -123,9 +135,7 @@ class TestLintTonelSmalltalk:
     def test_successful_linting(self, mock_linter_class):
         """Test successful content linting."""
         mock_linter = Mock()
-        mock_linter.lint.return_value = []
-        mock_linter.warnings = 0
-        mock_linter.errors = 0
+        mock_linter.lint.return_value = LintResult([])
         mock_linter_class.return_value = mock_linter
 
         content = "Class { #name : #TestClass }"
@@ -137,7 +147,7 @@ class TestLintTonelSmalltalk:
         assert result["issues_count"] == 0
         assert result["warnings_count"] == 0
         assert result["errors_count"] == 0
-        mock_linter.lint.assert_called_once_with(content)
+        mock_linter.lint.assert_called_once_with(content, progress=None)
 
     @patch("smalltalk_validator_mcp_server.core.TonelCSTLinter")
     def test_linting_with_multiple_issues(self, mock_linter_class):
@@ -148,6 +158,9 @@ class TestLintTonelSmalltalk:
         mock_issue1.class_name = "testClass"
         mock_issue1.selector = None
         mock_issue1.is_class_method = None
+        mock_issue1.rule_id = None
+        mock_issue1.start_point = None
+        mock_issue1.end_point = None
 
         mock_issue2 = Mock()
         mock_issue2.severity = "warning"
@@ -155,11 +168,12 @@ class TestLintTonelSmalltalk:
         mock_issue2.class_name = "testClass"
         mock_issue2.selector = None
         mock_issue2.is_class_method = None
+        mock_issue2.rule_id = None
+        mock_issue2.start_point = None
+        mock_issue2.end_point = None
 
         mock_linter = Mock()
-        mock_linter.lint.return_value = [mock_issue1, mock_issue2]
-        mock_linter.warnings = 1
-        mock_linter.errors = 1
+        mock_linter.lint.return_value = LintResult([mock_issue1, mock_issue2])
         mock_linter_class.return_value = mock_linter
 
         content = "Class { #name : #testClass }"
@@ -195,7 +209,7 @@ class TestSingletonClassVarCheck:
     """Tests for singleton class variable detection in TonelCSTLinter."""
 
     def _lint(self, content: str):
-        return TonelCSTLinter().lint(content)
+        return TonelCSTLinter().lint(content).issues
 
     def _singleton_issues(self, issues):
         return [i for i in issues if "singleton holder" in i.message]
@@ -271,7 +285,7 @@ class TestClassCommentCheck:
     """Tests for missing class comment detection in TonelCSTLinter."""
 
     def _lint(self, content: str):
-        return TonelCSTLinter().lint(content)
+        return TonelCSTLinter().lint(content).issues
 
     def _comment_issues(self, issues):
         return [i for i in issues if "Missing class comment" in i.message]
@@ -348,7 +362,7 @@ class TestOwnClassDirectReferenceCheck:
     """Tests for direct own-class references that should use self/self class."""
 
     def _lint(self, content: str):
-        return TonelCSTLinter().lint(content)
+        return TonelCSTLinter().lint(content).issues
 
     def _self_class_reference_issues(self, issues):
         return [i for i in issues if "Direct reference to own class" in i.message]
@@ -380,6 +394,25 @@ class TestOwnClassDirectReferenceCheck:
         assert issues[0].selector == "otherWithSameAmount"
         assert issues[0].is_class_method is False
 
+    def test_warns_for_lowercase_class_name(self):
+        content = (
+            "Class {\n"
+            "    #name : #myClass,\n"
+            "    #superclass : #Object,\n"
+            "    #category : #SomePackage\n"
+            "}\n"
+            "\n"
+            "{ #category : #instance }\n"
+            "myClass >> copyOfMe [\n"
+            '    "not myClass itself"\n'
+            "    ^ myClass new\n"
+            "]\n"
+        )
+
+        issues = self._self_class_reference_issues(self._lint(content))
+        assert len(issues) == 1
+        assert "myClass" in issues[0].message
+
     def test_warns_in_class_method_when_referencing_own_class_directly(self):
         content = (
             "Class {\n"
@@ -488,7 +521,7 @@ class TestDirectAccessCheck:
     """Tests for _check_direct_access: direct instance variable access detection."""
 
     def _lint(self, content: str):
-        return TonelCSTLinter().lint(content)
+        return TonelCSTLinter().lint(content).issues
 
     def _direct_access_issues(self, issues):
         return [i for i in issues if "Direct access to" in i.message]
@@ -757,7 +790,7 @@ class TestIsKindOfUsageCheck:
     """Tests for discouraging isKindOf: checks in methods."""
 
     def _lint(self, content: str):
-        return TonelCSTLinter().lint(content)
+        return TonelCSTLinter().lint(content).issues
 
     def _iskindof_issues(self, issues):
         return [i for i in issues if "Avoid isKindOf: checks" in i.message]
@@ -843,7 +876,7 @@ class TestNilBranchingCheck:
     """Tests for isNil/notNil + ifTrue:/ifFalse: branching anti-patterns."""
 
     def _lint(self, content: str):
-        return TonelCSTLinter().lint(content)
+        return TonelCSTLinter().lint(content).issues
 
     def _nil_issues(self, issues):
         return [i for i in issues if "nil-safe branching" in i.message]
@@ -876,6 +909,15 @@ class TestNilBranchingCheck:
         assert len(issues) == 1
         assert "ifNotNil:" in issues[0].message
 
+    def test_warns_inside_nested_blocks(self):
+        content = _CLASS_HEADER + self._method(
+            "    items do: [:each | [ [ (each at: #key) isNil ifTrue: [ ^ self ] ]"
+            " value ] value ]"
+        )
+        issues = self._nil_issues(self._lint(content))
+        assert len(issues) == 1
+        assert "ifNil:" in issues[0].message
+
     def test_warns_on_notnil_iffalse(self):
         content = _CLASS_HEADER + self._method("    value notNil ifFalse: [ ^ self ]")
         issues = self._nil_issues(self._lint(content))
@@ -958,7 +1000,7 @@ class TestEmptyBranchingCheck:
     """Tests for isEmpty/notEmpty + ifTrue:/ifFalse: branching anti-patterns."""
 
     def _lint(self, content: str):
-        return TonelCSTLinter().lint(content)
+        return TonelCSTLinter().lint(content).issues
 
     def _empty_issues(self, issues):
         return [i for i in issues if "collection branching" in i.message]
@@ -1066,7 +1108,7 @@ class TestCollectionAccessCheck:
     """Tests for at: N / at: size patterns that can use first/second/.../sixth/last."""
 
     def _lint(self, content: str):
-        return TonelCSTLinter().lint(content)
+        return TonelCSTLinter().lint(content).issues
 
     def _access_issues(self, issues):
         return [i for i in issues if "idiomatic collection access" in i.message]
@@ -1178,3 +1220,554 @@ class TestCollectionAccessCheck:
         messages = {i.message for i in issues}
         assert any("first" in m for m in messages)
         assert any("second" in m for m in messages)
+
+    def test_warns_on_at_in_cascade(self):
+        content = _CLASS_HEADER + self._method("    ^ col add: 3; at: 1")
+        issues = self._access_issues(self._lint(content))
+        assert len(issues) == 1
+        assert "first" in issues[0].message
+
+    def test_warns_on_at_in_nested_blocks(self):
+        content = _CLASS_HEADER + self._method(
+            "    ^ [ [ [ col at: 1 ] value ] value ] value"
+        )
+        issues = self._access_issues(self._lint(content))
+        assert len(issues) == 1
+
+    def test_warns_on_at_parenthesized_receiver_size(self):
+        content = _CLASS_HEADER + self._method("    ^ (col) at: (col) size")
+        issues = self._access_issues(self._lint(content))
+        assert len(issues) == 1
+        assert "last" in issues[0].message
+
+    def test_no_warning_for_at_size_put(self):
+        content = _CLASS_HEADER + self._method("    col at: col size put: value")
+        issues = self._access_issues(self._lint(content))
+        assert len(issues) == 0
+
+
+class TestLintResult:
+    """Tests for the per-call lint result and sharing one linter."""
+
+    def _content(self, index: int) -> str:
+        methods = "".join(
+            f"{{ #category : #private }}\nMyClass >> m{m} [\n"
+            + "    x isNil ifTrue: [ ^ col at: 1 ].\n" * (index % 4)
+            + "    ^ self\n" * (m * 6)
+            + "]\n\n"
+            for m in range(index % 7)
+        )
+        return _CLASS_HEADER + methods
+
+    def test_counts_issues_by_severity(self):
+        result = LintResult(
+            [
+                linter_module.LintIssue("warning", "a"),
+                linter_module.LintIssue("error", "b"),
+                linter_module.LintIssue("warning", "c"),
+            ]
+        )
+
+        assert [i.message for i in result.issues] == ["a", "b", "c"]
+        assert result.warnings == 2
+        assert result.errors == 1
+
+    def test_result_is_read_only(self):
+        result = TonelCSTLinter().lint(self._content(5))
+
+        assert isinstance(result.issues, tuple)
+        for name in ("issues", "warnings", "errors", "extra"):
+            with pytest.raises(AttributeError):
+                setattr(result, name, 0)
+
+    def test_linter_keeps_no_per_call_state(self):
+        linter = TonelCSTLinter()
+        first = linter.lint(self._content(5))
+        second = linter.lint(_CLASS_HEADER)
+
+        assert first.warnings > 0
+        assert first.issues != second.issues
+        assert vars(linter) == {"index": None}
+
+    def test_shared_linter_under_thread_pool(self):
+        contents = [self._content(i) for i in range(200)]
+        expected = [TonelCSTLinter().lint(content) for content in contents]
+        linter = TonelCSTLinter()
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(pool.map(linter.lint, contents * 3))
+
+        for index, result in enumerate(results):
+            want = expected[index % len(contents)]
+            assert (result.warnings, result.errors) == (want.warnings, want.errors)
+            assert [i.message for i in result.issues] == [
+                i.message for i in want.issues
+            ]
+
+
+class TestBodyScan:
+    """Tests for the single-pass body scanner."""
+
+    def test_skips_comments_and_literals(self):
+        body = (
+            "\"Uses Foo\" ^ Bar new: 'Baz ''Qux'' \"Quux\"'"
+            " with: #Corge with: #'Grault' with: Garply"
+        )
+        assert linter_module._scan_body(body) == {"Bar", "Garply"}
+
+    def test_ignores_capitals_inside_identifiers(self):
+        body = "^ fooBar with: Baz_2 with: x1Y"
+        assert linter_module._scan_body(body) == {"Baz_2"}
+
+    def test_body_without_uppercase_is_not_matched(self):
+        with patch.object(linter_module, "_BODY_SCAN_RE") as scan_re:
+            assert linter_module._scan_body("^ items collect: [:x | x]") == set()
+        scan_re.findall.assert_not_called()
+
+    def test_sanitize_replaces_literals(self):
+        body = "\"note\" ^ #sym -> #'a b' -> 'it''s'"
+        assert linter_module._sanitize_body(body) == " ^ # -> #'' -> ''"
+
+
+class TestRuleEngine:
+    """Tests for the single-pass method rule engine."""
+
+    _CONTENT = (
+        "Class {\n"
+        "    #name : #MpFoo,\n"
+        "    #superclass : #Object,\n"
+        "    #instVars : [ 'a' ],\n"
+        "    #category : #SomePackage\n"
+        "}\n\n"
+        + "".join(
+            f"MpFoo >> m{i} [\n  ^ [:x | x foo: a] value: OrderedCollection new\n]\n\n"
+            for i in range(6)
+        )
+    )
+
+    def test_body_is_scanned_once_per_method(self):
+        with (
+            patch(
+                "smalltalk_validator_mcp_server.linter._scan_body",
+                wraps=linter_module._scan_body,
+            ) as scan,
+            patch(
+                "smalltalk_validator_mcp_server.linter._sanitize_body",
+                wraps=linter_module._sanitize_body,
+            ) as sanitize,
+        ):
+            issues = TonelCSTLinter().lint(self._CONTENT).issues
+
+        assert any("Missing class comment" in i.message for i in issues)
+        assert scan.call_count == 6
+        assert sanitize.call_count == 0
+
+    def test_custom_rule_receives_registered_node_types(self):
+        class CountBlocks(LintRule):
+            node_types = frozenset({"block"})
+
+            def start(self, ctx):
+                self.blocks = 0
+                return True
+
+            def visit(self, node, ctx):
+                self.blocks += 1
+
+            def finish(self, ctx):
+                return [ctx.issue("warning", f"{self.blocks} block(s)")]
+
+        class Linter(TonelCSTLinter):
+            method_rules = (CountBlocks,)
+
+        issues = Linter().lint(self._CONTENT).issues
+
+        method_issues = [i for i in issues if i.selector]
+        assert [i.message for i in method_issues] == ["1 block(s)"] * 6
+        assert {i.selector for i in method_issues} == {f"m{i}" for i in range(6)}
+
+    def test_rule_skipped_when_start_returns_false(self):
+        class Never(LintRule):
+            node_types = frozenset({"identifier"})
+
+            def start(self, ctx):
+                return False
+
+            def visit(self, node, ctx):
+                raise AssertionError("visited a skipped rule")
+
+        class Linter(TonelCSTLinter):
+            method_rules = (Never,)
+
+        with patch(
+            "smalltalk_validator_mcp_server.linter.QueryCursor",
+            side_effect=AssertionError("queried without active rules"),
+        ):
+            issues = Linter().lint(self._CONTENT).issues
+
+        assert all(not i.selector for i in issues)
+
+    def test_custom_rule_indexes_registered_selectors(self):
+        class CountSends(LintRule):
+            selectors = frozenset({"foo:", "value:", "new"})
+
+            def finish(self, ctx):
+                return [
+                    ctx.issue("warning", f"{sel} {len(ctx.sends.get(sel, []))}")
+                    for sel in sorted(self.selectors)
+                ]
+
+        class Linter(TonelCSTLinter):
+            method_rules = (CountSends,)
+
+        issues = [i for i in Linter().lint(self._CONTENT).issues if i.selector]
+
+        assert [i.message for i in issues[:3]] == ["foo: 1", "new 1", "value: 1"]
+
+    def test_block_argument_scope_ends_with_block(self):
+        content = self._CONTENT.replace(
+            "[:x | x foo: a]", "[:a | [:b | a foo: b] value: a] value: 1. a"
+        )
+
+        issues = TonelCSTLinter().lint(content).issues
+
+        assert len([i for i in issues if "Direct access to 'a'" in i.message]) == 6
+
+    def test_block_argument_shadows_inst_var(self):
+        content = self._CONTENT.replace("[:x | x foo: a]", "[:a | a foo]")
+
+        issues = TonelCSTLinter().lint(content).issues
+
+        assert not [i for i in issues if "Direct access" in i.message]
+
+
+class TestIssueLocations:
+    """Tests for the rule ids and regions attached to lint issues."""
+
+    _CONTENT = (
+        "Class {\n"
+        "    #name : #Foo,\n"
+        "    #superclass : #Object,\n"
+        "    #instVars : [ 'items' ],\n"
+        "    #category : #SomePackage\n"
+        "}\n\n"
+        "Foo >> check [\n"
+        "  1 isNil ifTrue: [ ^ 0 ].\n"
+        "  ^ (items at: 1) isKindOf: Foo\n"
+        "]\n"
+    )
+
+    def _issues(self) -> dict:
+        return {i.rule_id: i for i in TonelCSTLinter().lint(self._CONTENT).issues}
+
+    def test_every_issue_has_a_rule_id(self):
+        assert set(self._issues()) == {
+            "class-prefix",
+            "direct-access",
+            "self-class-reference",
+            "is-kind-of",
+            "nil-branching",
+            "collection-access",
+        }
+
+    def test_class_issues_span_the_definition(self):
+        issue = self._issues()["class-prefix"]
+
+        assert issue.start_point == (0, 0)
+        assert issue.end_point == (5, 1)
+
+    def test_method_issues_point_at_the_offending_node(self):
+        issues = self._issues()
+
+        assert issues["direct-access"].start_point == (9, 5)
+        assert issues["direct-access"].end_point == (9, 10)
+        # Sends span their receiver.
+        assert issues["nil-branching"].start_point == (8, 2)
+        assert issues["nil-branching"].end_point == (8, 25)
+        assert issues["collection-access"].start_point == (9, 5)
+        assert issues["collection-access"].end_point == (9, 16)
+        assert issues["is-kind-of"].start_point == (9, 4)
+        # Found by text scan, so located at the whole body.
+        assert issues["self-class-reference"].start_point == (8, 2)
+        assert issues["self-class-reference"].end_point == (9, 31)
+
+    def test_custom_rule_issues_default_to_the_method(self):
+        class Always(LintRule):
+            rule_id = "always"
+
+            def finish(self, ctx):
+                return [ctx.issue("warning", "always")]
+
+        class Linter(TonelCSTLinter):
+            method_rules = (Always,)
+
+        (issue,) = [i for i in Linter().lint(self._CONTENT).issues if i.selector]
+
+        assert issue.rule_id == "always"
+        assert issue.start_point == (7, 0)
+        assert issue.end_point == (10, 1)
+
+    def test_encoding_error_is_located(self, tmp_path):
+        path = tmp_path / "Bad.st"
+        path.write_bytes(b'Class { #name : #Bad }\n\n"\xff"\n')
+
+        (issue,) = TonelCSTLinter().lint_from_file(path).issues
+
+        assert issue.rule_id == "encoding-error"
+        assert issue.start_point == (2, 1)
+
+
+class TestAdversarialBodies:
+    """Lint work per KiB stays bounded on bodies built to stress the checks.
+
+    Work is counted as the Python and C function calls the checks make, so
+    the assertions do not depend on machine speed; parsing is left to
+    tree-sitter.  benchmarks/bench_lint_adversarial.py reports wall-clock
+    times, including parsing.
+    """
+
+    # Generous: typical figures are 100-1400 calls/KiB.
+    _MAX_CALLS_PER_KIB = 5000
+
+    _SOUP_TOKENS = (
+        "[", "]", "(", ")", "x", "items", "isNil", "notNil", "isEmpty",
+        "ifTrue:", "ifFalse:", "at:", "1", "size", ";", ".", "^", ":=", "|",
+        ":each", "#sym", "'str'", '"note"', "MyClass", "isKindOf:",
+    )  # fmt: skip
+
+    _GENERATORS = {
+        "nested blocks": lambda n: (
+            "items isNil ifTrue: " + "[ :each | " * n + "items" + " ]" * n
+        ),
+        "many branches": lambda n: "".join(
+            f"items isNil ifTrue: [ [:items | items ] ] ifFalse: [ items at: {i} ].\n"
+            for i in range(n)
+        ),
+        "long cascade": lambda n: (
+            "items " + "; ".join(f"at: {i % 7} put: {i}" for i in range(n))
+        ),
+        "brackets in literals": lambda n: (
+            f"^ items isNil ifTrue: [ '{'[' * n}' ] ifFalse: [ \"{']' * n}\" ]"
+        ),
+        "unbalanced brackets": lambda n: "items isNil ifTrue: [ items " + "[ 1 ] " * n,
+    }
+
+    def _source(self, body: str) -> str:
+        return (
+            "Class {\n    #name : #MyClass,\n    #superclass : #Object,\n"
+            "    #instVars : [ 'items' ],\n    #category : #SomePackage\n}\n\n"
+            f"{{ #category : #private }}\nMyClass >> stress [\n{body}\n]\n"
+        )
+
+    def _calls_per_kib(self, source: str) -> float:
+        tree = _PARSER_POOL.parse(source.encode("utf-8"))
+        linter = TonelCSTLinter()
+        # Count the checks themselves, not method-cache hits.
+        linter.method_cache = linter_module.MethodIssueCache(max_entries=0)
+        calls = 0
+
+        def count(frame, event, arg):
+            nonlocal calls
+            if event in ("call", "c_call"):
+                calls += 1
+
+        sys.setprofile(count)
+        try:
+            linter.lint_tree(tree)
+        finally:
+            sys.setprofile(None)
+        return calls / (len(source.encode("utf-8")) / 1024)
+
+    def test_work_per_kib_is_bounded_and_does_not_grow(self):
+        for name, generate in self._GENERATORS.items():
+            small = self._calls_per_kib(self._source(generate(150)))
+            large = self._calls_per_kib(self._source(generate(1200)))
+            assert large < self._MAX_CALLS_PER_KIB, name
+            # A check that is quadratic in the body would do ~8x more per KiB.
+            assert large < small * 2, name
+
+    def test_random_token_soup(self):
+        rng = random.Random(20240601)
+        for _ in range(50):
+            body = " ".join(
+                rng.choice(self._SOUP_TOKENS) for _ in range(rng.randint(1, 400))
+            )
+            source = self._source(body)
+            issues = TonelCSTLinter().lint(source).issues
+            assert all(issue.severity in ("warning", "error") for issue in issues)
+            assert self._calls_per_kib(source) < self._MAX_CALLS_PER_KIB
+
+
+class TestChangedMethodLinting:
+    """Tests for linting only the methods touched by a change."""
+
+    _HEADER = (
+        "Class {\n"
+        "    #name : #Account,\n"
+        "    #superclass : #Object,\n"
+        "    #instVars : [ 'amount' ],\n"
+        "    #category : #SomePackage\n"
+        "}\n"
+    )
+
+    def _content(self, bodies: list[str], header: str | None = None) -> str:
+        return (header or self._HEADER) + "".join(
+            f"\n{{ #category : #private }}\nAccount >> m{i} [\n    {body}\n]\n"
+            for i, body in enumerate(bodies)
+        )
+
+    def _selectors(self, issues) -> list[str]:
+        return sorted({issue.selector for issue in issues if issue.selector})
+
+    def test_diff_line_ranges_skip_context_lines(self):
+        diff = (
+            "--- a/MyClass.st\n"
+            "+++ b/MyClass.st\n"
+            "@@ -10,3 +10,4 @@ MyClass >> m1 [\n"
+            " a\n"
+            "-b\n"
+            "+B\n"
+            "+C\n"
+            " d\n"
+            "@@ -20,2 +21,0 @@\n"
+            "-x\n"
+            "-y\n"
+        )
+
+        assert linter_module.diff_line_ranges(diff) == [(9, 12), (20, 22)]
+
+    def test_content_line_ranges(self):
+        assert linter_module.content_line_ranges("a\nb\nc\n", "a\nB\nc\nd\n") == [
+            (1, 2),
+            (3, 4),
+        ]
+
+    def test_only_overlapping_methods_are_checked(self):
+        old = self._content(["^ amount", "^ amount", "^ amount"])
+        new = self._content(["^ amount", "^ amount + 1", "^ amount"])
+
+        changed = linter_module.content_line_ranges(old, new)
+        issues = TonelCSTLinter().lint(new, changed=changed).issues
+
+        assert self._selectors(issues) == ["m1"]
+        assert all(issue.rule_id != "class-prefix" for issue in issues)
+
+    def test_deleted_lines_check_neighbouring_method(self):
+        old = self._content(["^ amount", "amount printString.\n    ^ amount"])
+        new = self._content(["^ amount", "^ amount"])
+
+        changed = linter_module.content_line_ranges(old, new)
+        issues = TonelCSTLinter().lint(new, changed=changed).issues
+
+        assert self._selectors(issues) == ["m1"]
+
+    def test_class_definition_change_lints_every_method(self):
+        old = self._content(["^ amount", "^ total"])
+        new = self._content(
+            ["^ amount", "^ total"],
+            header=self._HEADER.replace("'amount'", "'amount', 'total'"),
+        )
+
+        changed = linter_module.content_line_ranges(old, new)
+        issues = TonelCSTLinter().lint(new, changed=changed).issues
+
+        assert self._selectors(issues) == ["m0", "m1"]
+        assert any(issue.rule_id == "class-prefix" for issue in issues)
+
+    def test_no_change_reports_nothing(self):
+        content = self._content(["^ amount"])
+
+        assert TonelCSTLinter().lint(content, changed=[]).issues == ()
+
+    def test_changes_impl_accepts_diff(self):
+        content = self._content(["^ amount", "^ amount"])
+        diff = "@@ -15,1 +15,1 @@\n-    ^ 1\n+    ^ amount\n"
+
+        result = lint_tonel_smalltalk_changes(content, diff=diff)
+
+        assert result["success"] is True
+        assert result["changed_ranges"] == [[13, 15]]
+        assert {issue["selector"] for issue in result["issue_list"]} == {"m1"}
+
+    def test_changes_impl_requires_a_change(self):
+        result = lint_tonel_smalltalk_changes(self._content([]))
+
+        assert result["success"] is False
+        assert "diff or old_content" in result["error"]
+
+
+class TestMethodIssueCache:
+    """Tests for reusing the issues of unchanged methods."""
+
+    def _content(self, inst_vars: str = "'amount'", extra: str = "") -> str:
+        return (
+            "Class {\n"
+            "    #name : #Account,\n"
+            "    #superclass : #Object,\n"
+            f"    #instVars : [ {inst_vars} ],\n"
+            "    #category : #SomePackage\n"
+            "}\n"
+            f"{extra}"
+            "\n{ #category : #private }\n"
+            "Account >> total [\n"
+            "    ^ amount isNil ifTrue: [ Account new ]\n"
+            "]\n"
+        )
+
+    def _summary(self, result: LintResult) -> list[tuple]:
+        return [
+            (i.rule_id, i.selector, i.message, i.start_point, i.end_point)
+            for i in result.issues
+        ]
+
+    def test_unchanged_method_skips_checks(self):
+        first = TonelCSTLinter().lint(self._content())
+        with patch.object(
+            TonelCSTLinter, "_check_method", side_effect=AssertionError("rechecked")
+        ):
+            second = TonelCSTLinter().lint(self._content())
+
+        assert self._summary(second) == self._summary(first)
+        assert linter_module.method_issue_cache().stats()["hits"] == 1
+
+    def test_moved_method_issues_are_relocated(self):
+        TonelCSTLinter().lint(self._content())
+        moved = self._content(extra="\n\n\n")
+
+        cached = TonelCSTLinter().lint(moved)
+        linter_module.method_issue_cache().clear()
+        fresh = TonelCSTLinter().lint(moved)
+
+        assert self._summary(cached) == self._summary(fresh)
+        assert linter_module.method_issue_cache().stats()["misses"] == 1
+
+    def test_inst_var_change_invalidates(self):
+        before = TonelCSTLinter().lint(self._content())
+        after = TonelCSTLinter().lint(self._content(inst_vars="'balance'"))
+
+        rule_ids = [issue.rule_id for issue in before.issues]
+        assert "direct-access" in rule_ids
+        assert "direct-access" not in [issue.rule_id for issue in after.issues]
+
+    def test_capacity_is_bounded(self):
+        cache = linter_module.MethodIssueCache(max_entries=1)
+        linter = TonelCSTLinter()
+        linter.method_cache = cache
+
+        linter.lint(self._content())
+        linter.lint(self._content(inst_vars="'balance'"))
+
+        assert cache.stats()["entries"] == 1
+
+    def test_zero_capacity_disables(self):
+        linter = TonelCSTLinter()
+        linter.method_cache = linter_module.MethodIssueCache(max_entries=0)
+
+        linter.lint(self._content())
+
+        assert linter.method_cache.stats() == {
+            "enabled": False,
+            "entries": 0,
+            "max_entries": 0,
+            "hits": 0,
+            "misses": 0,
+        }
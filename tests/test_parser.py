@@ -0,0 +1,240 @@
+"""
+Unit tests for the tree-sitter parser helpers.
+"""
+
+import gc
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from smalltalk_validator_mcp_server.parser import (
+    ParserPool,
+    SmalltalkMethodParser,
+    TonelTreeSitterParser,
+)
+
+_SOURCE = b"Class { #name : #PoolClass }\n\nPoolClass >> foo [\n  ^ 42\n]\n"
+
+
+class TestParserPool:
+    """Tests for ParserPool."""
+
+    def test_reuses_parser_within_thread(self):
+        pool = ParserPool(max_size=2)
+        first = pool.parse(_SOURCE)
+        second = pool.parse(_SOURCE)
+
+        assert first.root_node.type == "source_file"
+        assert not second.root_node.has_error
+        assert pool.created == 1
+        assert pool.size() == 1
+
+    def test_each_thread_leases_its_own_parser(self):
+        pool = ParserPool(max_size=4)
+
+        def work():
+            for _ in range(3):
+                pool.parse(_SOURCE)
+
+        threads = [threading.Thread(target=work) for _ in range(3)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        gc.collect()
+
+        assert pool.created == 3
+        # Leases are released once their threads have exited.
+        assert pool.size() == 0
+
+    def test_size_is_bounded(self):
+        pool = ParserPool(max_size=1)
+        pool.parse(_SOURCE)
+
+        def work():
+            pool.parse(_SOURCE)
+            pool.parse(_SOURCE)
+
+        thread = threading.Thread(target=work)
+        thread.start()
+        thread.join()
+
+        # The second thread could not lease and parsed with a fresh parser
+        # on each call.
+        assert pool.created == 3
+        assert pool.size() == 1
+
+    def test_failed_parse_drops_parser(self):
+        pool = ParserPool(max_size=2)
+        pool.parse(_SOURCE)
+
+        with patch(
+            "smalltalk_validator_mcp_server.parser.Parser.parse",
+            side_effect=RuntimeError("boom"),
+        ):
+            with pytest.raises(RuntimeError):
+                pool.parse(_SOURCE)
+        gc.collect()
+
+        assert pool.size() == 0
+        pool.parse(_SOURCE)
+        assert pool.created == 2
+
+
+def _deeply_nested_method(depth: int) -> str:
+    body = "^ " + "[ " * depth + "1 + + 2" + " ]" * depth
+    return "Class { #name : #Deep }\n\nDeep >> deep [\n" + body + "\n]\n"
+
+
+class TestErrorCollection:
+    """Tests for cursor-based error collection."""
+
+    def test_reports_context_and_parent_type(self):
+        content = (
+            "Class { #name : #Broken }\n\n"
+            "Broken >> ok [\n  ^ 1\n]\n\n"
+            "Broken >> bad [\n  ^ 1 + + 2\n]\n"
+        )
+        result = TonelTreeSitterParser().parse(content)
+
+        assert result["valid"] is False
+        assert result["errors"]
+        for error in result["errors"]:
+            assert error["context"] == "Broken >> bad"
+            assert error["start_point"][0] == 7
+        assert result["errors"][0]["parent_type"] == "binary_message"
+
+    def test_deep_nesting_does_not_recurse(self):
+        content = _deeply_nested_method(3000)
+
+        result = TonelTreeSitterParser().parse(content)
+
+        assert result["valid"] is False
+        assert all(e["context"] == "Deep >> deep" for e in result["errors"])
+
+    def test_deep_nesting_ignored_in_tonel_only_mode(self):
+        content = _deeply_nested_method(3000)
+
+        result = TonelTreeSitterParser(ignore_method_body_errors=True).parse(content)
+
+        assert result == {"valid": True, "errors": []}
+
+    def test_method_parser_handles_deep_nesting(self):
+        body = "^ " + "[ " * 3000 + "1 + + 2" + " ]" * 3000
+
+        result = SmalltalkMethodParser().parse(body)
+
+        assert result["valid"] is False
+        assert result["errors"][0]["start_point"][0] == 0
+        assert result["errors"][0]["context"] is None
+
+    def test_clean_file_skips_cst_walk(self):
+        content = "Class { #name : #Clean }\n\nClean >> ok [\n  ^ 1\n]\n"
+
+        with patch(
+            "smalltalk_validator_mcp_server.parser._collect_errors",
+            side_effect=AssertionError("CST walked for a clean file"),
+        ):
+            result = TonelTreeSitterParser().parse(content)
+
+        assert result == {"valid": True, "errors": []}
+
+    def test_error_found_among_many_clean_methods(self):
+        methods = "".join(f"Big >> m{i} [\n  ^ {i}\n]\n\n" for i in range(500))
+        content = (
+            "Class { #name : #Big }\n\n" + methods + "Big >> bad [\n  ^ 1 + + 2\n]\n"
+        )
+
+        result = TonelTreeSitterParser().parse(content)
+
+        assert result["valid"] is False
+        assert {e["context"] for e in result["errors"]} == {"Big >> bad"}
+
+
+class TestErrorLimits:
+    """Tests for the size limits on reported errors."""
+
+    _MANY_ERRORS = "Class { #name : #Foo }\n\n" + "".join(
+        f"Foo >> m{i} [\n  ^ 1 + + {i}\n]\n\n" for i in range(10)
+    )
+
+    def test_nested_errors_are_reported_once(self):
+        content = "Class { #name : #Foo }\n\nFoo >> m [\n  ^ [ ( ] ) foo: ]\n]\n"
+
+        result = TonelTreeSitterParser().parse(content)
+
+        [error] = result["errors"]
+        assert error["start_point"] == [2, 0]
+        assert error["end_point"] == [4, 1]
+
+    def test_max_errors_truncates(self):
+        result = TonelTreeSitterParser(max_errors=3).parse(self._MANY_ERRORS)
+
+        assert len(result["errors"]) == 3
+        assert result["truncated"] is True
+
+    def test_truncated_result_stays_invalid(self):
+        result = TonelTreeSitterParser(max_errors=0).parse(self._MANY_ERRORS)
+
+        assert result["errors"] == []
+
+        assert result["valid"] is False
+        assert result["truncated"] is True
+
+    def test_within_limits_is_not_truncated(self):
+        result = TonelTreeSitterParser(max_errors=10).parse(self._MANY_ERRORS)
+
+        assert len(result["errors"]) == 10
+        assert "truncated" not in result
+
+    def test_snippet_is_cut_on_a_character_boundary(self):
+        content = "Class { #name : #Foo }\n\nFoo >> m [\n  ^ 1 + + éé\n]\n"
+        full = TonelTreeSitterParser(max_snippet_bytes=None).parse(content)
+        text = full["errors"][0]["text"]
+        cut = len(text.encode("utf-8")) - 1
+
+        result = TonelTreeSitterParser(max_snippet_bytes=cut).parse(content)
+
+        [error] = result["errors"]
+        assert error["text"] == text[:-1]
+        assert error["text_truncated"] is True
+        assert result["truncated"] is True
+
+    def test_method_parser_applies_limits(self):
+        body = "^ 1 + + 2.\n^ 3 + + 4.\n^ 5 + + 6"
+
+        result = SmalltalkMethodParser(max_errors=1).parse(body)
+
+        assert len(result["errors"]) == 1
+        assert result["truncated"] is True
+
+
+class TestMethodBodyBatch:
+    """Tests for SmalltalkMethodParser.parse_many."""
+
+    def test_matches_individual_parses(self):
+        bodies = [
+            "^ self name",
+            "^ 1 + + 2",
+            "^ 'unterminated",
+            "x := ]",
+            "[:e | e foo",
+            "^ #(1 2 3) collect: [:e | e * 2]",
+        ]
+        parser = SmalltalkMethodParser()
+
+        assert parser.parse_many(bodies) == [parser.parse(body) for body in bodies]
+
+    def test_clean_batch_parses_once(self):
+        parser = SmalltalkMethodParser()
+
+        with patch.object(
+            parser, "parse", side_effect=AssertionError("fell back to parse")
+        ):
+            results = parser.parse_many([f"^ {i}" for i in range(50)])
+
+        assert results == [{"valid": True, "errors": []}] * 50
+
+    def test_empty_batch(self):
+        assert SmalltalkMethodParser().parse_many([]) == []
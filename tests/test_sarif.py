@@ -0,0 +1,126 @@
+"""
+Unit tests for the streaming SARIF writer.
+"""
+
+import io
+import json
+import os
+
+from smalltalk_validator_mcp_server.core import (
+    lint_tonel_smalltalk_from_file_impl,
+    validate_tonel_smalltalk_from_file_impl,
+)
+from smalltalk_validator_mcp_server.linter import METHOD_RULES
+from smalltalk_validator_mcp_server.sarif import RULES, SarifWriter
+
+_FIXTURES_DIR = os.path.join(os.path.dirname(__file__), "fixtures")
+_INVALID = os.path.join(_FIXTURES_DIR, "invalid_syntax.st")
+
+
+def _results(log: dict) -> list[dict]:
+    return log["runs"][0]["results"]
+
+
+class TestSarifWriter:
+    """Tests for SarifWriter."""
+
+    def test_empty_log_is_valid_sarif(self):
+        out = io.StringIO()
+        SarifWriter(out).close()
+
+        log = json.loads(out.getvalue())
+        assert log["version"] == "2.1.0"
+        run = log["runs"][0]
+        assert run["tool"]["driver"]["name"] == "smalltalk-validator"
+        assert [rule["id"] for rule in run["tool"]["driver"]["rules"]] == [
+            rule_id for rule_id, _ in RULES
+        ]
+        assert run["results"] == []
+
+    def test_every_lint_rule_has_a_rule_entry(self):
+        rule_ids = {rule_id for rule_id, _ in RULES}
+
+        assert {rule.rule_id for rule in METHOD_RULES} <= rule_ids
+
+    def test_results_are_written_before_close(self):
+        out = io.StringIO()
+        writer = SarifWriter(out, base_dir=_FIXTURES_DIR)
+        writer.add_validation_result(validate_tonel_smalltalk_from_file_impl(_INVALID))
+        partial = out.getvalue()
+
+        assert writer.results_count == 2
+        assert partial.count('"ruleId":"syntax-error"') == 2
+        writer.close(properties={"summary": {"files_count": 1}})
+        log = json.loads(out.getvalue())
+        assert log["runs"][0]["properties"] == {"summary": {"files_count": 1}}
+
+    def test_validation_errors_have_regions(self):
+        out = io.StringIO()
+        with SarifWriter(out, base_dir=_FIXTURES_DIR) as writer:
+            writer.add_validation_result(
+                validate_tonel_smalltalk_from_file_impl(_INVALID)
+            )
+
+        result = _results(json.loads(out.getvalue()))[1]
+        location = result["locations"][0]["physicalLocation"]
+        assert result["level"] == "error"
+        assert result["message"]["text"] == (
+            "Syntax error in BrokenClass >> brokenMethod: +"
+        )
+        assert location["artifactLocation"] == {
+            "uri": "invalid_syntax.st",
+            "uriBaseId": "%SRCROOT%",
+        }
+        assert location["region"] == {
+            "startLine": 14,
+            "startColumn": 18,
+            "endLine": 14,
+            "endColumn": 19,
+        }
+
+    def test_lint_issues_have_rule_ids_and_logical_locations(self):
+        out = io.StringIO()
+        with SarifWriter(out, base_dir=_FIXTURES_DIR) as writer:
+            writer.add_lint_result(lint_tonel_smalltalk_from_file_impl(_INVALID))
+
+        results = _results(json.loads(out.getvalue()))
+        assert [r["ruleId"] for r in results] == ["class-prefix", "direct-access"]
+        rule_ids = [rule_id for rule_id, _ in RULES]
+        assert all(rule_ids[r["ruleIndex"]] == r["ruleId"] for r in results)
+        access = results[1]["locations"][0]
+        assert access["physicalLocation"]["region"]["startLine"] == 14
+        assert access["logicalLocations"] == [
+            {"fullyQualifiedName": "BrokenClass >> brokenMethod", "kind": "function"}
+        ]
+
+    def test_columns_count_code_points(self, tmp_path):
+        path = tmp_path / "Caf\u00e9.st"
+        path.write_text(
+            "Class { #name : #Caf\u00e9, #instVars : [ 'x' ] }\n\n"
+            "Caf\u00e9 >> m [\n    ^ '\u00e9\u00e9' , x\n]\n",
+            encoding="utf-8",
+        )
+        out = io.StringIO()
+        with SarifWriter(out, base_dir=str(tmp_path)) as writer:
+            writer.add_lint_result(lint_tonel_smalltalk_from_file_impl(str(path)))
+
+        (access,) = [
+            r
+            for r in _results(json.loads(out.getvalue()))
+            if r["ruleId"] == "direct-access"
+        ]
+        region = access["locations"][0]["physicalLocation"]["region"]
+        assert (region["startLine"], region["startColumn"]) == (4, 14)
+        assert region["endColumn"] == 15
+
+    def test_unreadable_file_is_a_read_error(self, tmp_path):
+        missing = str(tmp_path / "Missing.st")
+        out = io.StringIO()
+        with SarifWriter(out, base_dir=str(tmp_path / "elsewhere")) as writer:
+            writer.add_lint_result(lint_tonel_smalltalk_from_file_impl(missing))
+
+        (result,) = _results(json.loads(out.getvalue()))
+        assert result["ruleId"] == "read-error"
+        assert "File not found" in result["message"]["text"]
+        artifact = result["locations"][0]["physicalLocation"]["artifactLocation"]
+        assert artifact == {"uri": (tmp_path / "Missing.st").as_uri()}
@@ -2,19 +2,50 @@
 Unit tests for the Smalltalk Validator MCP Server.
 """
 
+import asyncio
+import json
 import os
+import signal
+import socket
+import subprocess
+import sys
 import tempfile
+import threading
+import time
+import urllib.request
 from unittest.mock import Mock, patch
 
+import pytest
+from fastmcp import Client
+from starlette.testclient import TestClient
+
+from smalltalk_validator_mcp_server import server as server_module
+from smalltalk_validator_mcp_server import workers as workers_module
+from smalltalk_validator_mcp_server.core import (
+    validate_smalltalk_method_bodies_impl as validate_smalltalk_method_bodies,
+)
 from smalltalk_validator_mcp_server.core import (
     validate_smalltalk_method_body_impl as validate_smalltalk_method_body,
 )
+from smalltalk_validator_mcp_server.core import (
+    validate_tonel_directory_impl as validate_tonel_directory,
+)
 from smalltalk_validator_mcp_server.core import (
     validate_tonel_smalltalk_from_file_impl as validate_tonel_smalltalk_from_file,
 )
 from smalltalk_validator_mcp_server.core import (
     validate_tonel_smalltalk_impl as validate_tonel_smalltalk,
 )
+from smalltalk_validator_mcp_server.executor import ToolExecutor
+from smalltalk_validator_mcp_server.parser import (
+    DEFAULT_MAX_ERRORS,
+    DEFAULT_MAX_SNIPPET_BYTES,
+)
+from smalltalk_validator_mcp_server.server import app
+from smalltalk_validator_mcp_server.workers import (
+    process_pool,
+    shutdown_process_pool,
+)
 
 
 class TestValidateTonelSmalltalkFromFile:
@@ -46,7 +77,11 @@ class TestValidateTonelSmalltalkFromFile:
             assert result["file_path"] == temp_path
             assert result["parser_type"] == "full"
             assert "errors" not in result
-            mock_parser_class.assert_called_once_with(ignore_method_body_errors=False)
+            mock_parser_class.assert_called_once_with(
+                ignore_method_body_errors=False,
+                max_errors=DEFAULT_MAX_ERRORS,
+                max_snippet_bytes=DEFAULT_MAX_SNIPPET_BYTES,
+            )
             mock_parser.parse_from_file.assert_called_once_with(temp_path)
         finally:
             os.unlink(temp_path)
@@ -69,7 +104,11 @@ class TestValidateTonelSmalltalkFromFile:
 
             assert result["valid"] is True
             assert result["parser_type"] == "tonel_only"
-            mock_parser_class.assert_called_once_with(ignore_method_body_errors=True)
+            mock_parser_class.assert_called_once_with(
+                ignore_method_body_errors=True,
+                max_errors=DEFAULT_MAX_ERRORS,
+                max_snippet_bytes=DEFAULT_MAX_SNIPPET_BYTES,
+            )
             mock_parser.parse_from_file.assert_called_once_with(temp_path)
         finally:
             os.unlink(temp_path)
@@ -161,7 +200,11 @@ class TestValidateTonelSmalltalk:
 
         assert result["valid"] is True
         assert result["parser_type"] == "tonel_only"
-        mock_parser_class.assert_called_once_with(ignore_method_body_errors=True)
+        mock_parser_class.assert_called_once_with(
+            ignore_method_body_errors=True,
+            max_errors=DEFAULT_MAX_ERRORS,
+            max_snippet_bytes=DEFAULT_MAX_SNIPPET_BYTES,
+        )
         mock_parser.parse.assert_called_once_with(content)
 
     @patch("smalltalk_validator_mcp_server.core.TonelTreeSitterParser")
@@ -188,6 +231,32 @@ class TestValidateTonelSmalltalk:
         assert result["errors"] == error_list
         assert result["content_length"] == len(content)
 
+    def test_error_limit_options(self):
+        """Test that the error limit options bound the reported errors."""
+        content = "Class { #name : #Foo }\n\n" + "".join(
+            f"Foo >> m{i} [\n  ^ 1 + + {i}\n]\n\n" for i in range(5)
+        )
+
+        result = validate_tonel_smalltalk(
+            content, options={"max-errors": 2, "max-snippet-bytes": 1}
+        )
+
+        assert result["valid"] is False
+        assert result["truncated"] is True
+        assert len(result["errors"]) == 2
+        assert all(len(e["text"]) <= 1 for e in result["errors"])
+
+    @pytest.mark.parametrize("max_errors", [0, -1, "2", 1.5, True])
+    def test_invalid_max_errors_is_rejected(self, max_errors):
+        """Test that max-errors must be a positive integer."""
+        result = validate_tonel_smalltalk(
+            "Class { #name : #Foo }\n", options={"max-errors": max_errors}
+        )
+
+        assert result["valid"] is False
+        assert "max-errors must be an integer of at least 1" in result["error"]
+        assert result["exception"] == "ValueError"
+
     @patch("smalltalk_validator_mcp_server.core.TonelTreeSitterParser")
     def test_content_validation_exception(self, mock_parser_class):
         """Test handling of content validation exceptions."""
@@ -261,3 +330,472 @@ class TestValidateSmalltalkMethodBody:
         assert "Method validation failed: Method syntax error" in result["error"]
         assert result["exception"] == "SyntaxError"
         assert result["content_length"] == len(method_body)
+
+
+class TestValidateSmalltalkMethodBodies:
+    """Tests for validate_smalltalk_method_bodies function."""
+
+    def test_results_match_single_body_validation(self):
+        bodies = [
+            "^ self name",
+            "^ 1 + + 2",
+            "foo\n  ^ bar baz: ]",
+            "",
+            "| a |\na := 1",
+        ]
+
+        result = validate_smalltalk_method_bodies(bodies)
+
+        assert result["valid"] is False
+        assert result["count"] == 5
+        assert result["invalid_count"] == 2
+        assert [r["index"] for r in result["results"]] == [0, 1, 2, 3, 4]
+        for body, body_result in zip(bodies, result["results"], strict=True):
+            expected = validate_smalltalk_method_body(body)
+            assert {k: v for k, v in body_result.items() if k != "index"} == expected
+
+    def test_errors_use_body_local_positions(self):
+        bodies = ["^ 1", "| a |\na := 1.\n^ a + + 2"]
+
+        result = validate_smalltalk_method_bodies(bodies)
+
+        errors = result["results"][1]["errors"]
+        assert errors
+        assert all(error["start_point"][0] == 2 for error in errors)
+
+    def test_all_valid(self):
+        result = validate_smalltalk_method_bodies(["^ 1", "^ self foo: 2"])
+
+        assert result["valid"] is True
+        assert result["invalid_count"] == 0
+        assert all("errors" not in r for r in result["results"])
+
+    def test_cached_bodies_are_not_parsed_again(self):
+        validate_smalltalk_method_body("^ 1")
+
+        with patch(
+            "smalltalk_validator_mcp_server.core.SmalltalkMethodParser"
+        ) as mock_parser_class:
+            mock_parser = mock_parser_class.return_value
+            mock_parser.parse_many.return_value = [{"valid": True, "errors": []}]
+            result = validate_smalltalk_method_bodies(["^ 1", "^ 2"])
+
+        assert result["valid"] is True
+        mock_parser.parse_many.assert_called_once_with(["^ 2"])
+
+
+_FIXTURES_DIR = os.path.join(os.path.dirname(__file__), "fixtures")
+
+
+class TestValidateTonelDirectory:
+    """Tests for validate_tonel_directory function."""
+
+    def test_validates_all_files_in_directory(self):
+        result = validate_tonel_directory(_FIXTURES_DIR, max_workers=1)
+
+        assert result["valid"] is False
+        assert result["files_count"] == 3
+        assert result["invalid_files_count"] == 1
+        paths = [r["file_path"] for r in result["results"]]
+        assert paths == sorted(paths)
+        invalid = [r for r in result["results"] if not r["valid"]]
+        assert invalid[0]["file_path"].endswith("invalid_syntax.st")
+        assert all(r["elapsed_ms"] >= 0 for r in result["results"])
+
+    def test_glob_pattern(self):
+        result = validate_tonel_directory(
+            os.path.join(_FIXTURES_DIR, "valid_*.st"), max_workers=1
+        )
+
+        assert result["valid"] is True
+        assert result["files_count"] == 1
+
+    def test_options_apply_to_every_file(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            with open(os.path.join(tmp, "A.st"), "w") as f:
+                f.write("Class { #name : #A }\n\nA >> x [\n  ^ 1 + + 2\n]\n")
+
+            full = validate_tonel_directory(tmp, max_workers=1)
+            tonel_only = validate_tonel_directory(
+                tmp, options={"without-method-body": True}, max_workers=1
+            )
+
+        assert full["valid"] is False
+        assert tonel_only["valid"] is True
+        assert tonel_only["results"][0]["parser_type"] == "tonel_only"
+
+    def test_no_matching_files(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            result = validate_tonel_directory(tmp, max_workers=1)
+
+        assert result["valid"] is True
+        assert result["files_count"] == 0
+        assert result["results"] == []
+
+    def test_process_pool_matches_inline(self):
+        inline = validate_tonel_directory(_FIXTURES_DIR, max_workers=1)
+        with patch.object(workers_module, "default_workers", return_value=2):
+            parallel = validate_tonel_directory(_FIXTURES_DIR, max_workers=2)
+
+        def strip_timing(result):
+            return [
+                {k: v for k, v in r.items() if k != "elapsed_ms"}
+                for r in result["results"]
+            ]
+
+        assert strip_timing(parallel) == strip_timing(inline)
+
+    def test_oversized_or_repeated_max_workers_share_one_pool(self):
+        with (
+            patch.object(workers_module, "ProcessPoolExecutor") as executor_cls,
+            patch.object(workers_module, "_pool", None),
+            patch.object(workers_module, "default_workers", return_value=2),
+        ):
+            executor_cls.side_effect = lambda **kwargs: Mock()
+            pools = {id(process_pool()) for _ in range(3)}
+
+            assert workers_module.clamp_workers(10**6) == 2
+            assert workers_module.clamp_workers(-5) == 1
+            assert len(pools) == 1
+            executor_cls.assert_called_once()
+            assert executor_cls.call_args.kwargs["max_workers"] == 2
+
+
+def _call_tool_collecting(name: str, arguments: dict) -> tuple:
+    """Call an MCP tool in memory, collecting progress and log notifications."""
+    progress_events: list = []
+    log_messages: list = []
+
+    async def on_progress(progress, total, message):
+        progress_events.append((progress, total, message))
+
+    async def on_log(message):
+        log_messages.append(message)
+
+    async def run():
+        async with Client(
+            app, progress_handler=on_progress, log_handler=on_log
+        ) as client:
+            return await client.call_tool(name, arguments)
+
+    result = asyncio.run(run())
+    return result.structured_content, progress_events, log_messages
+
+
+class TestProgressNotifications:
+    """Tests for progress and partial results sent through the MCP Context."""
+
+    _CONTENT = "Class { #name : #MyClass }\n\n" + "".join(
+        f"MyClass >> m{i} [\n  ^ x isNil ifTrue: [ {i} ]\n]\n\n" for i in range(5)
+    )
+
+    @patch("smalltalk_validator_mcp_server.server._PROGRESS_INTERVAL", 0)
+    def test_lint_reports_progress_per_method(self):
+        result, progress_events, _ = _call_tool_collecting(
+            "lint_tonel_smalltalk", {"file_content": self._CONTENT}
+        )
+
+        assert result["success"] is True
+        assert [p for p, _, _ in progress_events] == [0, 1, 2, 3, 4, 5]
+        assert all(total == 5 for _, total, _ in progress_events)
+
+    @patch("smalltalk_validator_mcp_server.server._PROGRESS_INTERVAL", 0)
+    def test_lint_streams_partial_issues(self):
+        result, _, log_messages = _call_tool_collecting(
+            "lint_tonel_smalltalk", {"file_content": self._CONTENT}
+        )
+
+        streamed = [
+            issue
+            for message in log_messages
+            for issue in message.data["extra"]["partial_results"]
+        ]
+        assert streamed == result["issue_list"]
+
+    def test_progress_is_throttled_but_final_update_sent(self):
+        _, progress_events, log_messages = _call_tool_collecting(
+            "lint_tonel_smalltalk", {"file_content": self._CONTENT}
+        )
+
+        assert progress_events[-1][0] == 5
+        assert len(progress_events) < 6
+        assert sum(len(m.data["extra"]["partial_results"]) for m in log_messages) == 6
+
+    @patch("smalltalk_validator_mcp_server.server._PROGRESS_INTERVAL", 0)
+    def test_directory_reports_progress_per_file(self):
+        result, progress_events, log_messages = _call_tool_collecting(
+            "validate_tonel_directory", {"target": _FIXTURES_DIR, "max_workers": 1}
+        )
+
+        assert result["files_count"] == 3
+        assert [p for p, _, _ in progress_events] == [1, 2, 3]
+        streamed = [
+            r["file_path"]
+            for message in log_messages
+            for r in message.data["extra"]["partial_results"]
+        ]
+        assert sorted(streamed) == [r["file_path"] for r in result["results"]]
+
+
+def _call_tools(*calls: tuple[str, dict]) -> list:
+    """Call several MCP tools concurrently in one in-memory client session."""
+
+    async def run():
+        async with Client(app) as client:
+            return await asyncio.gather(
+                *(client.call_tool(name, arguments) for name, arguments in calls)
+            )
+
+    return [result.structured_content for result in asyncio.run(run())]
+
+
+class TestToolExecutors:
+    """Tests for offloading tool work to the bounded executors."""
+
+    _LINT_CONTENT = "Class { #name : #MyClass }\n\nMyClass >> m [\n  ^ 1\n]\n"
+
+    def test_saturated_executor_returns_busy_response(self):
+        busy = ToolExecutor(max_queue=0, name="heavy")
+        with patch.object(server_module, "_HEAVY_EXECUTOR", busy):
+            [result] = _call_tools(
+                ("lint_tonel_smalltalk_from_file", {"file_path": "/no/such/file.st"})
+            )
+
+        assert result["success"] is False
+        assert result["busy"] is True
+        assert "retry later" in result["error"]
+        assert result["exception"] == "ExecutorBusyError"
+
+    def test_busy_validate_call_uses_the_validate_shape(self):
+        busy = ToolExecutor(max_queue=0, name="fast")
+        with patch.object(server_module, "_FAST_EXECUTOR", busy):
+            [result] = _call_tools(
+                ("validate_smalltalk_method_body", {"method_body_content": "^ 1"})
+            )
+
+        assert result["valid"] is False
+        assert "success" not in result
+        assert result["busy"] is True
+        assert result["exception"] == "ExecutorBusyError"
+
+    def test_timed_out_request_returns_timeout_response(self):
+        slow = ToolExecutor(timeout=0.01, name="fast")
+        release = threading.Event()
+
+        def blocked(content, progress=None):
+            release.wait(5)
+            return {"success": True}
+
+        try:
+            with (
+                patch.object(server_module, "_FAST_EXECUTOR", slow),
+                patch.object(server_module, "lint_tonel_smalltalk_impl", blocked),
+            ):
+                [result] = _call_tools(
+                    ("lint_tonel_smalltalk", {"file_content": self._LINT_CONTENT})
+                )
+        finally:
+            release.set()
+            slow.shutdown()
+
+        assert result["success"] is False
+        assert result["timed_out"] is True
+        assert result["exception"] == "TimeoutError"
+
+    def test_large_content_uses_heavy_lane(self):
+        large = (
+            self._LINT_CONTENT + '"' + "x" * server_module._FAST_LANE_MAX_BYTES + '"'
+        )
+        heavy = ToolExecutor(max_queue=0, name="heavy")
+        with patch.object(server_module, "_HEAVY_EXECUTOR", heavy):
+            small_result, large_result = _call_tools(
+                ("lint_tonel_smalltalk", {"file_content": self._LINT_CONTENT}),
+                ("lint_tonel_smalltalk", {"file_content": large}),
+            )
+
+        assert small_result["success"] is True
+        assert large_result["busy"] is True
+
+    def test_method_body_validation_not_blocked_by_heavy_lint(self):
+        heavy = ToolExecutor(max_workers=1, name="heavy")
+        started = threading.Event()
+        release = threading.Event()
+
+        def blocked(file_path, progress=None):
+            started.set()
+            release.wait(5)
+            return {"success": True, "file_path": file_path}
+
+        async def run():
+            async with Client(app) as client:
+                lint = asyncio.ensure_future(
+                    client.call_tool(
+                        "lint_tonel_smalltalk_from_file", {"file_path": "big.st"}
+                    )
+                )
+                await asyncio.to_thread(started.wait, 5)
+                body = await client.call_tool(
+                    "validate_smalltalk_method_body",
+                    {"method_body_content": "^ 1 + 2"},
+                )
+                still_running = not lint.done()
+                release.set()
+                return body.structured_content, still_running, await lint
+
+        try:
+            with (
+                patch.object(server_module, "_HEAVY_EXECUTOR", heavy),
+                patch.object(
+                    server_module, "lint_tonel_smalltalk_from_file_impl", blocked
+                ),
+            ):
+                body, still_running, lint = asyncio.run(run())
+        finally:
+            release.set()
+            heavy.shutdown()
+
+        assert body["valid"] is True
+        assert still_running
+        assert lint.structured_content["success"] is True
+
+    def test_process_executor_runs_directory_tools_and_shuts_down(self):
+        heavy = ToolExecutor("process", max_workers=1, name="heavy")
+        file_path = os.path.join(_FIXTURES_DIR, "valid_class.st")
+        try:
+            with patch.object(server_module, "_HEAVY_EXECUTOR", heavy):
+                directory, lint = _call_tools(
+                    (
+                        "validate_tonel_directory",
+                        {"target": _FIXTURES_DIR, "max_workers": 2},
+                    ),
+                    ("lint_tonel_smalltalk_from_file", {"file_path": file_path}),
+                )
+        finally:
+            stopped = threading.Thread(
+                target=lambda: (heavy.shutdown(), shutdown_process_pool())
+            )
+            stopped.start()
+            stopped.join(30)
+
+        assert directory["files_count"] == 3
+        assert lint["success"] is True
+        assert not stopped.is_alive()
+
+
+class TestMain:
+    """Tests for the command line entry point and HTTP serving."""
+
+    def test_stdio_is_default(self):
+        with patch.object(app, "run") as run:
+            server_module.main([])
+
+        run.assert_called_once_with()
+
+    def test_http_runs_uvicorn_factory(self, monkeypatch):
+        for name in (
+            "SMALLTALK_VALIDATOR_HTTP_TRANSPORT",
+            "SMALLTALK_VALIDATOR_HTTP_PATH",
+            "SMALLTALK_VALIDATOR_HTTP_STATELESS",
+            "SMALLTALK_VALIDATOR_HTTP_WORKERS",
+        ):
+            # Set so that monkeypatch removes what main() writes.
+            monkeypatch.setenv(name, "")
+
+        with patch("uvicorn.run") as run:
+            server_module.main(
+                ["--transport", "http", "--host", "0.0.0.0", "--port", "9000"]
+                + ["--workers", "3"]
+            )
+
+        run.assert_called_once_with(
+            "smalltalk_validator_mcp_server.server:http_app",
+            factory=True,
+            host="0.0.0.0",
+            port=9000,
+            workers=3,
+            timeout_graceful_shutdown=30.0,
+            log_level="info",
+        )
+        assert os.environ["SMALLTALK_VALIDATOR_HTTP_TRANSPORT"] == "http"
+        assert os.environ["SMALLTALK_VALIDATOR_HTTP_PATH"] == "/mcp"
+        assert os.environ["SMALLTALK_VALIDATOR_HTTP_STATELESS"] == "1"
+        assert os.environ["SMALLTALK_VALIDATOR_HTTP_WORKERS"] == "3"
+
+    def test_several_workers_leave_out_per_process_tools(self, monkeypatch):
+        async def list_names():
+            async with Client(app) as client:
+                tools = await client.list_tools()
+                templates = await client.list_resource_templates()
+                return {t.name for t in tools}, [t.name for t in templates]
+
+        monkeypatch.setenv("SMALLTALK_VALIDATOR_HTTP_WORKERS", "2")
+        try:
+            server_module.http_app()
+            tools, templates = asyncio.run(list_names())
+        finally:
+            app.enable(tags={server_module._PER_PROCESS_TAG})
+
+        assert "lint_tonel_smalltalk_from_file" in tools
+        assert not tools & {
+            "index_tonel_project",
+            "open_tonel_session",
+            "close_tonel_session",
+            "watch_tonel_directory",
+            "unwatch_tonel_directory",
+        }
+        assert templates == []
+        assert "open_tonel_session" in asyncio.run(list_names())[0]
+
+    def test_rejects_invalid_worker_settings(self):
+        with pytest.raises(SystemExit):
+            server_module._parse_args(["--transport", "http", "--workers", "0"])
+        with pytest.raises(SystemExit):
+            server_module._parse_args(["--transport", "sse", "--workers", "2"])
+
+    def test_health_endpoint(self):
+        with TestClient(server_module.http_app()) as client:
+            response = client.get("/health")
+
+        assert response.status_code == 200
+        body = response.json()
+        assert body["status"] == "ok"
+        assert body["pid"] == os.getpid()
+        assert set(body["executors"]) == {"fast", "heavy", "directory"}
+
+    def test_serves_http_with_workers_and_shuts_down_gracefully(self):
+        with socket.socket() as sock:
+            sock.bind(("127.0.0.1", 0))
+            port = sock.getsockname()[1]
+        process = subprocess.Popen(
+            [sys.executable, "-m", "smalltalk_validator_mcp_server"]
+            + ["--transport", "http", "--port", str(port), "--workers", "2"]
+            + ["--log-level", "warning"],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        try:
+            health_url = f"http://127.0.0.1:{port}/health"
+            deadline = time.monotonic() + 30
+            while True:
+                try:
+                    with urllib.request.urlopen(health_url) as response:
+                        assert json.load(response)["status"] == "ok"
+                    break
+                except OSError:
+                    assert time.monotonic() < deadline, "server did not start"
+                    time.sleep(0.1)
+
+            async def call():
+                async with Client(f"http://127.0.0.1:{port}/mcp") as client:
+                    return await client.call_tool(
+                        "validate_smalltalk_method_body",
+                        {"method_body_content": "^ 1 + 2"},
+                    )
+
+            result = asyncio.run(call())
+            assert result.structured_content["valid"] is True
+        finally:
+            process.send_signal(signal.SIGTERM)
+            returncode = process.wait(timeout=30)
+
+        assert returncode == 0
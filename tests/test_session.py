@@ -0,0 +1,208 @@
+"""
+Unit tests for incremental document sessions.
+"""
+
+import random
+from unittest.mock import patch
+
+import pytest
+
+from smalltalk_validator_mcp_server.core import (
+    close_tonel_session_impl,
+    edit_tonel_session_impl,
+    lint_tonel_session_impl,
+    lint_tonel_smalltalk_impl,
+    open_tonel_session_impl,
+    validate_tonel_session_impl,
+    validate_tonel_smalltalk_impl,
+)
+from smalltalk_validator_mcp_server.parser import _PARSER_POOL
+from smalltalk_validator_mcp_server.session import (
+    DocumentSession,
+    DocumentSessionStore,
+)
+
+_CONTENT = (
+    "Class {\n"
+    "    #name : #MySession,\n"
+    "    #superclass : #Object,\n"
+    "    #category : #'Session-Tests'\n"
+    "}\n"
+    "\n"
+    "{ #category : #accessing }\n"
+    "MySession >> value [\n"
+    "    ^ 42\n"
+    "]\n"
+)
+
+
+def _sexp(tree) -> str:
+    return str(tree.root_node)
+
+
+class TestDocumentSession:
+    """Tests for DocumentSession edits."""
+
+    def test_edit_replaces_range(self):
+        session = DocumentSession("s", _CONTENT)
+        session.apply_edits([{"start": [8, 6], "end": [8, 8], "text": "'héllo'"}])
+
+        assert "    ^ 'héllo'\n" in session.content
+        assert session.tree.root_node.has_error is False
+
+    def test_multiline_insert_after_multibyte_text(self):
+        session = DocumentSession("s", _CONTENT.replace("^ 42", "^ 'é' , 'ü'"))
+        session.apply_edits(
+            [{"start": [8, 15], "end": [8, 15], "text": " ,\n        'x'"}]
+        )
+
+        assert "^ 'é' , 'ü' ,\n        'x'\n" in session.content
+        assert _sexp(session.tree) == _sexp(
+            _PARSER_POOL.parse(session.content.encode("utf-8"))
+        )
+
+    def test_edits_apply_in_sequence(self):
+        session = DocumentSession("s", _CONTENT)
+        session.apply_edits(
+            [
+                {"start": [8, 6], "end": [8, 8], "text": "1 + + 2"},
+                {"start": [8, 10], "end": [8, 12], "text": ""},
+            ]
+        )
+
+        assert "    ^ 1 + 2\n" in session.content
+
+    def test_incremental_tree_matches_full_parse(self):
+        rng = random.Random(3)
+        session = DocumentSession("s", _CONTENT)
+        for _ in range(50):
+            lines = session.content.split("\n")
+            row = rng.randrange(len(lines))
+            start = rng.randint(0, len(lines[row]))
+            end = rng.randint(start, len(lines[row]))
+            text = rng.choice(["", "x", " [ ", "]", "^ 1.\n", "'é'", "\n"])
+            session.apply_edits(
+                [{"start": [row, start], "end": [row, end], "text": text}]
+            )
+
+            full = _PARSER_POOL.parse(session.content.encode("utf-8"))
+            assert _sexp(session.tree) == _sexp(full)
+
+    def test_reports_changed_ranges(self):
+        session = DocumentSession("s", _CONTENT)
+        changed = session.apply_edits(
+            [{"start": [8, 6], "end": [8, 8], "text": "self foo"}]
+        )
+
+        assert changed
+        assert all(start[0] <= 8 <= end[0] for start, end in changed)
+
+    def test_invalid_edit_leaves_session_unchanged(self):
+        session = DocumentSession("s", _CONTENT)
+        tree = session.tree
+
+        with pytest.raises(ValueError):
+            session.apply_edits(
+                [
+                    {"start": [8, 6], "end": [8, 8], "text": "1"},
+                    {"start": [99, 0], "end": [99, 0], "text": "x"},
+                ]
+            )
+
+        assert session.content == _CONTENT
+        assert session.tree is tree
+
+
+class TestDocumentSessionStore:
+    """Tests for DocumentSessionStore limits."""
+
+    def test_idle_sessions_expire(self):
+        store = DocumentSessionStore(idle_seconds=0, max_bytes=10**9)
+        session = store.open(_CONTENT)
+        store.open(_CONTENT)
+
+        with pytest.raises(KeyError):
+            store.get(session.session_id)
+
+    def test_memory_cap_evicts_least_recently_used(self):
+        per_session = DocumentSession("probe", _CONTENT).estimated_bytes
+        store = DocumentSessionStore(idle_seconds=3600, max_bytes=per_session * 2)
+        first = store.open(_CONTENT)
+        second = store.open(_CONTENT)
+        store.get(first.session_id)
+        store.open(_CONTENT)
+
+        assert len(store) == 2
+        store.get(first.session_id)
+        with pytest.raises(KeyError):
+            store.get(second.session_id)
+
+    def test_rejects_document_over_cap_before_parsing(self):
+        store = DocumentSessionStore(idle_seconds=3600, max_bytes=10)
+
+        with patch.object(_PARSER_POOL, "parse") as parse:
+            with pytest.raises(ValueError, match="too large"):
+                store.open(_CONTENT)
+
+        parse.assert_not_called()
+        assert len(store) == 0
+
+    def test_rejects_edits_that_grow_past_cap(self):
+        per_session = DocumentSession("probe", _CONTENT).estimated_bytes
+        store = DocumentSessionStore(idle_seconds=3600, max_bytes=per_session + 100)
+        session = store.open(_CONTENT)
+        tree = session.tree
+
+        with pytest.raises(ValueError, match="too large"):
+            session.apply_edits([{"start": [0, 0], "end": [0, 0], "text": "x" * 100}])
+
+        assert session.content == _CONTENT
+        assert session.tree is tree
+        session.apply_edits([{"start": [0, 0], "end": [0, 0], "text": "\n"}])
+        assert session.content == "\n" + _CONTENT
+
+
+class TestSessionTools:
+    """Tests for the session tool implementations."""
+
+    def test_round_trip_matches_stateless_tools(self):
+        opened = open_tonel_session_impl(_CONTENT)
+        session_id = opened["session_id"]
+        edited = edit_tonel_session_impl(
+            session_id, [{"start": [8, 6], "end": [8, 8], "text": "1 + + 2"}]
+        )
+        new_content = _CONTENT.replace("^ 42", "^ 1 + + 2")
+
+        validation = validate_tonel_session_impl(session_id)
+        lint = lint_tonel_session_impl(session_id)
+
+        assert opened["success"] is True
+        assert edited["success"] is True
+        assert edited["content_length"] == len(new_content)
+        assert validation["valid"] is False
+        assert (
+            validation["errors"] == validate_tonel_smalltalk_impl(new_content)["errors"]
+        )
+        expected_lint = lint_tonel_smalltalk_impl(new_content)
+        assert lint["issue_list"] == expected_lint["issue_list"]
+        assert close_tonel_session_impl(session_id)["success"] is True
+
+    def test_unknown_session(self):
+        assert validate_tonel_session_impl("missing")["valid"] is False
+        assert lint_tonel_session_impl("missing")["success"] is False
+        assert (
+            "Unknown or expired session"
+            in (edit_tonel_session_impl("missing", [])["error"])
+        )
+        assert close_tonel_session_impl("missing")["success"] is False
+
+    def test_bad_edit_reports_error(self):
+        session_id = open_tonel_session_impl(_CONTENT)["session_id"]
+
+        result = edit_tonel_session_impl(
+            session_id, [{"start": [0, 500], "end": [0, 500], "text": "x"}]
+        )
+
+        assert result["success"] is False
+        assert result["exception"] == "ValueError"
+        close_tonel_session_impl(session_id)
@@ -0,0 +1,142 @@
+"""
+Unit tests for bytes-native file ingestion.
+"""
+
+import codecs
+from unittest.mock import patch
+
+import pytest
+
+from smalltalk_validator_mcp_server.linter import TonelCSTLinter
+from smalltalk_validator_mcp_server.parser import TonelTreeSitterParser
+from smalltalk_validator_mcp_server.source import open_source
+
+_VALID = "Class { #name : #Café }\n\nCafé >> prix [\n  ^ 'crème'\n]\n"
+_INVALID = "Class { #name : #Bad }\n\nBad >> foo [\n  ^ 1 + + 2\n]\n"
+
+
+@pytest.fixture(params=[False, True], ids=["read", "mmap"])
+def use_mmap(request):
+    threshold = 1 if request.param else 1 << 30
+    with patch("smalltalk_validator_mcp_server.source._MMAP_THRESHOLD", threshold):
+        yield request.param
+
+
+class TestOpenSource:
+    """Tests for open_source."""
+
+    def test_plain_utf8(self, tmp_path, use_mmap):
+        path = tmp_path / "plain.st"
+        path.write_bytes(_VALID.encode("utf-8"))
+
+        with open_source(path) as source:
+            assert bytes(source.data) == _VALID.encode("utf-8")
+            assert source.encoding_error is None
+            assert isinstance(source.data, memoryview) is use_mmap
+
+    def test_utf8_bom_is_skipped(self, tmp_path, use_mmap):
+        path = tmp_path / "bom.st"
+        path.write_bytes(codecs.BOM_UTF8 + _VALID.encode("utf-8"))
+
+        with open_source(path) as source:
+            assert bytes(source.data) == _VALID.encode("utf-8")
+
+    @pytest.mark.parametrize("codec", ["utf-16", "utf-32"])
+    def test_utf16_and_utf32_are_transcoded(self, tmp_path, use_mmap, codec):
+        path = tmp_path / "wide.st"
+        path.write_bytes(_VALID.encode(codec))
+
+        with open_source(path) as source:
+            assert bytes(source.data) == _VALID.encode("utf-8")
+
+    def test_invalid_utf8_is_located(self, tmp_path, use_mmap):
+        path = tmp_path / "latin1.st"
+        path.write_bytes(_VALID.encode("latin-1"))
+
+        with open_source(path) as source:
+            error = source.encoding_error
+
+        assert error["offset"] == _VALID.encode("latin-1").index(b"\xe9")
+        assert error["point"] == [0, 20]
+        assert "0xe9" in error["message"]
+
+    def test_invalid_utf8_after_bom_reports_file_offset(self, tmp_path, use_mmap):
+        path = tmp_path / "bom-latin1.st"
+        path.write_bytes(codecs.BOM_UTF8 + _VALID.encode("latin-1"))
+
+        with open_source(path) as source:
+            error = source.encoding_error
+
+        assert error["offset"] == 3 + _VALID.encode("latin-1").index(b"\xe9")
+        assert error["point"] == [0, 20]
+
+    @pytest.mark.parametrize(
+        "codec, bad", [("utf-16-le", b"\x00\xdc"), ("utf-32-le", b"\x00\x00\x11\x00")]
+    )
+    def test_malformed_utf16_and_utf32_are_located(
+        self, tmp_path, use_mmap, codec, bad
+    ):
+        bom = codecs.BOM_UTF16_LE if codec == "utf-16-le" else codecs.BOM_UTF32_LE
+        prefix = bom + "Class { #name : #A }\n  ^ ".encode(codec)
+        path = tmp_path / "malformed.st"
+        path.write_bytes(prefix + bad + "x\n".encode(codec))
+
+        with open_source(path) as source:
+            data = bytes(source.data)
+            error = source.encoding_error
+
+        assert data == b"Class { #name : #A }\n  ^ "
+        assert error["offset"] == len(prefix)
+        assert error["point"] == [1, 4]
+        assert f"at byte offset {len(prefix)}" in error["message"]
+
+    def test_sequence_split_across_chunks_is_valid(self, tmp_path):
+        path = tmp_path / "split.st"
+        path.write_bytes(b"a" * 7 + "é".encode())
+
+        with patch("smalltalk_validator_mcp_server.source._CHECK_CHUNK", 8):
+            with open_source(path) as source:
+                assert source.encoding_error is None
+
+
+class TestFileTools:
+    """Tests for the from_file paths of the parser and linter."""
+
+    @pytest.mark.parametrize("content", [_VALID, _INVALID])
+    def test_parse_from_file_matches_parse(self, tmp_path, use_mmap, content):
+        path = tmp_path / "file.st"
+        path.write_bytes(content.encode("utf-8"))
+        parser = TonelTreeSitterParser()
+
+        assert parser.parse_from_file(str(path)) == parser.parse(content)
+
+    def test_parse_from_file_reports_invalid_utf8(self, tmp_path, use_mmap):
+        path = tmp_path / "latin1.st"
+        path.write_bytes(_VALID.encode("latin-1"))
+
+        result = TonelTreeSitterParser().parse_from_file(str(path))
+
+        assert result["valid"] is False
+        [error] = result["errors"]
+        assert error["type"] == "ENCODING"
+        assert error["start_point"] == [0, 20]
+
+    def test_lint_from_file_matches_lint(self, tmp_path, use_mmap):
+        path = tmp_path / "file.st"
+        path.write_bytes(codecs.BOM_UTF8 + _VALID.encode("utf-8"))
+
+        from_file = TonelCSTLinter().lint_from_file(path).issues
+        from_text = TonelCSTLinter().lint(_VALID).issues
+
+        assert from_file
+        assert [i.message for i in from_file] == [i.message for i in from_text]
+
+    def test_lint_from_file_reports_invalid_utf8(self, tmp_path, use_mmap):
+        path = tmp_path / "latin1.st"
+        path.write_bytes(_VALID.encode("latin-1"))
+        result = TonelCSTLinter().lint_from_file(path)
+
+        [issue] = result.issues
+        assert issue.severity == "error"
+        assert "Invalid UTF-8" in issue.message
+        assert result.errors == 1
@@ -0,0 +1,302 @@
+"""
+Unit tests for polling directory watches.
+"""
+
+import asyncio
+import io
+import json
+import os
+import shutil
+import time
+from unittest.mock import patch
+
+import pytest
+from fastmcp import Client
+
+from smalltalk_validator_mcp_server import cli
+from smalltalk_validator_mcp_server.core import (
+    start_tonel_watch_impl,
+    stop_tonel_watch_impl,
+    tonel_watch_diagnostics_impl,
+)
+from smalltalk_validator_mcp_server.server import app
+from smalltalk_validator_mcp_server.watch import DirectoryWatcher, WatchStore
+
+_FIXTURES_DIR = os.path.join(os.path.dirname(__file__), "fixtures")
+
+
+@pytest.fixture
+def project(tmp_path):
+    for name in ("valid_class.st", "invalid_syntax.st"):
+        shutil.copy(os.path.join(_FIXTURES_DIR, name), tmp_path / name)
+    return tmp_path
+
+
+def _touch(path) -> None:
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+
+def _watcher(root, debounce: float = 1.0) -> tuple[DirectoryWatcher, list[str]]:
+    checked: list[str] = []
+
+    def check(path: str) -> dict:
+        checked.append(os.path.basename(path))
+        return {"file_path": path}
+
+    return DirectoryWatcher(str(root), check, debounce=debounce), checked
+
+
+class TestDirectoryWatcher:
+    """Tests for DirectoryWatcher.poll."""
+
+    def test_first_poll_checks_every_file(self, project):
+        watcher, checked = _watcher(project)
+
+        watcher.poll(now=0.0)
+
+        assert sorted(checked) == ["invalid_syntax.st", "valid_class.st"]
+        assert watcher.generation == 1
+        assert len(watcher.results()) == 2
+
+    def test_unchanged_files_are_not_checked_again(self, project):
+        watcher, checked = _watcher(project)
+        watcher.poll(now=0.0)
+
+        assert watcher.poll(now=5.0) == ([], [])
+        assert len(checked) == 2
+        assert watcher.generation == 1
+
+    def test_burst_of_writes_is_checked_once_after_debounce(self, project):
+        watcher, checked = _watcher(project)
+        watcher.poll(now=0.0)
+        checked.clear()
+        path = project / "valid_class.st"
+
+        for now in (10.0, 10.4, 10.8):
+            _touch(path)
+            assert watcher.poll(now=now) == ([], [])
+        assert watcher.poll(now=11.5) == ([], [])
+        assert watcher.poll(now=11.8) == ([str(path)], [])
+
+        assert checked == ["valid_class.st"]
+        assert watcher.generation == 2
+
+    def test_new_and_removed_files(self, project):
+        watcher, checked = _watcher(project, debounce=0)
+        watcher.poll(now=0.0)
+        (project / "sub").mkdir()
+        added = project / "sub" / "New.st"
+        added.write_text("Class { #name : #New }")
+        removed = project / "invalid_syntax.st"
+        removed.unlink()
+
+        assert watcher.poll(now=1.0) == ([str(added)], [str(removed)])
+        assert sorted(watcher.results()) == [
+            str(added),
+            str(project / "valid_class.st"),
+        ]
+
+    def test_on_update_receives_results(self, project):
+        updates = []
+        watcher = DirectoryWatcher(
+            str(project),
+            lambda path: {"file_path": path},
+            on_update=lambda checked, removed: updates.append((checked, removed)),
+        )
+
+        watcher.poll(now=0.0)
+        watcher.poll(now=1.0)
+
+        assert len(updates) == 1
+        assert len(updates[0][0]) == 2
+
+    def test_failed_check_stays_pending_and_is_retried(self, project):
+        failing = str(project / "invalid_syntax.st")
+        attempts = []
+
+        def check(path: str) -> dict:
+            attempts.append(path)
+            if path == failing and len(attempts) < 3:
+                raise OSError("busy")
+            return {"file_path": path}
+
+        watcher = DirectoryWatcher(str(project), check)
+
+        with pytest.raises(OSError, match="busy"):
+            watcher.poll(now=0.0)
+        assert list(watcher.results()) == [str(project / "valid_class.st")]
+        assert watcher.snapshot()["pending_count"] == 1
+
+        assert watcher.poll(now=5.0) == ([failing], [])
+        assert watcher.snapshot()["pending_count"] == 0
+        assert len(watcher.results()) == 2
+
+    def test_rejects_missing_directory(self, tmp_path):
+        with pytest.raises(ValueError, match="Not a directory"):
+            DirectoryWatcher(str(tmp_path / "missing"), lambda path: {})
+
+
+class TestWatchStore:
+    """Tests for WatchStore."""
+
+    def test_cap_and_stop(self, project):
+        store = WatchStore(max_watches=1)
+        watcher, _ = _watcher(project)
+        store.start(watcher)
+        try:
+            with pytest.raises(ValueError, match="Too many"):
+                store.start(_watcher(project)[0])
+            assert store.get(watcher.watch_id) is watcher
+        finally:
+            assert store.stop(watcher.watch_id) is True
+        assert store.stop(watcher.watch_id) is False
+        assert len(store) == 0
+
+
+class TestWatchTools:
+    """Tests for the watch core functions and MCP tools."""
+
+    def _wait_for_generation(self, watch_id: str, generation: int) -> dict:
+        for _ in range(200):
+            diagnostics = tonel_watch_diagnostics_impl(watch_id)
+            if diagnostics["generation"] >= generation:
+                return diagnostics
+            time.sleep(0.05)
+        raise AssertionError("watch did not update")
+
+    def test_diagnostics_aggregate_validation_and_lint(self, project):
+        started = start_tonel_watch_impl(str(project), interval=0.05, debounce=0)
+        try:
+            diagnostics = self._wait_for_generation(started["watch_id"], 1)
+        finally:
+            stop_tonel_watch_impl(started["watch_id"])
+
+        assert diagnostics["files_count"] == 2
+        assert diagnostics["invalid_files_count"] == 1
+        invalid = diagnostics["results"][0]
+        assert invalid["file_path"] == str(project / "invalid_syntax.st")
+        assert invalid["validation"]["valid"] is False
+        assert invalid["lint"]["success"] is True
+
+    def test_unknown_watch(self):
+        assert tonel_watch_diagnostics_impl("nope")["success"] is False
+        assert stop_tonel_watch_impl("nope")["success"] is False
+
+    def test_invalid_directory(self, tmp_path):
+        result = start_tonel_watch_impl(str(tmp_path / "missing"))
+
+        assert result["success"] is False
+        assert "Not a directory" in result["error"]
+
+    def test_tool_publishes_diagnostics_resource(self, project):
+        async def run():
+            async with Client(app) as client:
+                started = await client.call_tool(
+                    "watch_tonel_directory",
+                    {"directory": str(project), "interval": 0.05, "debounce": 0},
+                )
+                uri = started.structured_content["resource_uri"]
+                try:
+                    for _ in range(200):
+                        (content,) = await client.read_resource(uri)
+                        diagnostics = json.loads(content.text)
+                        if diagnostics["generation"]:
+                            return started.structured_content, diagnostics
+                        await asyncio.sleep(0.05)
+                finally:
+                    await client.call_tool(
+                        "unwatch_tonel_directory",
+                        {"watch_id": started.structured_content["watch_id"]},
+                    )
+            raise AssertionError("watch did not update")
+
+        started, diagnostics = asyncio.run(run())
+
+        assert started["resource_uri"] == (
+            f"tonel-watch://{started['watch_id']}/diagnostics"
+        )
+        assert diagnostics["files_count"] == 2
+
+
+class TestWatchCommand:
+    """Tests for the CLI --watch option."""
+
+    def test_writes_initial_results_then_changes(self, project):
+        args = cli._parse_args(
+            [
+                "validate",
+                str(project),
+                "--watch",
+                "--interval",
+                "0.01",
+                "--debounce",
+                "0",
+            ]
+        )
+        out = io.StringIO()
+        path = project / "valid_class.st"
+        sleeps = 0
+
+        def sleep(_seconds):
+            nonlocal sleeps
+            sleeps += 1
+            if sleeps == 1:
+                _touch(path)
+            elif sleeps == 2:
+                (project / "invalid_syntax.st").unlink()
+            else:
+                raise KeyboardInterrupt
+
+        with patch.object(cli.time, "sleep", side_effect=sleep):
+            with pytest.raises(KeyboardInterrupt):
+                cli.run(args, out)
+
+        lines = [json.loads(line) for line in out.getvalue().splitlines()]
+        assert [line.get("file_path") for line in lines[:2]] == [
+            str(project / "invalid_syntax.st"),
+            str(path),
+        ]
+        assert lines[2]["summary"]["failed_files_count"] == 1
+        assert lines[3]["file_path"] == str(path)
+        assert lines[4]["summary"]["generation"] == 2
+        assert lines[5] == {"removed": str(project / "invalid_syntax.st")}
+        assert lines[6]["summary"] == {
+            "command": "validate",
+            "generation": 3,
+            "files_count": 1,
+            "failed_files_count": 0,
+        }
+
+    def test_failed_poll_is_reported_and_polling_goes_on(self, project):
+        args = cli._parse_args(
+            ["validate", str(project), "--watch", "--interval", "0.01"]
+        )
+        out = io.StringIO()
+        polls = 0
+
+        def poll(self, now=None):
+            nonlocal polls
+            polls += 1
+            if polls == 1:
+                raise OSError("gone")
+            raise KeyboardInterrupt
+
+        with (
+            patch.object(DirectoryWatcher, "poll", poll),
+            patch.object(cli.time, "sleep"),
+        ):
+            with pytest.raises(KeyboardInterrupt):
+                cli.run(args, out)
+
+        assert polls == 2
+        assert json.loads(out.getvalue()) == {
+            "error": "Watch poll failed: gone",
+            "exception": "OSError",
+        }
+
+    def test_watch_requires_single_directory(self, project):
+        with pytest.raises(SystemExit):
+            cli._parse_args(["lint", str(project / "valid_class.st"), "--watch"])
+        with pytest.raises(SystemExit):
+            cli._parse_args(["lint", str(project), "--watch", "--format", "sarif"])